@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 with open("README.md", "r", encoding="utf-8") as fh:
     long_description = fh.read()
@@ -15,7 +15,6 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/gongahkia/the-junior-associate",
-    packages=find_packages(),
     classifiers=[
         "Development Status :: 5 - Production/Stable",
         "Intended Audience :: Legal Industry",
@@ -36,11 +35,24 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=23.0.0",
             "flake8>=5.0.0",
             "mypy>=1.0.0",
             "pre-commit>=3.0.0",
         ],
+        "cache": [
+            "requests-cache>=1.0.0",
+        ],
+        "re2": [
+            "google-re2>=1.1",
+        ],
+        "orjson": [
+            "orjson>=3.9.0",
+        ],
+        "brotli": [
+            "brotli>=1.0.9",
+        ],
         "docs": [
             "sphinx>=5.0.0",
             "sphinx-rtd-theme>=1.2.0",
@@ -1,18 +1,90 @@
 """
 Pytest configuration and fixtures for The Junior Associate tests.
+
+The suite runs under pytest-xdist with ``--dist=loadfile``, so each test file
+stays on one worker. Session-scoped fixtures are therefore built once per
+worker rather than once per run, which is still far cheaper than per test.
 """
 
+import copy
+import functools
+import logging
+import sys
+
 import pytest
-from datetime import datetime
-from unittest.mock import Mock, MagicMock
-import requests
 
 from the_junior_associate.utils.data_models import CaseData
 
+# Skip .pyc writes for the test modules pytest imports after this conftest
+sys.dont_write_bytecode = True
+
+_MOCK_HTML = """
+    <html>
+        <head><title>Test Case v. Example Corp</title></head>
+        <body>
+            <h1>Test Case v. Example Corp</h1>
+            <div class="case-content">
+                <p>This is a test case from Test Supreme Court.</p>
+                <p>Date: January 15, 2023</p>
+                <p>Judge: Judge Smith</p>
+            </div>
+        </body>
+    </html>
+    """
+_SESSION_HTML = """
+    <html>
+        <head><title>Test Case</title></head>
+        <body><div>Test content</div></body>
+    </html>
+    """
+
+# Deterministic helpers memoized for the duration of the test session
+_CACHED_HELPERS = ("validate_date", "sanitize_text", "normalize_court_name")
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _quiet_logging():
+    """Short-circuit log emission for the whole session."""
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _purge_loggers():
+    """Drop loggers registered during the test session at teardown."""
+    existing = set(logging.Logger.manager.loggerDict)
+    yield
+    for name in set(logging.Logger.manager.loggerDict) - existing:
+        del logging.Logger.manager.loggerDict[name]
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _cache_pure_helpers():
+    """
+    Wrap pure helpers in ``functools.lru_cache`` for the test process only.
+
+    Modules bind these helpers by name at import time, so every loaded module
+    still holding the original function is patched, not just ``helpers``.
+    """
+    from the_junior_associate.utils import helpers
+
+    monkeypatch = pytest.MonkeyPatch()
+    for name in _CACHED_HELPERS:
+        original = getattr(helpers, name)
+        cached = functools.lru_cache(maxsize=256)(original)
+        for module in list(sys.modules.values()):
+            if getattr(module, "__dict__", {}).get(name) is original:
+                monkeypatch.setattr(module, name, cached)
+    yield
+    monkeypatch.undo()
+
+
+@pytest.fixture(scope="session")
+def _case_data_template():
+    """CaseData built once per session; copied by ``sample_case_data``."""
+    from datetime import datetime
 
-@pytest.fixture
-def sample_case_data():
-    """Sample CaseData for testing."""
     return CaseData(
         case_name="Test Case v. Example Corp",
         case_id="TEST-2023-001",
@@ -32,42 +104,84 @@ def sample_case_data():
 
 
 @pytest.fixture
-def mock_response():
-    """Mock HTTP response."""
+def sample_case_data(_case_data_template):
+    """Sample CaseData for testing."""
+    case = copy.copy(_case_data_template)
+    # Rebind mutable fields so tests can modify them without leaking state
+    case.judges = list(case.judges)
+    case.parties = list(case.parties)
+    case.citations = list(case.citations)
+    case.legal_issues = list(case.legal_issues)
+    case.metadata = dict(case.metadata)
+    return case
+
+
+# Mock prototypes are configured once per session and handed out as shallow
+# copies. Child attributes (``headers``, ``session.get``) are shared between
+# copies, so tests must reassign rather than mutate them in place; switch the
+# fixtures to ``copy.deepcopy`` if that ever becomes necessary. Heavy imports
+# live inside the prototype fixtures so they are only paid when used.
+@pytest.fixture(scope="session")
+def _response_prototype():
+    """Response prototype; requests is only imported when a test needs it."""
+    from unittest.mock import Mock
+
+    import requests
+
     response = Mock(spec=requests.Response)
     response.status_code = 200
-    response.text = """
-    <html>
-        <head><title>Test Case v. Example Corp</title></head>
-        <body>
-            <h1>Test Case v. Example Corp</h1>
-            <div class="case-content">
-                <p>This is a test case from Test Supreme Court.</p>
-                <p>Date: January 15, 2023</p>
-                <p>Judge: Judge Smith</p>
-            </div>
-        </body>
-    </html>
-    """
+    response.text = _MOCK_HTML
     response.headers = {"Content-Type": "text/html"}
     return response
 
 
 @pytest.fixture
-def mock_scraper_session():
-    """Mock scraper session."""
-    session = MagicMock()
+def mock_response(_response_prototype):
+    """Mock HTTP response."""
+    return copy.copy(_response_prototype)
+
+
+@pytest.fixture
+def html_response(_response_prototype):
+    """Factory for mock HTTP responses carrying the given HTML as UTF-8."""
+
+    def make(html: str):
+        response = copy.copy(_response_prototype)
+        response.content = html.encode("utf-8")
+        response.text = html
+        response.headers = {"Content-Type": "text/html; charset=utf-8"}
+        response.encoding = "utf-8"
+        return response
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def _session_prototype():
+    """Session prototype with a canned ``get`` response."""
+    from unittest.mock import Mock
+
+    session = Mock()
     session.get.return_value.status_code = 200
-    session.get.return_value.text = """
-    <html>
-        <head><title>Test Case</title></head>
-        <body><div>Test content</div></body>
-    </html>
-    """
+    session.get.return_value.text = _SESSION_HTML
     return session
 
 
 @pytest.fixture
+def mock_scraper_session(_session_prototype):
+    """Mock scraper session."""
+    return copy.copy(_session_prototype)
+
+
+@pytest.fixture(scope="session")
+def parsed_mock_html():
+    """``mock_response.text`` parsed once; do not mutate the returned soup."""
+    from bs4 import BeautifulSoup
+
+    return BeautifulSoup(_MOCK_HTML, "lxml")
+
+
+@pytest.fixture(scope="session")
 def sample_search_results():
     """Sample search results."""
     return [
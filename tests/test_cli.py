@@ -0,0 +1,296 @@
+"""
+Tests for the command-line interface.
+"""
+
+import csv
+import io
+import json
+import logging
+import threading
+import time
+
+import pytest
+
+from the_junior_associate import cli
+from the_junior_associate.utils.base import BaseScraper
+from the_junior_associate.utils.data_models import CaseData
+
+
+class _StubScraper(BaseScraper):
+    """Scraper returning canned cases named after its jurisdiction."""
+
+    base_url = "https://example.com"
+    jurisdiction = "Stub"
+
+    def search_cases(
+        self,
+        query=None,
+        start_date=None,
+        end_date=None,
+        court=None,
+        limit=100,
+        **kwargs,
+    ):
+        return [
+            CaseData(
+                case_name=f"{self.jurisdiction} case {number}",
+                case_id=f"{self.jurisdiction}-{number}",
+                url=f"{self.base_url}/{number}",
+                jurisdiction=self.jurisdiction,
+            )
+            for number in range(1, 4)
+        ][:limit]
+
+    def get_case_by_id(self, case_id):
+        return None
+
+
+class _OtherStubScraper(_StubScraper):
+    jurisdiction = "Other"
+
+
+class _QuotingScraper(_StubScraper):
+    jurisdiction = 'Smith, "Jones"\nLtd'
+
+
+class _FailingScraper(_StubScraper):
+    def search_cases(self, *args, **kwargs):
+        raise RuntimeError("site unavailable")
+
+
+# Holds _BlockingScraper searches until a test releases it
+_RELEASE = threading.Event()
+
+
+class _BlockingScraper(_StubScraper):
+    def search_cases(self, *args, **kwargs):
+        _RELEASE.wait(timeout=10)
+        return []
+
+
+_STUBS = {
+    "stub": f"{__name__}:_StubScraper",
+    "other": f"{__name__}:_OtherStubScraper",
+    "failing": f"{__name__}:_FailingScraper",
+}
+
+
+@pytest.fixture(autouse=True)
+def stub_scrapers(monkeypatch):
+    """Register only the stub scrapers, with a fresh instance cache."""
+    monkeypatch.setattr(cli, "SCRAPERS", dict(_STUBS))
+    cli.get_scraper.cache_clear()
+    yield
+    cli.get_scraper.cache_clear()
+
+
+def _search_args(*argv):
+    args = cli.create_parser().parse_args(["--no-cache", "search", *argv])
+    args.verbose = logging.WARNING
+    return args
+
+
+def _search(*argv):
+    cli.search_command(_search_args(*argv))
+
+
+def _case_names(output: str) -> set:
+    return {line[6:] for line in output.splitlines() if line.startswith("Case: ")}
+
+
+def _csv_rows(output: str) -> list:
+    """csv records in the output, without the trailing case count."""
+    return [row for row in csv.reader(io.StringIO(output)) if row][:-1]
+
+
+class TestSearchCommand:
+    """Tests for the multi-scraper search command."""
+
+    def test_comma_separated_scrapers(self, capsys):
+        """Every listed scraper is searched, each up to the limit."""
+        _search("stub,other", "negligence", "--limit", "2")
+
+        out = capsys.readouterr().out
+        assert _case_names(out) == {
+            "Stub case 1",
+            "Stub case 2",
+            "Other case 1",
+            "Other case 2",
+        }
+        assert "Found 4 cases." in out
+
+    def test_empty_and_duplicate_names_ignored(self, capsys):
+        """Trailing commas, blanks and repeats do not add scrapers."""
+        _search("stub, ,stub,", "negligence", "--limit", "1")
+
+        captured = capsys.readouterr()
+        assert _case_names(captured.out) == {"Stub case 1"}
+        assert "Unknown scraper" not in captured.err
+
+    def test_all_scrapers(self, capsys):
+        """'all' searches every registered scraper; a failure is reported."""
+        _search("all", "negligence", "--limit", "1")
+
+        captured = capsys.readouterr()
+        assert _case_names(captured.out) == {"Stub case 1", "Other case 1"}
+        assert "Error (failing): site unavailable" in captured.err
+        assert "Found 2 cases." in captured.out
+
+    def test_partial_failure_succeeds(self, capsys):
+        """One failing scraper does not fail the command."""
+        _search("failing,stub", "negligence", "--limit", "1")
+
+        captured = capsys.readouterr()
+        assert _case_names(captured.out) == {"Stub case 1"}
+        assert "Error (failing)" in captured.err
+
+    def test_all_failures_exit_nonzero(self, capsys):
+        """The command exits with status 1 when every scraper fails."""
+        with pytest.raises(SystemExit) as excinfo:
+            _search("failing", "negligence")
+
+        assert excinfo.value.code == 1
+        assert "Error (failing)" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("scraper", ["missing", "stub,missing", ","])
+    def test_unknown_scraper_exits_nonzero(self, scraper, capsys):
+        """Unknown or missing scraper names are rejected before searching."""
+        with pytest.raises(SystemExit) as excinfo:
+            _search(scraper, "negligence")
+
+        assert excinfo.value.code == 1
+        captured = capsys.readouterr()
+        assert "Available scrapers: stub, other, failing" in captured.err
+        assert not _case_names(captured.out)
+
+    def test_unwritable_output_exits_nonzero(self, tmp_path, capsys):
+        """An output path that cannot be opened is reported, not raised."""
+        output = tmp_path / "missing" / "out.txt"
+
+        with pytest.raises(SystemExit) as excinfo:
+            _search("stub", "negligence", "--output", str(output))
+
+        assert excinfo.value.code == 1
+        assert "Error: " in capsys.readouterr().err
+
+    def test_output_not_created_without_cases(self, tmp_path):
+        """The output file is only created once a case arrives."""
+        output = tmp_path / "out.txt"
+
+        with pytest.raises(SystemExit):
+            _search("failing", "negligence", "--output", str(output))
+
+        assert not output.exists()
+
+    def test_output_appends_cases(self, tmp_path, capsys):
+        """Cases are appended to the output file as well as printed."""
+        output = tmp_path / "out.txt"
+
+        _search("stub", "negligence", "--limit", "2", "--output", str(output))
+
+        assert _case_names(output.read_text(encoding="utf-8")) == {
+            "Stub case 1",
+            "Stub case 2",
+        }
+
+
+class TestCsvOutput:
+    """Tests for the csv output format."""
+
+    def test_header_then_rows(self, capsys):
+        """A header row is followed by one row per case."""
+        _search("stub", "negligence", "--limit", "2", "--format", "csv")
+
+        rows = _csv_rows(capsys.readouterr().out)
+        assert rows[0] == list(cli.CSV_FIELDS)
+        assert [row[:2] for row in rows[1:]] == [
+            ["Stub case 1", "Stub-1"],
+            ["Stub case 2", "Stub-2"],
+        ]
+
+    def test_commas_quotes_and_newlines_quoted(self, monkeypatch, tmp_path, capsys):
+        """Values with commas, quotes or newlines round-trip through csv."""
+        monkeypatch.setitem(cli.SCRAPERS, "quoting", f"{__name__}:_QuotingScraper")
+        output = tmp_path / "out.csv"
+
+        _search(
+            "quoting",
+            "negligence",
+            "--limit",
+            "1",
+            "--format",
+            "csv",
+            "--output",
+            str(output),
+        )
+
+        name = 'Smith, "Jones"\nLtd case 1'
+        assert _csv_rows(capsys.readouterr().out)[1][0] == name
+        with open(output, newline="", encoding="utf-8") as f:
+            assert list(csv.reader(f))[1][0] == name
+
+    def test_header_not_repeated_on_append(self, tmp_path):
+        """Appending to an existing csv file adds rows but no second header."""
+        output = tmp_path / "out.csv"
+
+        for _ in range(2):
+            _search(
+                "stub",
+                "negligence",
+                "--limit",
+                "2",
+                "--format",
+                "csv",
+                "--output",
+                str(output),
+            )
+
+        with open(output, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == list(cli.CSV_FIELDS)
+        assert [row[0] for row in rows[1:]] == ["Stub case 1", "Stub case 2"] * 2
+
+
+class TestJsonOutput:
+    """Tests for the json output format."""
+
+    def test_none_fields_omitted(self, capsys):
+        """Fields without a value are left out; empty collections are kept."""
+        _search("stub", "negligence", "--limit", "1", "--format", "json")
+
+        data, _ = json.JSONDecoder().raw_decode(capsys.readouterr().out)
+        assert data["case_name"] == "Stub case 1"
+        assert data["judges"] == []
+        assert "court" not in data
+        assert "date" not in data
+
+    def test_orjson_matches_stdlib(self, sample_case_data, monkeypatch):
+        """orjson and the stdlib fallback produce the same text."""
+        if cli.orjson is None:
+            pytest.skip("orjson is not installed")
+        sample_case_data.case_name = "Société Générale v. Café"
+        sample_case_data.court = None
+
+        with_orjson = cli.format_case_output(sample_case_data, "json")
+        monkeypatch.setattr(cli, "orjson", None)
+
+        assert cli.format_case_output(sample_case_data, "json") == with_orjson
+
+
+class TestIterSearchResults:
+    """Tests for the concurrent multi-scraper result stream."""
+
+    def test_closing_early_does_not_wait(self, monkeypatch):
+        """Closing the stream returns without waiting for slow searches."""
+        monkeypatch.setitem(cli.SCRAPERS, "blocking", f"{__name__}:_BlockingScraper")
+        _RELEASE.clear()
+        results = cli.iter_search_results(
+            ["blocking", "stub"], _search_args("stub", "negligence", "--limit", "1")
+        )
+        try:
+            assert next(results).case_name == "Stub case 1"
+            started = time.monotonic()
+            results.close()
+            assert time.monotonic() - started < 1
+        finally:
+            _RELEASE.set()
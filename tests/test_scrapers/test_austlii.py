@@ -0,0 +1,145 @@
+"""
+Tests for AustLII page parsing.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from the_junior_associate.scrapers.austlii import AustLIIScraper
+from the_junior_associate.utils.exceptions import NetworkError
+
+_CASE_URL = "https://www.austlii.edu.au/au/cases/cth/HCA/1992/23.html"
+
+_CASE_PAGE = """
+<html>
+  <head><title>Mabo v Queensland (No 2)</title></head>
+  <body>
+    <nav>Federal Court of Australia | 1/1/1999</nav>
+    <div class="judgment">
+      <p>High Court of Australia</p>
+      <p>3 June 1992</p>
+      <p>[1992] HCA 23; 1992 HCA 23; [1991] FCA 5</p>
+      <p>Justice Brennan and Deane J.</p>
+    </div>
+  </body>
+</html>
+"""
+
+_SEARCH_PAGE = """
+<html><body>
+  <a href="/au/other/index.html">Other</a>
+  <a href="/au/cases/cth/HCA/1992/23.html">Mabo v Queensland (No 2)</a>
+  <a href="/au/cases/cth/HCA/1988/40.html">Second</a>
+  <a href="/au/cases/cth/HCA/1980/1.html">Third</a>
+</body></html>
+"""
+
+
+@pytest.fixture
+def scraper():
+    """Fresh AustLIIScraper instance."""
+    return AustLIIScraper(cache_disabled=True)
+
+
+def _parse(scraper, html: str):
+    return scraper._parse_case_detail(scraper._parse_tree(html.encode()), _CASE_URL)
+
+
+class TestAustLIICaseDetail:
+    """Tests for AustLIIScraper._parse_case_detail."""
+
+    def test_court_and_citations(self, scraper):
+        """Court and citations come from the page body, skipping navigation."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.case_name == "Mabo v Queensland (No 2)"
+        assert case.court == "High Court of Australia"
+        assert case.citations == ["[1992] HCA 23", "[1991] FCA 5"]
+
+    def test_long_page(self, scraper):
+        """Facts deep into a long judgment are still found."""
+        filler = "<p>" + "Lorem ipsum. " * 2000 + "</p>"
+        case = _parse(
+            scraper,
+            f"<html><body>{filler}<p>Federal Court of Australia, "
+            "2 January 2020, [2020] FCA 7</p></body></html>",
+        )
+
+        assert case.court == "Federal Court of Australia"
+        assert case.date == datetime(2020, 1, 2)
+        assert case.citations == ["[2020] FCA 7"]
+
+    def test_full_text_skips_navigation(self, scraper):
+        """Judgment text comes from the content root, without navigation."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.full_text.startswith("High Court of Australia")
+        assert "Federal Court" not in case.full_text
+
+    def test_judges_deduplicated(self, scraper):
+        """Judges keep page order and appear once."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.judges == ["Brennan", "Deane"]
+
+    def test_date(self, scraper):
+        """A day-month-year date is read from the judgment."""
+        assert _parse(scraper, _CASE_PAGE).date == datetime(1992, 6, 3)
+
+    def test_invalid_date_falls_through(self, scraper):
+        """An impossible date is skipped in favour of the next one."""
+        case = _parse(
+            scraper,
+            "<html><body><p>Heard 31/02/2020, decided 2020-03-04</p></body></html>",
+        )
+
+        assert case.date == datetime(2020, 3, 4)
+
+    def test_fetch_uses_declared_charset(self, scraper, monkeypatch, html_response):
+        """Fetched pages are parsed from their bytes in the declared charset."""
+        response = html_response("")
+        response.content = (
+            "<html><head><title>Société v Café</title></head><body></body></html>"
+        ).encode("cp1252")
+        response.headers = {"Content-Type": "text/html; charset=windows-1252"}
+        response.encoding = "windows-1252"
+        monkeypatch.setattr(scraper, "_make_request", lambda *a, **k: response)
+
+        assert scraper._fetch_case_detail(_CASE_URL).case_name == "Société v Café"
+
+
+class TestAustLIISearch:
+    """Tests for AustLIIScraper.search_cases."""
+
+    def test_search_parses_case_links(self, scraper, monkeypatch, html_response):
+        """Only case links are returned, in page order, up to the limit."""
+        monkeypatch.setattr(
+            scraper, "_make_request", lambda *a, **k: html_response(_SEARCH_PAGE)
+        )
+
+        cases = scraper.search_cases(query="native title", limit=2)
+
+        assert [case.case_name for case in cases] == [
+            "Mabo v Queensland (No 2)",
+            "Second",
+        ]
+        assert cases[0].url == _CASE_URL
+
+    def test_search_fetch_details(self, scraper, monkeypatch, html_response):
+        """Detail pages replace summaries; failed fetches keep the summary."""
+
+        def fake_request(url, params=None, **kwargs):
+            if params is not None:
+                return html_response(_SEARCH_PAGE)
+            if url == _CASE_URL:
+                return html_response(_CASE_PAGE)
+            raise NetworkError("Not found", url=url)
+
+        monkeypatch.setattr(scraper, "_make_request", fake_request)
+
+        cases = scraper.search_cases(query="native title", limit=2, fetch_details=True)
+
+        assert cases[0].court == "High Court of Australia"
+        assert cases[1].case_name == "Second"
+        assert not cases[1].court
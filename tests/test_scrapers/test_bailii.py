@@ -0,0 +1,173 @@
+"""
+Tests for BAILII page parsing.
+"""
+
+import re
+from datetime import datetime
+
+import pytest
+
+from the_junior_associate.scrapers import bailii
+from the_junior_associate.scrapers.bailii import BAILIIScraper, _HEADER_CHARS
+
+_CASE_URL = "https://www.bailii.org/uk/cases/UKSC/2019/41.html"
+
+_CASE_PAGE = """
+<html>
+  <head><title>R (Miller) v The Prime Minister</title></head>
+  <body>
+    <nav>Home | Databases | 1 January 1999</nav>
+    <div class="judgment">
+      <p>Supreme Court</p>
+      <p>24 September 2019</p>
+      <p>[2019] UKSC 41; [2017] 1 WLR 22; [2019] UKSC 41</p>
+      <p>Before: Lady Hale, Lord Reed, Arden LJ and Jones J.</p>
+    </div>
+  </body>
+</html>
+"""
+
+# Facts separated by non-breaking spaces, as BAILII often renders them
+_NBSP_PAGE = (
+    "<html><body><div class='judgment'><p>Supreme\xa0Court</p>"
+    "<p>15\xa0March\xa02023</p><p>[2023]\xa0UKSC\xa07;\xa0[2017] 1\xa0WLR\xa022</p>"
+    "<p>Lord\xa0Reed and Lady\xa0Hale</p></div></body></html>"
+)
+
+_FILLER = "<p>" + "Lorem ipsum. " * (_HEADER_CHARS // 10) + "</p>"
+
+
+@pytest.fixture
+def scraper():
+    """Fresh BAILIIScraper instance."""
+    return BAILIIScraper(cache_disabled=True)
+
+
+def _parse(scraper, html: str, url: str = _CASE_URL):
+    return scraper._parse_case_detail(scraper._parse_html(html), url)
+
+
+class TestBAILIICaseDetail:
+    """Tests for BAILIIScraper._parse_case_detail."""
+
+    def test_court_and_citations(self, scraper):
+        """Court and citations come from the judgment, deduplicated."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.case_name == "R (Miller) v The Prime Minister"
+        assert case.case_id == "uk/cases/UKSC/2019/41"
+        assert case.court == "Supreme Court"
+        assert case.citations == ["[2019] UKSC 41", "[2017] 1 WLR 22"]
+
+    def test_full_text_from_judgment(self, scraper):
+        """Judgment text excludes the page navigation."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.full_text.startswith("Supreme Court")
+        assert "Home | Databases" not in case.full_text
+
+    def test_judges(self, scraper):
+        """Judicial titles and suffixes are stripped, keeping page order."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.judges == ["Hale", "Reed", "Arden", "Jones"]
+
+    def test_jurisdiction_from_url(self, scraper):
+        """The jurisdiction follows the case URL."""
+        case = _parse(
+            scraper, _CASE_PAGE, "https://www.bailii.org/ie/cases/IESC/2020/1.html"
+        )
+
+        assert case.jurisdiction == "Ireland"
+        assert case.case_id == "ie/cases/IESC/2020/1"
+
+    def test_date(self, scraper):
+        """A day-month-year date is read from the judgment."""
+        assert _parse(scraper, _CASE_PAGE).date == datetime(2019, 9, 24)
+
+    def test_invalid_date_falls_through(self, scraper):
+        """An impossible date is skipped in favour of the next one."""
+        case = _parse(
+            scraper,
+            "<html><body><p>Heard 31/02/2020, handed down 2020-03-04</p>"
+            "</body></html>",
+        )
+
+        assert case.date == datetime(2020, 3, 4)
+
+    def test_long_page_fallback(self, scraper):
+        """Facts missing from the opening text are found further down."""
+        case = _parse(
+            scraper,
+            f"<html><body>{_FILLER}"
+            "<p>High Court, 2 January 2020, [2020] EWHC 7</p>"
+            "</body></html>",
+        )
+
+        assert case.court == "High Court"
+        assert case.date == datetime(2020, 1, 2)
+        assert case.citations == ["[2020] EWHC 7"]
+
+    def test_opening_citations_win(self, scraper):
+        """Citations in the opening text stop the scan of the rest."""
+        case = _parse(
+            scraper,
+            "<html><body><p>Court of Appeal, [2021] EWCA 3</p>"
+            f"{_FILLER}<p>[2019] UKSC 9</p></body></html>",
+        )
+
+        assert case.citations == ["[2021] EWCA 3"]
+
+    def test_non_breaking_spaces(self, scraper):
+        """Facts split by non-breaking spaces are still found."""
+        case = _parse(scraper, _NBSP_PAGE)
+
+        assert case.court == "Supreme Court"
+        assert case.date == datetime(2023, 3, 15)
+        assert case.citations == ["[2023] UKSC 7", "[2017] 1 WLR 22"]
+        assert case.judges == ["Reed", "Hale"]
+
+    def test_re2_matches_stdlib(self, scraper, monkeypatch):
+        """RE2 and re patterns extract the same facts."""
+        pytest.importorskip("re2")
+        with_re2 = _parse(scraper, _NBSP_PAGE)
+        for name in ("_COURT_RE", "_DATE_RE", "_CITATION_RE", "_JUDGE_RE"):
+            pattern = getattr(bailii, name)
+            assert not isinstance(pattern, re.Pattern)
+            monkeypatch.setattr(bailii, name, re.compile(pattern.pattern))
+
+        with_re = _parse(scraper, _NBSP_PAGE)
+
+        for field in ("court", "date", "citations", "judges"):
+            assert getattr(with_re, field) == getattr(with_re2, field)
+
+
+class TestBAILIISearch:
+    """Tests for BAILIIScraper.search_cases."""
+
+    _SEARCH_PAGE = """
+    <html><body>
+      <a href="/form/search.html">Search</a>
+      <a href="/uk/cases/UKSC/2019/41.html">R (Miller) v The Prime Minister</a>
+      <a href="/scot/cases/ScotCS/2020/5.html">Scottish case</a>
+      <a href="/uk/cases/EWCA/2021/3.html">Third</a>
+    </body></html>
+    """
+
+    def test_search_parses_case_links(self, scraper, monkeypatch, html_response):
+        """Only case links are returned, in page order, up to the limit."""
+        monkeypatch.setattr(
+            scraper, "_make_request", lambda *a, **k: html_response(self._SEARCH_PAGE)
+        )
+
+        cases = scraper.search_cases(query="prorogation", limit=2)
+
+        assert [case.case_id for case in cases] == [
+            "uk/cases/UKSC/2019/41",
+            "scot/cases/ScotCS/2020/5",
+        ]
+        assert [case.jurisdiction for case in cases] == [
+            "United Kingdom",
+            "Scotland",
+        ]
+        assert cases[0].url == _CASE_URL
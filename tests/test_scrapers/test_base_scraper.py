@@ -2,17 +2,59 @@
 Tests for BaseScraper functionality.
 """
 
+import contextlib
+import re
+from collections import OrderedDict
+
 import pytest
+import requests
 from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime, timedelta
+from datetime import datetime
+from types import SimpleNamespace
+
+from bs4 import SoupStrainer
 
+from the_junior_associate.utils import base
 from the_junior_associate.utils.base import BaseScraper
+from the_junior_associate.utils.data_models import CaseData
 from the_junior_associate.utils.exceptions import (
+    ScrapingError,
     NetworkError,
     RateLimitError,
     ParsingError,
 )
 
+# Error messages raised by BaseScraper.validate_search_params
+_START_AFTER_END = re.compile("Start date must be before end date")
+_INVALID_LIMIT = re.compile("Limit must be a positive integer")
+
+
+class _TestScraper(BaseScraper):
+    """Minimal concrete scraper shared by all tests in this module."""
+
+    base_url = "https://example.com"
+    jurisdiction = "Test"
+
+    def search_cases(
+        self,
+        query=None,
+        start_date=None,
+        end_date=None,
+        court=None,
+        limit=100,
+        **kwargs,
+    ):
+        return []
+
+    def get_case_by_id(self, case_id):
+        return None
+
+
+@pytest.fixture
+def scraper():
+    """Fresh _TestScraper instance."""
+    return _TestScraper(cache_disabled=True)
+
 
 class TestBaseScraper:
     """Tests for BaseScraper class."""
@@ -24,34 +66,12 @@ class TestBaseScraper:
 
     def test_context_manager(self, mock_scraper_session):
         """Test context manager functionality."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
         with patch("requests.Session", return_value=mock_scraper_session):
-            with TestScraper() as scraper:
+            with _TestScraper(cache_disabled=True) as scraper:
                 assert scraper.session is not None
 
-    def test_validate_search_params(self):
+    def test_validate_search_params(self, scraper):
         """Test search parameter validation."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        scraper = TestScraper()
-
         # Test valid parameters
         result = scraper.validate_search_params("2023-01-01", "2023-12-31", 100)
         assert "start_date" in result
@@ -66,197 +86,260 @@ class TestBaseScraper:
         assert result["end_date"] == end
         assert result["limit"] == 50
 
-    def test_validate_search_params_invalid_dates(self):
+    def test_validate_search_params_invalid_dates(self, scraper):
         """Test search parameter validation with invalid dates."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        scraper = TestScraper()
-
         # Test end date before start date
-        with pytest.raises(ValueError, match="End date cannot be before start date"):
+        with pytest.raises(ValueError, match=_START_AFTER_END):
             scraper.validate_search_params("2023-12-31", "2023-01-01", 100)
 
-    def test_validate_search_params_invalid_limit(self):
+    def test_validate_search_params_invalid_limit(self, scraper):
         """Test search parameter validation with invalid limit."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        scraper = TestScraper()
-
         # Test negative limit
-        with pytest.raises(ValueError, match="Limit must be positive"):
+        with pytest.raises(ValueError, match=_INVALID_LIMIT):
             scraper.validate_search_params(None, None, -1)
 
         # Test zero limit
-        with pytest.raises(ValueError, match="Limit must be positive"):
+        with pytest.raises(ValueError, match=_INVALID_LIMIT):
             scraper.validate_search_params(None, None, 0)
 
-    @patch("requests.Session")
-    def test_make_request_success(self, mock_session_class):
-        """Test successful HTTP request."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_session.get.return_value = mock_response
-        mock_session_class.return_value = mock_session
-
-        scraper = TestScraper()
-        response = scraper._make_request("https://example.com/test")
-
-        assert response == mock_response
-        mock_session.get.assert_called_once()
-
-    @patch("requests.Session")
-    def test_make_request_rate_limit(self, mock_session_class):
-        """Test rate limiting in HTTP requests."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        mock_session = Mock()
-        mock_response = Mock()
-        mock_response.status_code = 429
-        mock_response.headers = {"Retry-After": "60"}
-        mock_session.get.return_value = mock_response
-        mock_session_class.return_value = mock_session
-
-        scraper = TestScraper()
-
-        with pytest.raises(RateLimitError):
-            scraper._make_request("https://example.com/test")
-
-    @patch("requests.Session")
-    def test_make_request_network_error(self, mock_session_class):
-        """Test network error handling."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        mock_session = Mock()
-        mock_session.get.side_effect = Exception("Network error")
-        mock_session_class.return_value = mock_session
-
-        scraper = TestScraper()
-
-        with pytest.raises(NetworkError):
-            scraper._make_request("https://example.com/test")
-
-    def test_parse_html_success(self):
+    @pytest.mark.parametrize(
+        "status,headers,side_effect,exc",
+        [
+            (200, {}, None, None),
+            (429, {"Retry-After": "60"}, None, RateLimitError),
+            (
+                None,
+                None,
+                requests.exceptions.RequestException("Network error"),
+                NetworkError,
+            ),
+        ],
+    )
+    def test_make_request(
+        self, scraper, monkeypatch, status, headers, side_effect, exc
+    ):
+        """Test HTTP request success, rate limiting and network errors."""
+        mock_request = Mock()
+        if side_effect is not None:
+            mock_request.side_effect = side_effect
+        else:
+            mock_request.return_value = Mock(status_code=status, headers=headers)
+        monkeypatch.setattr(scraper.session, "request", mock_request)
+
+        with pytest.raises(exc) if exc else contextlib.nullcontext():
+            response = scraper._make_request("https://example.com/test")
+            assert response is mock_request.return_value
+
+        mock_request.assert_called_once()
+
+    def test_robots_txt_is_cached_and_enforced(self, monkeypatch):
+        """Test that robots.txt is fetched once per origin and enforced."""
+        scraper = _TestScraper(cache_disabled=True, respect_robots=True, rate_limit=0)
+        robots = Mock(status_code=200, text="User-agent: *\nDisallow: /private/")
+        mock_get = Mock(return_value=robots)
+        mock_request = Mock(return_value=Mock(status_code=200, headers={}))
+        monkeypatch.setattr(scraper.session, "get", mock_get)
+        monkeypatch.setattr(scraper.session, "request", mock_request)
+        monkeypatch.setattr(BaseScraper, "_robots_cache", {})
+
+        scraper._make_request("https://robots.example.com/public/1")
+        with pytest.raises(ScrapingError):
+            scraper._make_request("https://robots.example.com/private/1")
+
+        mock_get.assert_called_once_with(
+            "https://robots.example.com/robots.txt", timeout=scraper.timeout
+        )
+        mock_request.assert_called_once()
+
+    def test_session_connection_pool(self, scraper):
+        """Test that one pooled adapter serves both schemes."""
+        adapter = scraper.session.get_adapter("https://example.com")
+        assert adapter is scraper.session.get_adapter("http://example.com")
+        assert adapter._pool_maxsize == BaseScraper.POOL_MAXSIZE
+
+    def test_map_concurrent_preserves_order(self, scraper):
+        """Test that concurrent mapping returns results in input order."""
+        assert scraper._map_concurrent(lambda x: x * 2, range(20)) == [
+            x * 2 for x in range(20)
+        ]
+        assert scraper._map_concurrent(str, []) == []
+
+    def test_bulk_get_cases(self, scraper, monkeypatch):
+        """Test that bulk retrieval returns cases in input order."""
+        monkeypatch.setattr(
+            scraper,
+            "get_case_by_id",
+            lambda case_id: (
+                CaseData(case_name=case_id, case_id=case_id)
+                if case_id != "missing"
+                else None
+            ),
+        )
+
+        cases = scraper.bulk_get_cases(["a", "missing", "b"])
+        assert [case and case.case_id for case in cases] == ["a", None, "b"]
+
+    def test_iter_search_cases_wraps_search_cases(self, scraper, monkeypatch):
+        """Test that the default iterator yields search_cases results."""
+        cases = [CaseData(case_name="A"), CaseData(case_name="B")]
+        monkeypatch.setattr(scraper, "search_cases", lambda **kwargs: cases)
+
+        assert list(scraper.iter_search_cases(query="test")) == cases
+
+    def test_parse_cached(self, scraper):
+        """Test that unchanged pages are parsed once and returned as copies."""
+        parse = Mock(
+            side_effect=lambda content: CaseData(case_name=content.decode(), judges=[])
+        )
+        url = "https://example.com/cases/parse-cached"
+
+        first = scraper._parse_cached(url, b"<p>Case</p>", parse)
+        first.judges.append("Judge A")
+        second = scraper._parse_cached(url, b"<p>Case</p>", parse)
+
+        assert parse.call_count == 1
+        assert second.case_name == "<p>Case</p>"
+        assert second.judges == []
+
+        scraper._parse_cached(url, b"<p>Changed</p>", parse)
+        assert parse.call_count == 2
+
+    def test_case_cache(self, scraper, monkeypatch):
+        """Test that cached cases are returned as copies and honour cache_disabled."""
+        monkeypatch.setattr(BaseScraper, "_case_cache", OrderedDict())
+        cached_scraper = _TestScraper(cache_disabled=True)
+        monkeypatch.setattr(cached_scraper, "_case_cache_ttl", 60)
+        case = CaseData(case_name="Cached", judges=[])
+
+        assert cached_scraper._cache_case("2023 SCC 15", case) is case
+        case.judges.append("Judge A")
+        first = cached_scraper._get_cached_case("2023 SCC 15")
+        assert first.case_name == "Cached"
+        assert first.judges == []
+        assert cached_scraper._get_cached_case("2023 SCC 16") is None
+
+        scraper._cache_case("2023 SCC 17", case)
+        assert scraper._get_cached_case("2023 SCC 17") is None
+
+    def test_parse_html_success(self, scraper):
         """Test HTML parsing."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        scraper = TestScraper()
         html = "<html><body><h1>Test</h1></body></html>"
 
         soup = scraper._parse_html(html)
         assert soup.h1.text == "Test"
 
-    def test_parse_html_invalid(self):
+    def test_parse_html_parse_only(self, scraper):
+        """Test HTML parsing restricted by a SoupStrainer."""
+        html = (
+            '<html><body><p>Skip</p><a href="/a">A</a><a href="/b">B</a></body></html>'
+        )
+
+        soup = scraper._parse_html(html, parse_only=SoupStrainer("a"))
+        assert [a.get_text() for a in soup.find_all("a")] == ["A", "B"]
+        assert soup.find("p") is None
+
+    @pytest.mark.parametrize(
+        "content_type,content,expected",
+        [
+            ("text/html; charset=utf-8", b"<html></html>", "utf-8"),
+            ("text/html", b'<meta charset="windows-1252">', "windows-1252"),
+            ("text/html", b"<html></html>", None),
+        ],
+    )
+    def test_response_encoding(self, scraper, content_type, content, expected):
+        """Test that only declared encodings are used for raw content."""
+        response = Mock(
+            headers={"Content-Type": content_type},
+            encoding="utf-8" if "charset" in content_type else "ISO-8859-1",
+            content=content,
+        )
+        assert scraper._response_encoding(response) == expected
+
+    def test_parse_html_bytes(self, scraper):
+        """Test HTML parsing from raw bytes with an explicit encoding."""
+        soup = scraper._parse_html(
+            "<h1>Café</h1>".encode("cp1252"), from_encoding="cp1252"
+        )
+        assert soup.h1.text == "Café"
+
+    def test_parse_html_invalid(self, scraper):
         """Test HTML parsing with invalid input."""
+        with pytest.raises(ParsingError):
+            scraper._parse_html(None)
 
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
+    def test_parse_tree(self, scraper):
+        """Test lxml tree parsing."""
+        tree = scraper._parse_tree('<html><body><a href="/x">Link</a></body></html>')
+        assert [a.text_content() for a in tree.xpath("//a")] == ["Link"]
 
-        scraper = TestScraper()
+        with pytest.raises(ParsingError):
+            scraper._parse_tree("")
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            "<html><body><p>Café</p></body></html>",
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            "<html><body><p>Café</p></body></html>".encode(),
+        ],
+    )
+    def test_parse_tree_xml_declaration(self, scraper, content):
+        """Test that XHTML pages with an XML declaration still parse."""
+        tree = scraper._parse_tree(content)
+        assert tree.xpath("string(//p)") == "Café"
+
+    def test_parse_tree_bytes_encoding(self, scraper):
+        """Test that a declared encoding is used to decode raw bytes."""
+        tree = scraper._parse_tree(
+            "<html><body><p>Café</p></body></html>".encode("latin-1"), "latin-1"
+        )
+        assert tree.xpath("string(//p)") == "Café"
+
+    def test_parse_json(self, scraper):
+        """Test JSON decoding of response bodies."""
+        response = Mock(content='{"caseName": "Café"}'.encode(), url="https://x")
+        assert scraper._parse_json(response) == {"caseName": "Café"}
 
         with pytest.raises(ParsingError):
-            scraper._parse_html(None)
+            scraper._parse_json(Mock(content=b"<html>", url="https://x"))
+
+    def test_content_text_skips_non_content(self, scraper):
+        """Test that navigation and scripts are skipped but tails are kept."""
+        tree = scraper._parse_tree(
+            "<html><body>A<nav>Menu</nav>B<!-- note -->C"
+            "<p>D<script>x()</script>E</p>F</body></html>"
+        )
+        assert scraper._content_text(tree.body) == "ABCDEF"
 
     @patch("time.sleep")
-    def test_wait_with_backoff(self, mock_sleep):
+    def test_wait_with_backoff(self, mock_sleep, scraper):
         """Test backoff waiting mechanism."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        scraper = TestScraper()
         scraper._wait_with_backoff(1)
 
         mock_sleep.assert_called_once()
 
-    def test_should_respect_rate_limit(self):
-        """Test rate limit respect check."""
-
-        class TestScraper(BaseScraper):
-            @property
-            def base_url(self):
-                return "https://example.com"
-
-            @property
-            def jurisdiction(self):
-                return "Test"
-
-        scraper = TestScraper()
+    def test_respect_rate_limit(self, scraper, monkeypatch):
+        """Test rate limiting against a frozen clock."""
+        clock = {"now": 1_000.0}
+        sleeps = []
+        monkeypatch.setattr(
+            base,
+            "time",
+            SimpleNamespace(time=lambda: clock["now"], sleep=sleeps.append),
+        )
 
         # Initially should not need to wait
-        assert not scraper._should_respect_rate_limit()
-
-        # Set last request time to now
-        scraper.last_request_time = datetime.now()
-
-        # Should need to wait
-        assert scraper._should_respect_rate_limit()
-
-        # Set last request time to past the rate limit
-        scraper.last_request_time = datetime.now() - timedelta(seconds=2)
-
-        # Should not need to wait
-        assert not scraper._should_respect_rate_limit()
+        scraper._respect_rate_limit()
+        assert sleeps == []
+
+        # Last request was just now, so the full interval must be waited out
+        scraper._last_request_time = clock["now"]
+        scraper._respect_rate_limit()
+        assert sleeps == [pytest.approx(scraper.rate_limit)]
+
+        # Last request was past the rate limit
+        sleeps.clear()
+        scraper._last_request_time = clock["now"] - 2
+        scraper._respect_rate_limit()
+        assert sleeps == []
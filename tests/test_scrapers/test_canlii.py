@@ -0,0 +1,69 @@
+"""
+Tests for CanLII page parsing.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from the_junior_associate.scrapers.canlii import CanLIIScraper
+
+_CASE_URL = "https://www.canlii.org/en/ca/scc/doc/2023/2023scc15/2023scc15.html"
+
+_HEADER_LAYOUT = b"""
+<html>
+  <head><title>R v X - CanLII</title></head>
+  <body>
+    <header>
+      <h1>R v X</h1>
+      <span class="court">Supreme Court of Canada</span>
+      <span class="date">2023-05-01</span>
+      <span class="citation">2023 SCC 15</span>
+    </header>
+    <div class="documentcontent">
+      <nav>Skip to judgment</nav>
+      <p>Reasons of Justice Martin for the Court.</p>
+      <script>var judgment = 1;</script>
+      <footer>Page footer</footer>
+    </div>
+  </body>
+</html>
+"""
+
+
+@pytest.fixture
+def scraper():
+    """Fresh CanLIIScraper instance."""
+    return CanLIIScraper(cache_disabled=True)
+
+
+class TestCanLIICaseDetail:
+    """Tests for CanLIIScraper._parse_case_detail."""
+
+    def test_header_wrapped_fields(self, scraper):
+        """Heading and spans inside <header> are still collected."""
+        case = scraper._parse_case_detail(_HEADER_LAYOUT, _CASE_URL)
+
+        assert case.case_name == "R v X"
+        assert case.court == "Supreme Court of Canada"
+        assert case.date == datetime(2023, 5, 1)
+        assert case.citations == ["2023 SCC 15"]
+        assert case.case_id == "2023scc15"
+
+    def test_body_drops_non_content(self, scraper):
+        """Nav, footer and script text is dropped from the body only."""
+        case = scraper._parse_case_detail(_HEADER_LAYOUT, _CASE_URL)
+
+        assert "Skip to judgment" not in case.full_text
+        assert "Page footer" not in case.full_text
+        assert "var judgment" not in case.full_text
+        assert "Reasons of Justice Martin" in case.full_text
+        assert case.judges == ["Martin"]
+
+    def test_title_fallback(self, scraper):
+        """The <title> is used when the page has no <h1>."""
+        html = b"<html><head><title>R v Y</title></head><body></body></html>"
+        case = scraper._parse_case_detail(html, _CASE_URL)
+
+        assert case.case_name == "R v Y"
+        assert case.full_text == ""
@@ -0,0 +1,113 @@
+"""
+Tests for CourtListener search paging.
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from the_junior_associate.scrapers.courtlistener import CourtListenerScraper
+from the_junior_associate.utils.exceptions import NetworkError
+
+_PAGE_SIZE = 3
+
+
+def _page(number: int, total: int) -> SimpleNamespace:
+    """Search API response for one page of `_PAGE_SIZE` results."""
+    first = (number - 1) * _PAGE_SIZE + 1
+    results = [
+        {"id": case_id, "caseName": f"Case {case_id}", "dateFiled": "2023-01-15"}
+        for case_id in range(first, min(first + _PAGE_SIZE, total + 1))
+    ]
+    body = {
+        "count": total,
+        "next": (
+            "https://www.courtlistener.com/next"
+            if first + _PAGE_SIZE <= total
+            else None
+        ),
+        "results": results,
+    }
+    return SimpleNamespace(
+        content=json.dumps(body).encode(), url="https://www.courtlistener.com"
+    )
+
+
+@pytest.fixture
+def scraper():
+    """Fresh CourtListenerScraper instance."""
+    return CourtListenerScraper(cache_disabled=True)
+
+
+def _serve_pages(scraper, monkeypatch, total: int, failing=()):
+    """Answer search requests from canned pages; returns the pages requested."""
+    requested = []
+    lock = threading.Lock()
+
+    def fake_request(url, params=None, **kwargs):
+        number = params.get("page", 1)
+        with lock:
+            requested.append(number)
+        if number in failing:
+            raise NetworkError("Server error", url=url)
+        return _page(number, total)
+
+    monkeypatch.setattr(scraper, "_make_request", fake_request)
+    return requested
+
+
+class TestCourtListenerSearch:
+    """Tests for CourtListenerScraper.iter_search_cases."""
+
+    def test_pages_fetched_in_order_up_to_limit(self, scraper, monkeypatch):
+        """Only the pages needed for the limit are fetched, in order."""
+        requested = _serve_pages(scraper, monkeypatch, total=20)
+
+        cases = scraper.search_cases(query="privacy", limit=7)
+
+        assert [case.case_id for case in cases] == [str(n) for n in range(1, 8)]
+        assert sorted(requested) == [1, 2, 3]
+
+    def test_count_caps_pages(self, scraper, monkeypatch):
+        """No page beyond the reported result count is requested."""
+        requested = _serve_pages(scraper, monkeypatch, total=5)
+
+        cases = scraper.search_cases(query="privacy", limit=50)
+
+        assert [case.case_id for case in cases] == ["1", "2", "3", "4", "5"]
+        assert sorted(requested) == [1, 2]
+
+    def test_single_page(self, scraper, monkeypatch):
+        """A response without a next page is not paged further."""
+        requested = _serve_pages(scraper, monkeypatch, total=3)
+
+        cases = scraper.search_cases(query="privacy", limit=10)
+
+        assert len(cases) == 3
+        assert requested == [1]
+
+    def test_failed_page_is_skipped(self, scraper, monkeypatch):
+        """A page that fails to download is skipped; later pages still count."""
+        requested = _serve_pages(scraper, monkeypatch, total=20, failing={2})
+
+        cases = scraper.search_cases(query="privacy", limit=9)
+
+        assert [case.case_id for case in cases] == [
+            "1",
+            "2",
+            "3",
+            "7",
+            "8",
+            "9",
+        ]
+        assert sorted(requested) == [1, 2, 3]
+
+    def test_iter_stops_at_limit(self, scraper, monkeypatch):
+        """The iterator yields no more than the limit."""
+        _serve_pages(scraper, monkeypatch, total=20)
+
+        cases = list(scraper.iter_search_cases(query="privacy", limit=4))
+
+        assert [case.case_id for case in cases] == ["1", "2", "3", "4"]
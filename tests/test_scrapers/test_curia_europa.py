@@ -0,0 +1,148 @@
+"""
+Tests for Curia Europa page parsing.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from the_junior_associate.scrapers.curia_europa import CuriaEuropaScraper
+
+_CASE_URL = "https://curia.europa.eu/juris/document/document.jsf?docid=123"
+
+_CASE_PAGE = """
+<html>
+  <head><title>Smith Ltd v Commission</title></head>
+  <body>
+    <nav>Court of Justice news, 01/01/1999, Case C-999/99</nav>
+    <div class="content">
+      <div class="document-content">
+        <p>Judgment of the General Court (Second Chamber)</p>
+        <p>12 July 2023</p>
+        <p>In Case T-123/22 and Joined Cases C-1/21 and C-2/21,
+           ECLI:EU:T:2023:456</p>
+        <p>President Marcoulli, Judge Frendo, Advocate General Kokott,
+           Judge Frendo.</p>
+        <p>Subject-matter: State aid. The action is dismissed.</p>
+      </div>
+    </div>
+  </body>
+</html>
+"""
+
+
+@pytest.fixture
+def scraper():
+    """Fresh CuriaEuropaScraper instance."""
+    return CuriaEuropaScraper(cache_disabled=True)
+
+
+def _parse(scraper, html: str):
+    return scraper._parse_case_detail(scraper._parse_tree(html.encode()), _CASE_URL)
+
+
+class TestCuriaCaseDetail:
+    """Tests for CuriaEuropaScraper._parse_case_detail."""
+
+    def test_court_and_date(self, scraper):
+        """Court and date are read from the judgment text."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.court == "General Court"
+        assert case.date == datetime(2023, 7, 12)
+
+    def test_long_page(self, scraper):
+        """Facts deep into a long judgment are still found."""
+        filler = "<p>" + "Lorem ipsum. " * 2000 + "</p>"
+        case = _parse(
+            scraper,
+            f"<html><body>{filler}<p>Court of Justice, 3 May 2022, "
+            "Case C-5/20</p></body></html>",
+        )
+
+        assert case.court == "Court of Justice"
+        assert case.date == datetime(2022, 5, 3)
+        assert case.citations == ["C-5/20"]
+
+    def test_citations(self, scraper):
+        """Case references, joined cases, numbers and ECLIs are deduplicated."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.citations == [
+            "T-123/22",
+            "C-1/21 and C-2/21",
+            "C-1/21",
+            "C-2/21",
+            "ECLI:EU:T:2023:456",
+        ]
+        assert case.case_id == "T-123/22"
+
+    def test_scans_judgment_container(self, scraper):
+        """Navigation outside the judgment container is not scanned."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert "C-999/99" not in case.citations
+        assert "C-999/99" not in case.full_text
+
+    def test_judges(self, scraper):
+        """Judges keep their page order and appear once."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.judges == ["Marcoulli", "Frendo", "Kokott"]
+
+    def test_parties_and_subject(self, scraper):
+        """Parties and subject matter are split out."""
+        case = _parse(scraper, _CASE_PAGE)
+
+        assert case.parties == ["Smith Ltd", "Commission"]
+        assert case.legal_issues == ["State aid"]
+
+    def test_date_formats(self, scraper):
+        """An impossible date is skipped in favour of the next format."""
+        case = _parse(
+            scraper,
+            "<html><body><p>Lodged 31/02/2023, decided 2023-03-04</p></body></html>",
+        )
+
+        assert case.date == datetime(2023, 3, 4)
+
+
+class TestCuriaSearch:
+    """Tests for CuriaEuropaScraper.search_cases."""
+
+    _SEARCH_PAGE = """
+    <html><body>
+      <a href="/juris/recherche.jsf">New search</a>
+      <a href="/juris/document/document.jsf?docid=1">Case C-1/23 A v B</a>
+      <a href="/juris/document/document.jsf?docid=2">Case T-2/22 C v D</a>
+      <a href="/juris/document/document.jsf?docid=3">Case C-3/21 E v F</a>
+    </body></html>
+    """
+
+    def test_search_parses_case_links(self, scraper, monkeypatch, html_response):
+        """Only document links are returned, in page order, up to the limit."""
+        monkeypatch.setattr(
+            scraper, "_make_request", lambda *a, **k: html_response(self._SEARCH_PAGE)
+        )
+
+        cases = scraper.search_cases(query="state aid", limit=2)
+
+        assert [case.case_id for case in cases] == ["C-1/23", "T-2/22"]
+        assert cases[0].url == (
+            "https://curia.europa.eu/juris/document/document.jsf?docid=1"
+        )
+
+    @pytest.mark.parametrize("court", ["General Court", "general court"])
+    def test_search_maps_court(self, scraper, monkeypatch, html_response, court):
+        """Court names map to Curia court codes regardless of case."""
+        requests_made = []
+
+        def fake_request(url, params=None, **kwargs):
+            requests_made.append(params)
+            return html_response(self._SEARCH_PAGE)
+
+        monkeypatch.setattr(scraper, "_make_request", fake_request)
+
+        scraper.search_cases(query="state aid", court=court, limit=1)
+
+        assert requests_made[0]["court"] == "GC"
@@ -0,0 +1,167 @@
+"""
+Tests for HKLII page parsing.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from the_junior_associate.scrapers.hklii import HKLIIScraper, _HEADER_CHARS
+
+_CASE_URL = "https://www.hklii.hk/hk/cases/hkcfa/2023/15.html"
+
+# Court, date and citation sit in a <header> outside the judgment container
+_HEADER_LAYOUT = """
+<html>
+  <head><title>HKSAR v. Lai Chee Ying</title></head>
+  <body>
+    <header>
+      <p>Court of Final Appeal</p>
+      <p>Judgment delivered on 15 March 2023</p>
+      <p>[2023] HKCFA 15</p>
+    </header>
+    <nav>Home | Databases</nav>
+    <div class="judgment">
+      <p>Before: Mr Justice Ribeiro, Chief Justice Cheung and Fok PJ.</p>
+      <p>Mr Justice Ribeiro delivered the judgment of the Court.</p>
+    </div>
+  </body>
+</html>
+"""
+
+_FILLER = "<p>" + "Lorem ipsum. " * (_HEADER_CHARS // 10) + "</p>"
+
+
+@pytest.fixture
+def scraper():
+    """Fresh HKLIIScraper instance."""
+    return HKLIIScraper(cache_disabled=True)
+
+
+def _parse(scraper, html: str, url: str = _CASE_URL):
+    return scraper._parse_case_detail(scraper._parse_tree(html.encode()), url)
+
+
+class TestHKLIICaseDetail:
+    """Tests for HKLIIScraper._parse_case_detail."""
+
+    def test_header_facts_outside_judgment(self, scraper):
+        """Court, date and citation are found outside the judgment container."""
+        case = _parse(scraper, _HEADER_LAYOUT)
+
+        assert case.case_name == "HKSAR v. Lai Chee Ying"
+        assert case.court == "Court of Final Appeal"
+        assert case.date == datetime(2023, 3, 15)
+        assert case.citations == ["[2023] HKCFA 15"]
+
+    def test_full_text_from_judgment(self, scraper):
+        """Judgment text excludes the page header and navigation."""
+        case = _parse(scraper, _HEADER_LAYOUT)
+
+        assert case.full_text.startswith("Before: Mr Justice Ribeiro")
+        assert "Home | Databases" not in case.full_text
+
+    def test_judges_deduplicated(self, scraper):
+        """Judges keep page order, lose their suffixes and appear once."""
+        case = _parse(scraper, _HEADER_LAYOUT)
+
+        assert case.judges == ["Ribeiro", "Cheung", "Fok"]
+
+    def test_case_id_from_url(self, scraper):
+        """The case ID is the court/year/number path of the case URL."""
+        case = _parse(scraper, _HEADER_LAYOUT)
+
+        assert case.case_id == "hk/cases/hkcfa/2023/15"
+
+    def test_citation_kinds(self, scraper):
+        """Neutral, unbracketed and law report citations are all collected."""
+        case = _parse(
+            scraper,
+            "<html><body><div class='judgment'>"
+            "[2023] HKCFA 15; 2022 HKCA 7; [2021] 3 HKC 22"
+            "</div></body></html>",
+        )
+
+        assert case.citations == ["[2023] HKCFA 15", "[2022] HKCA 7", "[2021] 3 HKC"]
+
+    def test_invalid_date_falls_through(self, scraper):
+        """An impossible date is skipped in favour of the next format."""
+        case = _parse(
+            scraper,
+            "<html><body><p>Decided 31/02/2020, handed down 2020-03-04</p>"
+            "</body></html>",
+        )
+
+        assert case.date == datetime(2020, 3, 4)
+
+    def test_long_page_fallback(self, scraper):
+        """Facts missing from the opening text are found further down."""
+        case = _parse(
+            scraper,
+            f"<html><body>{_FILLER}"
+            "<p>District Court, 2 January 2020, [2020] HKCFI 7</p>"
+            "</body></html>",
+        )
+
+        assert case.court == "District Court"
+        assert case.date == datetime(2020, 1, 2)
+        assert case.citations == ["[2020] HKCFI 7"]
+
+    def test_opening_citations_win(self, scraper):
+        """Citations in the opening text stop the scan of the rest."""
+        case = _parse(
+            scraper,
+            "<html><body><p>Court of Appeal, 1 June 2021, [2021] HKCA 3</p>"
+            f"{_FILLER}<p>[2019] HKCFI 9</p></body></html>",
+        )
+
+        assert case.citations == ["[2021] HKCA 3"]
+
+    def test_parties(self, scraper):
+        """Parties are split from a "v." case name."""
+        case = _parse(
+            scraper,
+            "<html><head><title>Chan Limited v. Wong Ltd</title></head>"
+            "<body></body></html>",
+        )
+
+        assert case.parties == ["Chan Limited", "Wong Ltd"]
+
+
+class TestHKLIISearch:
+    """Tests for HKLIIScraper.search_cases."""
+
+    _SEARCH_PAGE = """<?xml version="1.0" encoding="UTF-8"?>
+    <html><body>
+      <a href="/help">Help</a>
+      <a href="/hk/cases/hkcfa/2023/15.html">HKSAR v Lai</a>
+      <a href="/hk/cases/hkca/2021/3.html">Two</a>
+      <a href="/hk/cases/hkdc/2020/9.html">Three</a>
+    </body></html>
+    """
+
+    def test_search_parses_case_links(self, scraper, monkeypatch, html_response):
+        """Only case links are returned, in page order, up to the limit."""
+        monkeypatch.setattr(
+            scraper, "_make_request", lambda *a, **k: html_response(self._SEARCH_PAGE)
+        )
+
+        cases = scraper.search_cases(query="basic law", limit=2)
+
+        assert [case.case_name for case in cases] == ["HKSAR v Lai", "Two"]
+        assert [case.case_id for case in cases] == [
+            "hk/cases/hkcfa/2023/15",
+            "hk/cases/hkca/2021/3",
+        ]
+        assert cases[0].url == _CASE_URL
+
+    def test_get_case_by_id(self, scraper, monkeypatch, html_response):
+        """A case path is fetched and parsed into full case details."""
+        monkeypatch.setattr(
+            scraper, "_make_request", lambda *a, **k: html_response(_HEADER_LAYOUT)
+        )
+
+        case = scraper.get_case_by_id("hk/cases/hkcfa/2023/15")
+
+        assert case.court == "Court of Final Appeal"
+        assert case.citations == ["[2023] HKCFA 15"]
@@ -2,6 +2,8 @@
 Tests for data models.
 """
 
+import sys
+
 import pytest
 from datetime import datetime
 
@@ -11,63 +13,79 @@ from the_junior_associate.utils.data_models import CaseData
 class TestCaseData:
     """Tests for CaseData model."""
 
-    def test_case_data_creation(self):
-        """Test basic CaseData creation."""
-        case = CaseData(
-            case_name="Test Case",
-            case_id="TEST-001",
-            court="Test Court",
-            date=datetime(2023, 1, 15),
-            url="https://example.com/test-001",
-            jurisdiction="Test Jurisdiction",
-        )
-
-        assert case.case_name == "Test Case"
-        assert case.case_id == "TEST-001"
-        assert case.court == "Test Court"
-        assert case.date == datetime(2023, 1, 15)
-        assert case.url == "https://example.com/test-001"
-        assert case.jurisdiction == "Test Jurisdiction"
-
-    def test_case_data_optional_fields(self):
-        """Test CaseData with optional fields."""
-        case = CaseData(
-            case_name="Test Case",
-            case_id="TEST-001",
-            summary="Test summary",
-            judges=["Judge A", "Judge B"],
-            parties=["Party 1", "Party 2"],
-            citations=["2023 TC 1"],
-            legal_issues=["Contract Law"],
-            case_type="Civil",
-            metadata={"source": "TestScraper"},
-        )
-
-        assert case.summary == "Test summary"
-        assert case.judges == ["Judge A", "Judge B"]
-        assert case.parties == ["Party 1", "Party 2"]
-        assert case.citations == ["2023 TC 1"]
-        assert case.legal_issues == ["Contract Law"]
-        assert case.case_type == "Civil"
-        assert case.metadata == {"source": "TestScraper"}
-
-    def test_case_data_defaults(self):
-        """Test CaseData default values."""
-        case = CaseData(case_name="Test Case")
-
-        assert case.case_id is None
-        assert case.court is None
-        assert case.date is None
-        assert case.url is None
-        assert case.summary is None
-        assert case.full_text is None
-        assert case.judges == []
-        assert case.parties == []
-        assert case.citations == []
-        assert case.legal_issues == []
-        assert case.case_type is None
-        assert case.jurisdiction is None
-        assert case.metadata == {}
+    @pytest.mark.parametrize(
+        "kwargs,expected",
+        [
+            # Basic creation
+            (
+                {
+                    "case_name": "Test Case",
+                    "case_id": "TEST-001",
+                    "court": "Test Court",
+                    "date": datetime(2023, 1, 15),
+                    "url": "https://example.com/test-001",
+                    "jurisdiction": "Test Jurisdiction",
+                },
+                {
+                    "case_name": "Test Case",
+                    "case_id": "TEST-001",
+                    "court": "Test Court",
+                    "date": datetime(2023, 1, 15),
+                    "url": "https://example.com/test-001",
+                    "jurisdiction": "Test Jurisdiction",
+                },
+            ),
+            # Optional fields
+            (
+                {
+                    "case_name": "Test Case",
+                    "case_id": "TEST-001",
+                    "summary": "Test summary",
+                    "judges": ["Judge A", "Judge B"],
+                    "parties": ["Party 1", "Party 2"],
+                    "citations": ["2023 TC 1"],
+                    "legal_issues": ["Contract Law"],
+                    "case_type": "Civil",
+                    "metadata": {"source": "TestScraper"},
+                },
+                {
+                    "summary": "Test summary",
+                    "judges": ["Judge A", "Judge B"],
+                    "parties": ["Party 1", "Party 2"],
+                    "citations": ["2023 TC 1"],
+                    "legal_issues": ["Contract Law"],
+                    "case_type": "Civil",
+                    "metadata": {"source": "TestScraper"},
+                },
+            ),
+            # Defaults
+            (
+                {"case_name": "Test Case"},
+                {
+                    "case_id": None,
+                    "court": None,
+                    "date": None,
+                    "url": None,
+                    "summary": None,
+                    "full_text": None,
+                    "judges": [],
+                    "parties": [],
+                    "citations": [],
+                    "legal_issues": [],
+                    "case_type": None,
+                    "jurisdiction": None,
+                    "metadata": {},
+                },
+            ),
+        ],
+        ids=["creation", "optional_fields", "defaults"],
+    )
+    def test_case_data_fields(self, kwargs, expected):
+        """Test CaseData construction with explicit and default values."""
+        case = CaseData(**kwargs)
+
+        for attr, value in expected.items():
+            assert getattr(case, attr) == value
 
     def test_case_data_repr(self):
         """Test CaseData string representation."""
@@ -106,3 +124,11 @@ class TestCaseData:
 
         case.legal_issues.append("Contract Law")
         assert "Contract Law" in case.legal_issues
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slots need 3.10+")
+    def test_case_data_uses_slots(self):
+        """Test that CaseData instances carry no per-instance __dict__."""
+        case = CaseData(case_name="Test Case", date=datetime(2023, 1, 15))
+
+        assert not hasattr(case, "__dict__")
+        assert case.to_dict()["date"] == "2023-01-15T00:00:00"
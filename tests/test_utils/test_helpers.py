@@ -2,18 +2,25 @@
 Tests for utility helper functions.
 """
 
+import re
+import uuid
+
 import pytest
 from datetime import datetime
 
 from the_junior_associate.utils.helpers import (
     validate_date,
     sanitize_text,
+    sanitize_texts,
     setup_logger,
     normalize_court_name,
     extract_case_id_from_url,
     build_search_url,
+    compile_pattern,
 )
 
+_VIEW_RE = re.compile(r"/view/(\d+)")
+
 
 class TestValidateDate:
     """Tests for validate_date function."""
@@ -23,6 +30,11 @@ class TestValidateDate:
         result = validate_date("2023-01-15")
         assert result == datetime(2023, 1, 15)
 
+    def test_validate_date_with_non_iso_string(self):
+        """Test date validation falls back to dateutil for other formats."""
+        result = validate_date("15 January 2023")
+        assert result == datetime(2023, 1, 15)
+
     def test_validate_date_with_datetime(self):
         """Test date validation with datetime input."""
         date = datetime(2023, 1, 15)
@@ -43,36 +55,34 @@ class TestValidateDate:
 class TestSanitizeText:
     """Tests for sanitize_text function."""
 
-    def test_sanitize_basic_text(self):
-        """Test basic text sanitization."""
-        result = sanitize_text("  Hello World  ")
-        assert result == "Hello World"
-
-    def test_sanitize_empty_text(self):
-        """Test sanitization of empty text."""
-        result = sanitize_text("")
-        assert result == ""
-
-    def test_sanitize_none_text(self):
-        """Test sanitization of None."""
-        result = sanitize_text(None)
-        assert result == ""
-
-    def test_sanitize_html_entities(self):
-        """Test sanitization of HTML entities."""
-        result = sanitize_text("Hello&nbsp;World&amp;Test")
-        assert result == "Hello World&Test"
-
-    def test_sanitize_multiple_spaces(self):
-        """Test sanitization of multiple spaces."""
-        result = sanitize_text("Hello    World\n\nTest")
-        assert result == "Hello World Test"
-
-    def test_sanitize_unicode_quotes(self):
-        """Test sanitization of Unicode quotes."""
-        text_with_smart_quotes = "\u201cHello\u201d and \u2018World\u2019"
-        result = sanitize_text(text_with_smart_quotes)
-        assert result == "\"Hello\" and 'World'"
+    @pytest.mark.parametrize(
+        "text,expected",
+        [
+            ("  Hello World  ", "Hello World"),
+            ("", ""),
+            (None, ""),
+            ("Hello&nbsp;World&amp;Test", "Hello World&Test"),
+            ("Hello    World\n\nTest", "Hello World Test"),
+            ("\u201cHello\u201d and \u2018World\u2019", "\"Hello\" and 'World'"),
+        ],
+        ids=[
+            "basic",
+            "empty",
+            "none",
+            "html_entities",
+            "multiple_spaces",
+            "unicode_quotes",
+        ],
+    )
+    def test_sanitize_text(self, text, expected):
+        """Test text sanitization."""
+        assert sanitize_text(text) == expected
+
+    def test_sanitize_texts_matches_sanitize_text(self):
+        """Test that batch sanitization matches item-by-item sanitization."""
+        texts = ["  Hello&nbsp;World ", None, "", "\u201cA\u201d\n\tB", " x "]
+        assert sanitize_texts(texts) == [sanitize_text(text) for text in texts]
+        assert sanitize_texts([]) == []
 
 
 class TestNormalizeCourtName:
@@ -100,8 +110,7 @@ class TestExtractCaseIdFromUrl:
     def test_extract_valid_case_id(self):
         """Test extraction of valid case ID."""
         url = "https://example.com/cases/view/12345"
-        pattern = r"/view/(\d+)"
-        result = extract_case_id_from_url(url, pattern)
+        result = extract_case_id_from_url(url, _VIEW_RE)
         assert result == "12345"
 
     def test_extract_no_match(self):
@@ -116,6 +125,11 @@ class TestExtractCaseIdFromUrl:
         result = extract_case_id_from_url("", "")
         assert result is None
 
+    def test_extract_with_compiled_pattern(self):
+        """Test extraction with a pattern from compile_pattern."""
+        pattern = compile_pattern(r"/view/(\d+)")
+        assert extract_case_id_from_url("https://example.com/view/42", pattern) == "42"
+
 
 class TestBuildSearchUrl:
     """Tests for build_search_url function."""
@@ -154,10 +168,11 @@ class TestSetupLogger:
 
     def test_setup_logger_no_duplicate_handlers(self):
         """Test that duplicate handlers are not added."""
-        logger1 = setup_logger("test_logger_dup")
+        name = f"test_logger_{uuid.uuid4().hex}"
+        logger1 = setup_logger(name)
         handler_count1 = len(logger1.handlers)
 
-        logger2 = setup_logger("test_logger_dup")
+        logger2 = setup_logger(name)
         handler_count2 = len(logger2.handlers)
 
         assert handler_count1 == handler_count2
@@ -6,6 +6,9 @@ Author: The Junior Associate Contributors
 License: MIT
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "1.0.0"
 __author__ = "The Junior Associate Contributors"
 __email__ = "contributors@thejuniorassociate.org"
@@ -13,26 +16,6 @@ __description__ = (
     "A polished Python library for scraping legal case law from multiple jurisdictions"
 )
 
-from .scrapers import (
-    CourtListenerScraper,
-    FindLawScraper,
-    AustLIIScraper,
-    CanLIIScraper,
-    BAILIIScraper,
-    SingaporeJudiciaryScraper,
-    IndianKanoonScraper,
-    HKLIIScraper,
-    LegifranceScraper,
-    GermanLawArchiveScraper,
-    CuriaEuropaScraper,
-    WorldLIIScraper,
-    WorldCourtsScraper,
-    SupremeCourtIndiaScraper,
-    KenyaLawScraper,
-    SupremeCourtJapanScraper,
-    LegalToolsScraper,
-)
-
 from .utils import (
     CaseData,
     ScrapingError,
@@ -75,3 +58,43 @@ __all__ = [
     "sanitize_text",
     "setup_logger",
 ]
+
+# Scrapers are imported on first attribute access (PEP 562) so that importing
+# the utilities does not pull in every scraper module.
+_LAZY_IMPORTS = {name: ".scrapers" for name in __all__ if name.endswith("Scraper")}
+
+if TYPE_CHECKING:
+    from .scrapers import (
+        CourtListenerScraper,
+        FindLawScraper,
+        AustLIIScraper,
+        CanLIIScraper,
+        BAILIIScraper,
+        SingaporeJudiciaryScraper,
+        IndianKanoonScraper,
+        HKLIIScraper,
+        LegifranceScraper,
+        GermanLawArchiveScraper,
+        CuriaEuropaScraper,
+        WorldLIIScraper,
+        WorldCourtsScraper,
+        SupremeCourtIndiaScraper,
+        KenyaLawScraper,
+        SupremeCourtJapanScraper,
+        LegalToolsScraper,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """Import scraper classes lazily on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    """Include lazily imported names in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
@@ -3,80 +3,144 @@ Command-line interface for The Junior Associate library.
 """
 
 import argparse
+import atexit
+import csv
+import functools
+import importlib
+import io
 import json
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
-
-from . import (
-    CourtListenerScraper,
-    FindLawScraper,
-    AustLIIScraper,
-    CanLIIScraper,
-    BAILIIScraper,
-    SingaporeJudiciaryScraper,
-    IndianKanoonScraper,
-    HKLIIScraper,
-    LegifranceScraper,
-    GermanLawArchiveScraper,
-    CuriaEuropaScraper,
-    WorldLIIScraper,
-    WorldCourtsScraper,
-    SupremeCourtIndiaScraper,
-    KenyaLawScraper,
-    SupremeCourtJapanScraper,
-    LegalToolsScraper,
-    CaseData,
-    setup_logger,
-)
+from typing import Iterator, List, NamedTuple, Optional
+
+from .utils import CaseData, setup_logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Package the scraper modules live in
+_PACKAGE = "the_junior_associate.scrapers"
 
-# Available scrapers mapping
+# Available scrapers mapping, as "module:Class" paths so that only the
+# scraper actually used gets imported
 SCRAPERS = {
-    "courtlistener": CourtListenerScraper,
-    "findlaw": FindLawScraper,
-    "austlii": AustLIIScraper,
-    "canlii": CanLIIScraper,
-    "bailii": BAILIIScraper,
-    "singapore": SingaporeJudiciaryScraper,
-    "indian-kanoon": IndianKanoonScraper,
-    "hklii": HKLIIScraper,
-    "legifrance": LegifranceScraper,
-    "german-law": GermanLawArchiveScraper,
-    "curia-europa": CuriaEuropaScraper,
-    "worldlii": WorldLIIScraper,
-    "worldcourts": WorldCourtsScraper,
-    "supremecourt-india": SupremeCourtIndiaScraper,
-    "kenya-law": KenyaLawScraper,
-    "supremecourt-japan": SupremeCourtJapanScraper,
-    "legal-tools": LegalToolsScraper,
+    "courtlistener": f"{_PACKAGE}.courtlistener:CourtListenerScraper",
+    "findlaw": f"{_PACKAGE}.findlaw:FindLawScraper",
+    "austlii": f"{_PACKAGE}.austlii:AustLIIScraper",
+    "canlii": f"{_PACKAGE}.canlii:CanLIIScraper",
+    "bailii": f"{_PACKAGE}.bailii:BAILIIScraper",
+    "singapore": f"{_PACKAGE}.singapore_judiciary:SingaporeJudiciaryScraper",
+    "indian-kanoon": f"{_PACKAGE}.indian_kanoon:IndianKanoonScraper",
+    "hklii": f"{_PACKAGE}.hklii:HKLIIScraper",
+    "legifrance": f"{_PACKAGE}.legifrance:LegifranceScraper",
+    "german-law": f"{_PACKAGE}.german_law_archive:GermanLawArchiveScraper",
+    "curia-europa": f"{_PACKAGE}.curia_europa:CuriaEuropaScraper",
+    "worldlii": f"{_PACKAGE}.worldlii:WorldLIIScraper",
+    "worldcourts": f"{_PACKAGE}.worldcourts:WorldCourtsScraper",
+    "supremecourt-india": f"{_PACKAGE}.supremecourt_india:SupremeCourtIndiaScraper",
+    "kenya-law": f"{_PACKAGE}.kenya_law:KenyaLawScraper",
+    "supremecourt-japan": f"{_PACKAGE}.supremecourt_japan:SupremeCourtJapanScraper",
+    "legal-tools": f"{_PACKAGE}.legal_tools:LegalToolsScraper",
 }
 
+# CaseData fields emitted by the json output format
+JSON_FIELDS = (
+    "case_name",
+    "case_id",
+    "court",
+    "date",
+    "url",
+    "summary",
+    "jurisdiction",
+    "citations",
+    "judges",
+    "parties",
+    "legal_issues",
+    "case_type",
+    "metadata",
+)
+
+# Fallback encoder for when orjson is not installed, built once per process
+_JSON_ENCODER = json.JSONEncoder(
+    indent=2,
+    ensure_ascii=False,
+    default=lambda value: (
+        value.isoformat() if isinstance(value, datetime) else str(value)
+    ),
+)
+
+# Column order of the csv output format
+CSV_FIELDS = ("case_name", "case_id", "court", "date", "url", "jurisdiction")
+
+
+def load_scraper(name: str) -> type:
+    """Import and return the scraper class registered under ``name``."""
+    module_path, class_name = SCRAPERS[name].split(":")
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+@functools.lru_cache(maxsize=None)
+def get_scraper(name: str, cache_disabled: bool = False, respect_robots: bool = False):
+    """
+    Return the process-wide scraper instance registered under ``name``.
+
+    Commands run in the same process (e.g. when main() is called from a
+    script) reuse the instance and with it the pooled HTTP session. Every
+    instance is closed at interpreter exit.
+    """
+    scraper = load_scraper(name)(
+        cache_disabled=cache_disabled, respect_robots=respect_robots
+    )
+    atexit.register(scraper.close)
+    return scraper
+
+
+class ScraperFailure(NamedTuple):
+    """A scraper that raised during a multi-scraper search."""
+
+    name: str
+    error: Exception
+
+
+# Queue sentinel marking the end of one scraper's results
+_SEARCH_DONE = object()
+
+
+def csv_row(case: CaseData) -> list:
+    """Return the csv output columns for a case, in CSV_FIELDS order."""
+    return [
+        case.case_name,
+        case.case_id,
+        case.court,
+        case.date.isoformat() if case.date else None,
+        case.url,
+        case.jurisdiction,
+    ]
+
 
 def format_case_output(case: CaseData, format_type: str = "text") -> str:
     """Format case data for output."""
     if format_type == "json":
-        return json.dumps(
-            {
-                "case_name": case.case_name,
-                "case_id": case.case_id,
-                "court": case.court,
-                "date": case.date.isoformat() if case.date else None,
-                "url": case.url,
-                "summary": case.summary,
-                "jurisdiction": case.jurisdiction,
-                "citations": case.citations,
-                "judges": case.judges,
-                "parties": case.parties,
-                "legal_issues": case.legal_issues,
-                "case_type": case.case_type,
-                "metadata": case.metadata,
-            },
-            indent=2,
-            ensure_ascii=False,
-        )
+        data = {}
+        for name in JSON_FIELDS:
+            value = getattr(case, name)
+            if value is not None:
+                data[name] = value
+        if orjson is not None:
+            payload = orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+            return payload.decode("utf-8")
+        return _JSON_ENCODER.encode(data)
     elif format_type == "csv":
-        return f'"{case.case_name}","{case.case_id}","{case.court}","{case.date}","{case.url}","{case.jurisdiction}"'
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator="").writerow(csv_row(case))
+        return buffer.getvalue()
     else:  # text format
         output = []
         output.append(f"Case: {case.case_name}")
@@ -97,50 +161,136 @@ def format_case_output(case: CaseData, format_type: str = "text") -> str:
         return "\n".join(output)
 
 
-def search_command(args) -> None:
-    """Execute search command."""
-    logger = setup_logger("cli", level=args.verbose)
+def _search_one(name: str, args, results: queue.Queue) -> None:
+    """Run one scraper's search, feeding cases (or its error) into results."""
+    try:
+        scraper = get_scraper(name, args.no_cache, args.respect_robots)
+        cases = scraper.iter_search_cases(
+            query=args.query,
+            start_date=args.start_date,
+            end_date=args.end_date,
+            court=args.court,
+            limit=args.limit,
+        )
+        for case in islice(cases, args.limit):
+            results.put(case)
+    except Exception as e:
+        results.put(ScraperFailure(name, e))
+    finally:
+        results.put(_SEARCH_DONE)
 
-    if args.scraper not in SCRAPERS:
-        print(f"Error: Unknown scraper '{args.scraper}'", file=sys.stderr)
-        print(f"Available scrapers: {', '.join(SCRAPERS.keys())}", file=sys.stderr)
-        sys.exit(1)
 
-    scraper_class = SCRAPERS[args.scraper]
+def iter_search_results(names: List[str], args) -> Iterator:
+    """
+    Search several scrapers concurrently, yielding results as they arrive.
+
+    Each scraper runs on its own thread and keeps its own rate limiter, so
+    requests to any one site are paced exactly as for a single search.
 
+    Args:
+        names: Scraper names to search
+        args: Parsed search command arguments
+
+    Yields:
+        CaseData objects, or ScraperFailure for a scraper that raised
+    """
+    results = queue.Queue()
+    executor = ThreadPoolExecutor(max_workers=len(names))
     try:
-        with scraper_class() as scraper:
-            logger.info(f"Searching {args.scraper} for: {args.query}")
+        for name in names:
+            executor.submit(_search_one, name, args, results)
+
+        pending = len(names)
+        while pending:
+            item = results.get()
+            if item is _SEARCH_DONE:
+                pending -= 1
+            else:
+                yield item
+    finally:
+        # Don't make Ctrl-C or a failing consumer wait for the other searches
+        executor.shutdown(wait=False, cancel_futures=True)
 
-            cases = scraper.search_cases(
-                query=args.query,
-                start_date=args.start_date,
-                end_date=args.end_date,
-                court=args.court,
-                limit=args.limit,
-            )
 
-            if not cases:
-                print("No cases found.")
-                return
+def search_command(args) -> None:
+    """Execute search command."""
+    logger = setup_logger("cli", level=args.verbose)
+
+    if args.scraper == "all":
+        names = list(SCRAPERS)
+    else:
+        # A trailing or doubled comma leaves an empty name; ignore it
+        names = list(
+            dict.fromkeys(filter(None, (n.strip() for n in args.scraper.split(","))))
+        )
 
-            print(f"Found {len(cases)} cases:\n")
+    unknown = [name for name in names if name not in SCRAPERS]
+    if unknown or not names:
+        print(f"Error: Unknown scraper '{', '.join(unknown)}'", file=sys.stderr)
+        print(f"Available scrapers: {', '.join(SCRAPERS.keys())}", file=sys.stderr)
+        sys.exit(1)
 
-            for case in cases:
-                output = format_case_output(case, args.format)
-                print(output)
+    logger.info(f"Searching {', '.join(names)} for: {args.query}")
 
-                if args.output:
-                    with open(args.output, "a", encoding="utf-8") as f:
+    # Results are printed as they arrive rather than after every search
+    # completes; the output file is only opened once there is a case to write
+    count = 0
+    failures = 0
+    try:
+        with ExitStack() as stack:
+            f = None
+            # csv rows go straight to one writer per sink
+            csv_writers = []
+
+            for case in iter_search_results(names, args):
+                if isinstance(case, ScraperFailure):
+                    failures += 1
+                    logger.error(f"Search failed on {case.name}: {case.error}")
+                    print(f"Error ({case.name}): {case.error}", file=sys.stderr)
+                    continue
+
+                if count == 0:
+                    sinks = [sys.stdout]
+                    if args.output:
+                        f = stack.enter_context(
+                            open(args.output, "a", encoding="utf-8")
+                        )
+                        sinks.append(f)
+                    if args.format == "csv":
+                        csv_writers = [
+                            csv.writer(sink, lineterminator="\n") for sink in sinks
+                        ]
+                        # A file appended to already has its header
+                        for sink, writer in zip(sinks, csv_writers):
+                            if sink is sys.stdout or not sink.tell():
+                                writer.writerow(CSV_FIELDS)
+
+                if csv_writers:
+                    row = csv_row(case)
+                    for writer in csv_writers:
+                        writer.writerow(row)
+                else:
+                    output = format_case_output(case, args.format)
+                    print(output)
+                    if f:
                         f.write(output + "\n")
-
-            logger.info(f"Search completed. Found {len(cases)} cases.")
+                count += 1
 
     except Exception as e:
         logger.error(f"Search failed: {str(e)}")
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
 
+    if failures == len(names):
+        sys.exit(1)
+
+    if not count:
+        print("No cases found.")
+        return
+
+    print(f"\nFound {count} cases.")
+    logger.info(f"Search completed. Found {count} cases.")
+
 
 def get_case_command(args) -> None:
     """Execute get case command."""
@@ -151,26 +301,24 @@ def get_case_command(args) -> None:
         print(f"Available scrapers: {', '.join(SCRAPERS.keys())}", file=sys.stderr)
         sys.exit(1)
 
-    scraper_class = SCRAPERS[args.scraper]
-
     try:
-        with scraper_class() as scraper:
-            logger.info(f"Getting case {args.case_id} from {args.scraper}")
+        scraper = get_scraper(args.scraper, args.no_cache, args.respect_robots)
+        logger.info(f"Getting case {args.case_id} from {args.scraper}")
 
-            case = scraper.get_case_by_id(args.case_id)
+        case = scraper.get_case_by_id(args.case_id)
 
-            if not case:
-                print(f"Case '{args.case_id}' not found.")
-                return
+        if not case:
+            print(f"Case '{args.case_id}' not found.")
+            return
 
-            output = format_case_output(case, args.format)
-            print(output)
+        output = format_case_output(case, args.format)
+        print(output)
 
-            if args.output:
-                with open(args.output, "w", encoding="utf-8") as f:
-                    f.write(output)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                f.write(output)
 
-            logger.info(f"Case retrieval completed.")
+        logger.info(f"Case retrieval completed.")
 
     except Exception as e:
         logger.error(f"Case retrieval failed: {str(e)}")
@@ -212,11 +360,13 @@ def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="junior-associate",
         description="The Junior Associate - Legal case law scraper",
+        allow_abbrev=False,
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Examples:
   junior-associate search courtlistener "privacy rights" --limit 10
   junior-associate search canlii "charter rights" --start-date 2023-01-01
+  junior-associate search austlii,bailii,canlii "negligence" --limit 5
   junior-associate get-case courtlistener "12345"
   junior-associate list-scrapers
         """,
@@ -228,12 +378,27 @@ Examples:
     parser.add_argument(
         "--verbose", "-v", action="count", default=0, help="Increase verbosity"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the on-disk HTTP response cache",
+    )
+    parser.add_argument(
+        "--respect-robots",
+        action="store_true",
+        help="Skip URLs disallowed by each site's robots.txt",
+    )
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
     # Search command
-    search_parser = subparsers.add_parser("search", help="Search for cases")
-    search_parser.add_argument("scraper", help="Scraper to use")
+    search_parser = subparsers.add_parser(
+        "search", help="Search for cases", allow_abbrev=False
+    )
+    search_parser.add_argument(
+        "scraper",
+        help="Scraper to use, a comma-separated list of scrapers, or 'all'",
+    )
     search_parser.add_argument("query", help="Search query")
     search_parser.add_argument("--start-date", help="Start date (YYYY-MM-DD)", type=str)
     search_parser.add_argument("--end-date", help="End date (YYYY-MM-DD)", type=str)
@@ -251,7 +416,9 @@ Examples:
     search_parser.set_defaults(func=search_command)
 
     # Get case command
-    get_parser = subparsers.add_parser("get-case", help="Get specific case by ID")
+    get_parser = subparsers.add_parser(
+        "get-case", help="Get specific case by ID", allow_abbrev=False
+    )
     get_parser.add_argument("scraper", help="Scraper to use")
     get_parser.add_argument("case_id", help="Case ID")
     get_parser.add_argument(
@@ -272,6 +439,8 @@ Examples:
 
 def main() -> None:
     """Main CLI entry point."""
+    import logging
+
     parser = create_parser()
     args = parser.parse_args()
 
@@ -281,16 +450,10 @@ def main() -> None:
 
     # Set verbosity level
     if args.verbose >= 2:
-        import logging
-
         verbosity = logging.DEBUG
     elif args.verbose >= 1:
-        import logging
-
         verbosity = logging.INFO
     else:
-        import logging
-
         verbosity = logging.WARNING
 
     args.verbose = verbosity
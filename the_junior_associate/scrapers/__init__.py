@@ -2,23 +2,8 @@
 Legal case scrapers for The Junior Associate library.
 """
 
-from .courtlistener import CourtListenerScraper
-from .findlaw import FindLawScraper
-from .austlii import AustLIIScraper
-from .canlii import CanLIIScraper
-from .bailii import BAILIIScraper
-from .singapore_judiciary import SingaporeJudiciaryScraper
-from .indian_kanoon import IndianKanoonScraper
-from .hklii import HKLIIScraper
-from .legifrance import LegifranceScraper
-from .german_law_archive import GermanLawArchiveScraper
-from .curia_europa import CuriaEuropaScraper
-from .worldlii import WorldLIIScraper
-from .worldcourts import WorldCourtsScraper
-from .supremecourt_india import SupremeCourtIndiaScraper
-from .kenya_law import KenyaLawScraper
-from .supremecourt_japan import SupremeCourtJapanScraper
-from .legal_tools import LegalToolsScraper
+import importlib
+from typing import TYPE_CHECKING, Any
 
 __all__ = [
     "CourtListenerScraper",
@@ -39,3 +24,59 @@ __all__ = [
     "SupremeCourtJapanScraper",
     "LegalToolsScraper",
 ]
+
+# Each scraper module is imported on first attribute access (PEP 562), so
+# loading one scraper does not import the other sixteen.
+_LAZY_IMPORTS = {
+    "CourtListenerScraper": ".courtlistener",
+    "FindLawScraper": ".findlaw",
+    "AustLIIScraper": ".austlii",
+    "CanLIIScraper": ".canlii",
+    "BAILIIScraper": ".bailii",
+    "SingaporeJudiciaryScraper": ".singapore_judiciary",
+    "IndianKanoonScraper": ".indian_kanoon",
+    "HKLIIScraper": ".hklii",
+    "LegifranceScraper": ".legifrance",
+    "GermanLawArchiveScraper": ".german_law_archive",
+    "CuriaEuropaScraper": ".curia_europa",
+    "WorldLIIScraper": ".worldlii",
+    "WorldCourtsScraper": ".worldcourts",
+    "SupremeCourtIndiaScraper": ".supremecourt_india",
+    "KenyaLawScraper": ".kenya_law",
+    "SupremeCourtJapanScraper": ".supremecourt_japan",
+    "LegalToolsScraper": ".legal_tools",
+}
+
+if TYPE_CHECKING:
+    from .courtlistener import CourtListenerScraper
+    from .findlaw import FindLawScraper
+    from .austlii import AustLIIScraper
+    from .canlii import CanLIIScraper
+    from .bailii import BAILIIScraper
+    from .singapore_judiciary import SingaporeJudiciaryScraper
+    from .indian_kanoon import IndianKanoonScraper
+    from .hklii import HKLIIScraper
+    from .legifrance import LegifranceScraper
+    from .german_law_archive import GermanLawArchiveScraper
+    from .curia_europa import CuriaEuropaScraper
+    from .worldlii import WorldLIIScraper
+    from .worldcourts import WorldCourtsScraper
+    from .supremecourt_india import SupremeCourtIndiaScraper
+    from .kenya_law import KenyaLawScraper
+    from .supremecourt_japan import SupremeCourtJapanScraper
+    from .legal_tools import LegalToolsScraper
+
+
+def __getattr__(name: str) -> Any:
+    """Import scraper classes lazily on first access."""
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list:
+    """Include lazily imported names in ``dir()``."""
+    return sorted(set(globals()) | set(__all__))
@@ -5,15 +5,96 @@ AustLII (Australasian Legal Information Institute) provides free access
 to Australian and New Zealand case law and legislation.
 """
 
-import re
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from itertools import chain
+from typing import Iterator, List, Optional, Dict, Any, Union
 from urllib.parse import urlencode, quote
 
+from lxml import etree
+
 from ..utils.base import BaseScraper
 from ..utils.data_models import CaseData
 from ..utils.exceptions import ParsingError, DataNotFoundError
-from ..utils.helpers import sanitize_text, validate_date, normalize_court_name
+from ..utils.helpers import (
+    sanitize_text,
+    validate_date,
+    normalize_court_name,
+    compile_pattern,
+)
+
+_COURT_RE = compile_pattern(
+    r"High Court of Australia|Federal Court of Australia"
+    r"|NSW Court of Appeal|Victorian Court of Appeal"
+)
+_MONTHS = {
+    "January": 1,
+    "February": 2,
+    "March": 3,
+    "April": 4,
+    "May": 5,
+    "June": 6,
+    "July": 7,
+    "August": 8,
+    "September": 9,
+    "October": 10,
+    "November": 11,
+    "December": 12,
+}
+# Day-month-year in words, ISO, or d/m/y, with the parts captured directly
+_DATE_RE = compile_pattern(
+    r"(?P<day>\d{1,2})\s+(?P<month_name>" + "|".join(_MONTHS) + r")\s+(?P<year>\d{4})"
+    r"|(?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2})"
+    r"|(?P<dmy_day>\d{1,2})/(?P<dmy_month>\d{1,2})/(?P<dmy_year>\d{4})"
+)
+# Bracketed medium-neutral citations, or unbracketed High Court ones
+_CITATION_RE = compile_pattern(r"(?:\[(\d{4})\]\s+([A-Z]+)|(\d{4})\s+(HCA))\s+(\d+)")
+_JUDGE_RES = (
+    compile_pattern(r"(?:Justice|J\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"),
+    compile_pattern(r"([A-Z][a-z]+\s+J\.?)"),
+)
+# Candidate judgment containers, ranked by _CONTENT_RANK
+_CONTENT_XPATH = etree.XPath(
+    '//div[@id="main"]'
+    ' | //div[contains(concat(" ", normalize-space(@class), " "), " judgment ")]'
+    ' | //div[contains(concat(" ", normalize-space(@class), " "), " content ")]'
+)
+_CONTENT_RANK = {"judgment": 0, "content": 1}
+# Evaluated by libxml2 in C, compiled once rather than per search
+_CASE_LINKS_XPATH = etree.XPath('//a[contains(@href, "/au/cases/")]')
+_CASE_ID_RE = compile_pattern(r"/au/cases/([^/]+/[^/]+/[^/]+/\d+/\d+)")
+
+
+def _match_to_date(match) -> datetime:
+    """Build a datetime from a _DATE_RE match without going through strptime."""
+    if match.group("month_name"):
+        day, month, year = (
+            match.group("day"),
+            _MONTHS[match.group("month_name")],
+            match.group("year"),
+        )
+    elif match.group("iso_year"):
+        day, month, year = (
+            match.group("iso_day"),
+            match.group("iso_month"),
+            match.group("iso_year"),
+        )
+    else:
+        day, month, year = (
+            match.group("dmy_day"),
+            match.group("dmy_month"),
+            match.group("dmy_year"),
+        )
+    return datetime(int(year), int(month), int(day))
+
+
+def _find_content_root(root):
+    """Return the most specific judgment container under root, if any."""
+
+    def rank(elem):
+        classes = (elem.get("class") or "").split()
+        return min((_CONTENT_RANK.get(name, 2) for name in classes), default=2)
+
+    return min(_CONTENT_XPATH(root), key=rank, default=None)
 
 
 class AustLIIScraper(BaseScraper):
@@ -50,7 +131,9 @@ class AustLIIScraper(BaseScraper):
             end_date: End date for search (YYYY-MM-DD)
             court: Court abbreviation (e.g., 'HCA', 'NSWCA')
             limit: Maximum number of results (default: 100)
-            **kwargs: Additional parameters
+            **kwargs: Additional parameters. Pass ``fetch_details=True`` to
+                fetch every result's case page concurrently and return the
+                full case details instead of the search-result summary.
 
         Returns:
             List of CaseData objects
@@ -64,6 +147,36 @@ class AustLIIScraper(BaseScraper):
             ...     limit=20
             ... )
         """
+        return list(
+            self.iter_search_cases(
+                query=query,
+                start_date=start_date,
+                end_date=end_date,
+                court=court,
+                limit=limit,
+                **kwargs,
+            )
+        )
+
+    def iter_search_cases(
+        self,
+        query: str = None,
+        start_date: Union[str, datetime] = None,
+        end_date: Union[str, datetime] = None,
+        court: str = None,
+        limit: int = 100,
+        **kwargs,
+    ) -> Iterator[CaseData]:
+        """
+        Search for cases on AustLII, yielding each case as it is parsed.
+
+        Takes the same arguments as search_cases. With ``fetch_details=True``
+        detail pages are still fetched concurrently, and each case is
+        yielded as soon as it and every case before it have completed.
+
+        Yields:
+            CaseData objects
+        """
         # Validate parameters
         params = self.validate_search_params(start_date, end_date, limit)
 
@@ -90,16 +203,14 @@ class AustLIIScraper(BaseScraper):
 
         try:
             response = self._make_request(url, params=search_params)
-            soup = self._parse_html(response.text)
+            tree = self._parse_tree(response.content, self._response_encoding(response))
         except Exception as e:
             raise ParsingError(f"Failed to parse search results: {str(e)}")
 
-        # Parse search results
-        cases = []
-
         # Look for case links in search results
-        case_links = soup.find_all("a", href=re.compile(r"/au/cases/"))
+        case_links = _CASE_LINKS_XPATH(tree)
 
+        cases = []
         for link in case_links[: params.get("limit", 100)]:
             try:
                 case_data = self._parse_search_result_link(link)
@@ -109,8 +220,16 @@ class AustLIIScraper(BaseScraper):
                 self.logger.warning(f"Failed to parse search result: {str(e)}")
                 continue
 
+        if kwargs.get("fetch_details"):
+            details = self._imap_concurrent(
+                self._fetch_case_detail, [case.url for case in cases]
+            )
+            for detail, case in zip(details, cases):
+                yield detail or case
+        else:
+            yield from cases
+
         self.logger.info(f"Found {len(cases)} cases from AustLII")
-        return cases
 
     def get_case_by_id(self, case_id: str) -> Optional[CaseData]:
         """
@@ -141,18 +260,28 @@ class AustLIIScraper(BaseScraper):
                 return cases[0]
             return None
 
+        return self._fetch_case_detail(url)
+
+    def _fetch_case_detail(self, url: str) -> Optional[CaseData]:
+        """Fetch and parse a case page, returning None on failure."""
         try:
             response = self._make_request(url)
-            soup = self._parse_html(response.text)
-            return self._parse_case_detail(soup, url)
+            encoding = self._response_encoding(response)
+            return self._parse_cached(
+                url,
+                response.content,
+                lambda content: self._parse_case_detail(
+                    self._parse_tree(content, encoding), url
+                ),
+            )
         except Exception as e:
-            self.logger.error(f"Failed to get case {case_id}: {str(e)}")
+            self.logger.error(f"Failed to get case {url}: {str(e)}")
             return None
 
     def _parse_search_result_link(self, link) -> Optional[CaseData]:
         """Parse a search result link into CaseData."""
         try:
-            case_name = sanitize_text(link.get_text())
+            case_name = sanitize_text(link.text_content())
             case_url = link.get("href")
 
             if case_url and not case_url.startswith("http"):
@@ -161,9 +290,7 @@ class AustLIIScraper(BaseScraper):
             # Extract case ID from URL
             case_id = ""
             if case_url:
-                case_id_match = re.search(
-                    r"/au/cases/([^/]+/[^/]+/[^/]+/\d+/\d+)", case_url
-                )
+                case_id_match = _CASE_ID_RE.search(case_url)
                 if case_id_match:
                     case_id = case_id_match.group(1)
 
@@ -180,109 +307,64 @@ class AustLIIScraper(BaseScraper):
             self.logger.error(f"Error parsing search result link: {str(e)}")
             return None
 
-    def _parse_case_detail(self, soup, url: str) -> Optional[CaseData]:
+    def _parse_case_detail(self, tree, url: str) -> Optional[CaseData]:
         """Parse detailed case page into CaseData."""
         try:
             # Extract case name from title or heading
-            case_name = ""
-            title_elem = soup.find("title")
-            if title_elem:
-                case_name = sanitize_text(title_elem.get_text())
+            case_name = sanitize_text(tree.findtext(".//title") or "")
 
             # Try h1 if title doesn't work
             if not case_name:
-                h1_elem = soup.find("h1")
-                if h1_elem:
-                    case_name = sanitize_text(h1_elem.get_text())
+                h1_elem = tree.find(".//h1")
+                if h1_elem is not None:
+                    case_name = sanitize_text(h1_elem.text_content())
 
             # Extract court and date information
             court_name = ""
             case_date = None
             citations = []
 
+            # Scan the whole body, but keep only the judgment itself as text
+            body = tree.find(".//body")
+            page_text = self._content_text(tree if body is None else body)
+            content = _find_content_root(tree)
+            full_text = sanitize_text(
+                page_text if content is None else content.text_content()
+            )
+
             # Look for court information in the page
-            court_pattern = r"(High Court of Australia|Federal Court of Australia|NSW Court of Appeal|Victorian Court of Appeal)"
-            court_matches = re.findall(court_pattern, soup.get_text())
-            if court_matches:
-                court_name = normalize_court_name(court_matches[0])
-
-            # Look for date patterns
-            date_patterns = [
-                r"(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})",
-                r"(\d{4}-\d{2}-\d{2})",
-                r"(\d{1,2}/\d{1,2}/\d{4})",
-            ]
-
-            page_text = soup.get_text()
-            for pattern in date_patterns:
-                date_matches = re.findall(pattern, page_text)
-                if date_matches:
-                    try:
-                        # Try different date formats
-                        date_str = date_matches[0]
-                        if "-" in date_str:
-                            case_date = datetime.strptime(date_str, "%Y-%m-%d")
-                        elif "/" in date_str:
-                            case_date = datetime.strptime(date_str, "%d/%m/%Y")
-                        else:
-                            case_date = datetime.strptime(date_str, "%d %B %Y")
-                        break
-                    except ValueError:
-                        continue
+            court_match = _COURT_RE.search(page_text)
+            if court_match:
+                court_name = normalize_court_name(court_match.group(0))
+
+            # Take the first date on the page that is a real calendar date
+            for date_match in _DATE_RE.finditer(page_text):
+                try:
+                    case_date = _match_to_date(date_match)
+                    break
+                except ValueError:
+                    continue
 
             # Extract citations
-            citation_patterns = [
-                r"\[(\d{4})\]\s+HCA\s+(\d+)",
-                r"(\d{4})\s+HCA\s+(\d+)",
-                r"\[(\d{4})\]\s+[A-Z]+\s+(\d+)",
-            ]
-
-            for pattern in citation_patterns:
-                citation_matches = re.findall(pattern, page_text)
-                if citation_matches:
-                    for match in citation_matches:
-                        if len(match) == 2:
-                            citations.append(f"[{match[0]}] HCA {match[1]}")
-
-            # Extract full text content
-            full_text = ""
-            # Look for main content area
-            content_selectors = ["div.judgment", "div.content", "div#main", "body"]
-
-            for selector in content_selectors:
-                content_div = soup.select_one(selector)
-                if content_div:
-                    # Remove navigation and other non-content elements
-                    for unwanted in content_div.find_all(
-                        ["nav", "header", "footer", "script", "style"]
-                    ):
-                        unwanted.decompose()
-                    full_text = sanitize_text(content_div.get_text())
+            for match in _CITATION_RE.finditer(page_text):
+                year = match.group(1) or match.group(3)
+                reporter = match.group(2) or match.group(4)
+                citations.append(f"[{year}] {reporter} {match.group(5)}")
+            citations = list(dict.fromkeys(citations))
+
+            # Extract up to five distinct judges from the opening of the text
+            judges = {}
+            header_text = full_text[:3000]
+            matches = chain.from_iterable(p.finditer(header_text) for p in _JUDGE_RES)
+            for match in matches:
+                judges[match.group(1).replace(" J.", "").replace(" J", "")] = None
+                if len(judges) >= 5:
                     break
-
-            # Extract judges
-            judges = []
-            judge_patterns = [
-                r"(?:Justice|J\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                r"([A-Z][a-z]+\s+J\.?)",
-            ]
-
-            for pattern in judge_patterns:
-                judge_matches = re.findall(
-                    pattern, full_text[:3000]
-                )  # Look in first part
-                judges.extend(
-                    [
-                        match.replace(" J.", "").replace(" J", "")
-                        for match in judge_matches
-                    ]
-                )
-
-            judges = list(set(judges[:5]))  # Limit and dedupe
+            judges = list(judges)
 
             # Extract case ID from URL
             case_id = ""
-            case_id_match = re.search(r"/au/cases/([^/]+/[^/]+/[^/]+/\d+/\d+)", url)
+            case_id_match = _CASE_ID_RE.search(url)
             if case_id_match:
                 case_id = case_id_match.group(1)
 
@@ -5,15 +5,83 @@ BAILII (British and Irish Legal Information Institute) provides free access
 to British and Irish case law and legislation.
 """
 
-import re
+import atexit
+import functools
+import threading
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
 from urllib.parse import urlencode, quote
 
+from bs4 import SoupStrainer
+
 from ..utils.base import BaseScraper
 from ..utils.data_models import CaseData
 from ..utils.exceptions import ParsingError, DataNotFoundError
-from ..utils.helpers import sanitize_text, validate_date, normalize_court_name
+from ..utils.helpers import (
+    sanitize_text,
+    validate_date,
+    normalize_court_name,
+    compile_pattern,
+)
+
+_COURT_RE = compile_pattern(
+    r"(?i)Supreme Court|Court of Appeal|High Court|Crown Court|Magistrates"
+    r"|Employment Tribunal|UKSC|EWCA|EWHC|UKUT|UKFTT|House of Lords|Privy Council"
+)
+_DATE_RE = compile_pattern(
+    r"(?P<long>\d{1,2}\s+(?:January|February|March|April|May|June|July|August"
+    r"|September|October|November|December)\s+\d{4})"
+    r"|(?P<iso>\d{4}-\d{2}-\d{2})"
+    r"|(?P<dmy>\d{1,2}/\d{1,2}/\d{4})"
+)
+# strptime format for each named group of _DATE_RE
+_DATE_FORMATS = {"long": "%d %B %Y", "iso": "%Y-%m-%d", "dmy": "%d/%m/%Y"}
+# Neutral citations, e.g. [2019] UKSC 41, and law report citations, e.g.
+# [2017] 1 WLR 22
+_CITATION_RE = compile_pattern(
+    r"\[?(?P<year>\d{4})\]?\s+(?P<court>UKSC|EWCA|EWHC|UKUT)\s+(?P<number>\d+)"
+    r"|\[?(?P<report_year>\d{4})\]?\s+(?P<volume>\d+)\s+"
+    r"(?P<report>WLR|All ER|AC|QB)(?:\s+(?P<page>\d+))?"
+)
+# Court, date and citations normally appear in a judgment's opening text;
+# it is scanned on its own before falling back to the whole judgment
+_HEADER_CHARS = 8192
+# Each alternative captures one judge name; the first to match wins
+_JUDGE_RE = compile_pattern(
+    r"(?:Lord|Lady|Mr|Mrs|Ms)\s+Justice\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
+    r"|(?:Lord|Lady)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
+    r"|([A-Z][a-z]+\s+LJ)"
+    r"|([A-Z][a-z]+\s+J\.?)"
+)
+# Judicial title suffixes such as "Arden LJ" or "Jones J."
+_JUDGE_SUFFIX_RE = compile_pattern(r"\s+(?:LJ|J\.?)$")
+# Also captures the jurisdiction code used by _JURISDICTIONS
+_CASE_LINK_RE = compile_pattern(r"/(uk|ie|ni|scot)/cases/")
+_JURISDICTIONS = {
+    "uk": "United Kingdom",
+    "ie": "Ireland",
+    "ni": "Northern Ireland",
+    "scot": "Scotland",
+}
+# Restricts search-page parsing to case links
+_CASE_LINK_STRAINER = SoupStrainer("a", href=_CASE_LINK_RE)
+_CASE_ID_RE = compile_pattern(r"/(uk|ie|ni|scot)/cases/([^/]+/\d+/\d+)")
+
+
+@functools.lru_cache(maxsize=4096)
+def _case_id_from_url(url: str) -> str:
+    """Extract the BAILII case ID (e.g. uk/cases/UKSC/2023/15) from a URL."""
+    match = _CASE_ID_RE.search(url)
+    if match:
+        return f"{match.group(1)}/cases/{match.group(2)}"
+    return ""
+
+
+@functools.lru_cache(maxsize=1024)
+def _jurisdiction_from_url(url: str) -> str:
+    """Map a BAILII case URL to its jurisdiction, defaulting to the UK."""
+    match = _CASE_LINK_RE.search(url)
+    return _JURISDICTIONS[match.group(1)] if match else _JURISDICTIONS["uk"]
 
 
 class BAILIIScraper(BaseScraper):
@@ -84,7 +152,7 @@ class BAILIIScraper(BaseScraper):
 
         # Jurisdiction filter
         jurisdiction = kwargs.get("jurisdiction", "uk")
-        if jurisdiction in ["uk", "ie", "ni", "scot"]:
+        if jurisdiction in _JURISDICTIONS:
             search_params["jurisdiction"] = jurisdiction
 
         # Set results limit
@@ -95,24 +163,23 @@ class BAILIIScraper(BaseScraper):
 
         try:
             response = self._make_request(url, params=search_params)
-            soup = self._parse_html(response.text)
+            soup = self._parse_html(
+                response.content,
+                parse_only=_CASE_LINK_STRAINER,
+                from_encoding=self._response_encoding(response),
+            )
         except Exception as e:
             raise ParsingError(f"Failed to parse search results: {str(e)}")
 
-        # Parse search results
-        cases = []
-
         # Look for case links in search results
-        case_links = soup.find_all("a", href=re.compile(r"/(uk|ie|ni|scot)/cases/"))
+        # Only the case links were parsed, so they are the top-level nodes
+        case_links = soup.find_all("a", recursive=False, limit=params.get("limit", 100))
 
-        for link in case_links[: params.get("limit", 100)]:
-            try:
-                case_data = self._parse_search_result_link(link)
-                if case_data:
-                    cases.append(case_data)
-            except Exception as e:
-                self.logger.warning(f"Failed to parse search result: {str(e)}")
-                continue
+        # Parse search results
+        try:
+            cases = self._parse_search_result_links(case_links)
+        except Exception as e:
+            raise ParsingError(f"Failed to parse search results: {str(e)}")
 
         self.logger.info(f"Found {len(cases)} cases from BAILII")
         return cases
@@ -141,58 +208,90 @@ class BAILIIScraper(BaseScraper):
             url = f"{self.base_url}/{case_id}.html"
         else:
             # Try searching for the citation
-            cases = self.search_cases(query=case_id, limit=1)
-            if cases:
-                return cases[0]
-            return None
+            cache_key = f"citation:{case_id}"
+            case = self._get_cached_case(cache_key)
+            if case is None:
+                url = self._resolve_citation_to_url(case_id)
+                case = self._cache_case(
+                    cache_key, self._fetch_case_detail(url) if url else None
+                )
+            return case
+
+        return self._fetch_case_detail(url)
+
+    def _resolve_citation_to_url(self, citation: str) -> Optional[str]:
+        """
+        Find the URL of the first case matching a citation.
 
+        Only the first case link of the search page is parsed.
+
+        Args:
+            citation: Case citation, e.g. "[2019] UKSC 41"
+
+        Returns:
+            Absolute case URL, or None if the search found nothing
+        """
+        search_params = {
+            "method": "boolean",
+            "query": citation,
+            "jurisdiction": "uk",
+            "results": 1,
+        }
         try:
-            response = self._make_request(url)
-            soup = self._parse_html(response.text)
-            return self._parse_case_detail(soup, url)
+            response = self._make_request(
+                f"{self.base_url}/cgi-bin/markup.cgi", params=search_params
+            )
+            link = self._parse_html(
+                response.content,
+                parse_only=_CASE_LINK_STRAINER,
+                from_encoding=self._response_encoding(response),
+            ).find("a")
         except Exception as e:
-            self.logger.error(f"Failed to get case {case_id}: {str(e)}")
+            self.logger.error(f"Failed to resolve citation {citation}: {str(e)}")
             return None
 
-    def _parse_search_result_link(self, link) -> Optional[CaseData]:
-        """Parse a search result link into CaseData."""
-        try:
-            case_name = sanitize_text(link.get_text())
-            case_url = link.get("href")
+        if link is None:
+            return None
+        case_url = link["href"]
+        if not case_url.startswith("http"):
+            case_url = f"{self.base_url}{case_url}"
+        return case_url
 
-            if case_url and not case_url.startswith("http"):
-                case_url = f"{self.base_url}{case_url}"
+    def _fetch_case_detail(self, url: str) -> Optional[CaseData]:
+        """Fetch and parse a case page, returning None on failure."""
+        case = self._get_cached_case(url)
+        if case is not None:
+            return case
 
-            # Extract case ID from URL
-            case_id = ""
-            if case_url:
-                case_id_match = re.search(
-                    r"/(uk|ie|ni|scot)/cases/([^/]+/\d+/\d+)", case_url
-                )
-                if case_id_match:
-                    case_id = f"{case_id_match.group(1)}/cases/{case_id_match.group(2)}"
+        try:
+            response = self._make_request(url)
+            soup = self._parse_html(
+                response.content, from_encoding=self._response_encoding(response)
+            )
+            return self._cache_case(url, self._parse_case_detail(soup, url))
+        except Exception as e:
+            self.logger.error(f"Failed to get case {url}: {str(e)}")
+            return None
 
-            # Determine jurisdiction from URL
-            jurisdiction = self.jurisdiction
-            if "/ie/cases/" in case_url:
-                jurisdiction = "Ireland"
-            elif "/ni/cases/" in case_url:
-                jurisdiction = "Northern Ireland"
-            elif "/scot/cases/" in case_url:
-                jurisdiction = "Scotland"
-
-            # Basic case data from search result
-            return CaseData(
+    def _parse_search_result_links(self, links) -> List[CaseData]:
+        """Parse search result links into CaseData, one field at a time."""
+        names = [sanitize_text(link.get_text()) for link in links]
+        urls = [link["href"] for link in links]
+        urls = [
+            url if url.startswith("http") else f"{self.base_url}{url}" for url in urls
+        ]
+
+        # Basic case data from search results
+        return [
+            CaseData(
                 case_name=case_name,
-                case_id=case_id,
+                case_id=_case_id_from_url(case_url),
                 url=case_url,
-                jurisdiction=jurisdiction,
+                jurisdiction=_jurisdiction_from_url(case_url),
                 metadata={"source": "BAILII"},
             )
-
-        except Exception as e:
-            self.logger.error(f"Error parsing search result link: {str(e)}")
-            return None
+            for case_name, case_url in zip(names, urls)
+        ]
 
     def _parse_case_detail(self, soup, url: str) -> Optional[CaseData]:
         """Parse detailed case page into CaseData."""
@@ -214,110 +313,88 @@ class BAILIIScraper(BaseScraper):
             case_date = None
             citations = []
 
+            # Look for main content area; all scans below run on its text only
+            page_text = ""
+            content_div = (
+                soup.find("div", class_="judgment")
+                or soup.find("div", class_="content")
+                or soup.find("div", id="main")
+                or soup.body
+            )
+
+            if content_div:
+                # Remove navigation and other non-content elements
+                for unwanted in content_div.find_all(
+                    ["nav", "header", "footer", "script", "style"]
+                ):
+                    unwanted.decompose()
+                page_text = content_div.get_text(" ", strip=True)
+            # Scans run over the sanitized text: its whitespace is all plain
+            # spaces, which RE2's ASCII-only \s also matches
+            full_text = sanitize_text(page_text)
+
+            # Scan the header first; the full text only when it has no match
+            scan_ends = [_HEADER_CHARS]
+            if len(full_text) > _HEADER_CHARS:
+                scan_ends.append(len(full_text))
+
             # Look for court information
-            court_patterns = [
-                r"(Supreme Court|Court of Appeal|High Court|Crown Court|Magistrates|Employment Tribunal)",
-                r"(UKSC|EWCA|EWHC|UKUT|UKFTT)",
-                r"(House of Lords|Privy Council)",
-            ]
-
-            page_text = soup.get_text()
-            for pattern in court_patterns:
-                court_matches = re.findall(pattern, page_text, re.IGNORECASE)
-                if court_matches:
-                    court_name = normalize_court_name(court_matches[0])
+            for end in scan_ends:
+                court_match = _COURT_RE.search(full_text, 0, end)
+                if court_match:
+                    court_name = normalize_court_name(court_match.group(0))
                     break
 
-            # Look for date patterns
-            date_patterns = [
-                r"(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})",
-                r"(\d{4}-\d{2}-\d{2})",
-                r"(\d{1,2}/\d{1,2}/\d{4})",
-            ]
-
-            for pattern in date_patterns:
-                date_matches = re.findall(pattern, page_text)
-                if date_matches:
+            # Look for the first valid date in any supported format
+            for end in scan_ends:
+                for match in _DATE_RE.finditer(full_text, 0, end):
                     try:
-                        # Try different date formats
-                        date_str = date_matches[0]
-                        if "-" in date_str:
-                            case_date = datetime.strptime(date_str, "%Y-%m-%d")
-                        elif "/" in date_str:
-                            case_date = datetime.strptime(date_str, "%d/%m/%Y")
-                        else:
-                            case_date = datetime.strptime(date_str, "%d %B %Y")
+                        case_date = datetime.strptime(
+                            match.group(match.lastgroup),
+                            _DATE_FORMATS[match.lastgroup],
+                        )
                         break
                     except ValueError:
                         continue
+                if case_date:
+                    break
 
             # Extract citations
-            citation_patterns = [
-                r"\[(\d{4})\]\s+(UKSC|EWCA|EWHC|UKUT)\s+(\d+)",
-                r"(\d{4})\s+(UKSC|EWCA|EWHC|UKUT)\s+(\d+)",
-                r"\[(\d{4})\]\s+(\d+)\s+(WLR|All ER|AC|QB)",
-                r"(\d{4})\s+(\d+)\s+(WLR|All ER|AC|QB)",
-            ]
-
-            for pattern in citation_patterns:
-                citation_matches = re.findall(pattern, page_text)
-                if citation_matches:
-                    for match in citation_matches:
-                        if len(match) == 3:
-                            citations.append(f"[{match[0]}] {match[1]} {match[2]}")
-
-            # Extract full text content
-            full_text = ""
-            # Look for main content area
-            content_selectors = ["div.judgment", "div.content", "div#main", "body"]
-
-            for selector in content_selectors:
-                content_div = soup.select_one(selector)
-                if content_div:
-                    # Remove navigation and other non-content elements
-                    for unwanted in content_div.find_all(
-                        ["nav", "header", "footer", "script", "style"]
-                    ):
-                        unwanted.decompose()
-                    full_text = sanitize_text(content_div.get_text())
+            for end in scan_ends:
+                for match in _CITATION_RE.finditer(full_text, 0, end):
+                    if match.group("year"):
+                        citation = (
+                            f"[{match['year']}] {match['court']} {match['number']}"
+                        )
+                    else:
+                        citation = (
+                            f"[{match['report_year']}] {match['volume']} "
+                            f"{match['report']}"
+                        )
+                        if match.group("page"):
+                            citation += f" {match['page']}"
+                    citations.append(citation)
+                if citations:
                     break
+            citations = list(dict.fromkeys(citations))
 
             # Extract judges
-            judges = []
-            judge_patterns = [
-                r"(?:Lord|Lady|Mr|Mrs|Ms)\s+Justice\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                r"(?:Lord|Lady)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                r"([A-Z][a-z]+\s+LJ)",
-                r"([A-Z][a-z]+\s+J\.?)",
-            ]
-
-            for pattern in judge_patterns:
-                judge_matches = re.findall(
-                    pattern, full_text[:3000]
-                )  # Look in first part
-                judges.extend(
-                    [
-                        match.replace(" LJ", "").replace(" J.", "").replace(" J", "")
-                        for match in judge_matches
-                    ]
-                )
+            # Dict keys dedupe while keeping the order judges are named in
+            judges = {}
 
-            judges = list(set(judges[:5]))  # Limit and dedupe
+            for match in _JUDGE_RE.finditer(full_text, 0, 3000):  # Look in first part
+                judge = _JUDGE_SUFFIX_RE.sub("", match.group(match.lastindex))
+                judges[judge] = None
+                if len(judges) >= 5:
+                    break
+
+            judges = list(judges)
 
             # Determine jurisdiction from URL
-            jurisdiction = self.jurisdiction
-            if "/ie/cases/" in url:
-                jurisdiction = "Ireland"
-            elif "/ni/cases/" in url:
-                jurisdiction = "Northern Ireland"
-            elif "/scot/cases/" in url:
-                jurisdiction = "Scotland"
+            jurisdiction = _jurisdiction_from_url(url)
 
             # Extract case ID from URL
-            case_id = ""
-            case_id_match = re.search(r"/(uk|ie|ni|scot)/cases/([^/]+/\d+/\d+)", url)
-            if case_id_match:
-                case_id = f"{case_id_match.group(1)}/cases/{case_id_match.group(2)}"
+            case_id = _case_id_from_url(url)
 
             return CaseData(
                 case_name=case_name,
@@ -338,6 +415,23 @@ class BAILIIScraper(BaseScraper):
 
 
 # Convenience functions
+_SCRAPER = threading.local()
+
+
+def _get_scraper() -> BAILIIScraper:
+    """
+    Return the calling thread's shared scraper for the convenience functions.
+
+    Reusing one instance keeps its pooled HTTP connections alive between
+    calls. Every instance is closed at interpreter exit.
+    """
+    scraper = getattr(_SCRAPER, "scraper", None)
+    if scraper is None:
+        scraper = _SCRAPER.scraper = BAILIIScraper()
+        atexit.register(scraper.close)
+    return scraper
+
+
 def get_case_by_id(case_id: str) -> Optional[CaseData]:
     """
     Get a specific case by ID from BAILII.
@@ -354,8 +448,7 @@ def get_case_by_id(case_id: str) -> Optional[CaseData]:
         >>> if case:
         ...     print(case.case_name)
     """
-    with BAILIIScraper() as scraper:
-        return scraper.get_case_by_id(case_id)
+    return _get_scraper().get_case_by_id(case_id)
 
 
 def search_cases(
@@ -382,11 +475,10 @@ def search_cases(
         >>> from the_junior_associate.bailii import search_cases
         >>> cases = search_cases("human rights", court="UKSC")
     """
-    with BAILIIScraper() as scraper:
-        return scraper.search_cases(
-            query=query,
-            start_date=start_date,
-            end_date=end_date,
-            court=court,
-            limit=limit,
-        )
+    return _get_scraper().search_cases(
+        query=query,
+        start_date=start_date,
+        end_date=end_date,
+        court=court,
+        limit=limit,
+    )
@@ -5,15 +5,137 @@ CanLII is the Canadian Legal Information Institute providing free access
 to Canadian federal and provincial case law and legislation.
 """
 
-import re
+import atexit
+import functools
+import threading
 from datetime import datetime
 from typing import List, Optional, Dict, Any, Union
 from urllib.parse import urlencode, quote
 
+from bs4 import SoupStrainer
+from lxml import etree
+
 from ..utils.base import BaseScraper
 from ..utils.data_models import CaseData
 from ..utils.exceptions import ParsingError, DataNotFoundError
-from ..utils.helpers import sanitize_text, validate_date, normalize_court_name
+from ..utils.helpers import (
+    sanitize_text,
+    validate_date,
+    normalize_court_name,
+    compile_pattern,
+)
+
+_META_COURT_DATE_RE = compile_pattern(r"([^,]+),\s*(\d{4}-\d{2}-\d{2})")
+_META_CITATION_RE = compile_pattern(r"\d{4}\s+[A-Z]+\s+\d+")
+_DATE_RE = compile_pattern(r"(\d{4}-\d{2}-\d{2})")
+_JUDGE_RE = compile_pattern(r"(?:Justice|Judge|J\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)")
+# Restricts search-page parsing to the result blocks
+_RESULT_STRAINER = SoupStrainer("div", class_="result")
+# Restricts search-page parsing to result title links
+_TITLE_LINK_STRAINER = SoupStrainer("a", class_="title")
+_CASE_ID_RE = compile_pattern(r"/([^/]+)\.html$")
+
+
+@functools.lru_cache(maxsize=4096)
+def _case_id_from_url(url: str) -> str:
+    """Extract the CanLII document ID (e.g. 2023scc15) from a URL."""
+    match = _CASE_ID_RE.search(url)
+    return match.group(1) if match else ""
+
+
+class _CasePageTarget:
+    """
+    lxml parser target that keeps only the text a CanLII case page needs.
+
+    The parser streams start/data/end events into this object instead of
+    building a tree, so a long judgment is read in one pass while only the
+    heading, the court/date/citation spans and the judgment body are kept.
+    Navigation, header, footer, script and style text is dropped from the
+    judgment body only; the heading and spans are collected wherever they
+    occur.
+    """
+
+    SPAN_FIELDS = ("court", "date", "citation")
+    BODY_FIELDS = ("documentcontent", "document")
+    SKIP_TAGS = frozenset({"nav", "header", "footer", "script", "style"})
+
+    def __init__(self):
+        self.text: Dict[str, str] = {}
+        self._parts: Dict[str, List[str]] = {}
+        self._skipping: Dict[str, int] = {}
+        self._stack: List[tuple] = []
+
+    def _fields_opened_by(self, tag: str, attrib) -> List[str]:
+        if tag in ("h1", "title"):
+            candidates = [tag]
+        elif tag == "span":
+            classes = (attrib.get("class") or "").split()
+            candidates = [name for name in self.SPAN_FIELDS if name in classes]
+        elif tag == "div":
+            candidates = []
+            if "documentcontent" in (attrib.get("class") or "").split():
+                candidates.append("documentcontent")
+            if attrib.get("id") == "document":
+                candidates.append("document")
+        else:
+            return []
+        return [
+            name
+            for name in candidates
+            if name not in self.text and name not in self._parts
+        ]
+
+    def start(self, tag, attrib):
+        # Skip tags only hide text from body fields that are already open
+        skipped = ()
+        if tag in self.SKIP_TAGS:
+            skipped = [name for name in self.BODY_FIELDS if name in self._parts]
+            for name in skipped:
+                self._skipping[name] = self._skipping.get(name, 0) + 1
+        fields = self._fields_opened_by(tag, attrib)
+        for name in fields:
+            self._parts[name] = []
+        self._stack.append((fields, skipped))
+
+    def end(self, tag):
+        fields, skipped = self._stack.pop()
+        for name in skipped:
+            self._skipping[name] -= 1
+        for name in fields:
+            self.text[name] = "".join(self._parts.pop(name))
+            self._skipping.pop(name, None)
+
+    def data(self, data):
+        for name, parts in self._parts.items():
+            if not self._skipping.get(name):
+                parts.append(data)
+
+    def close(self) -> Dict[str, str]:
+        # Elements left open at end of input still count
+        for name, parts in self._parts.items():
+            self.text[name] = "".join(parts)
+        return self.text
+
+
+class _SearchResult:
+    """The elements of one CanLII search result, found in a single pass."""
+
+    __slots__ = ("title", "meta", "summary")
+
+    def __init__(self, result_div):
+        self.title = self.meta = self.summary = None
+        for element in result_div.descendants:
+            name = getattr(element, "name", None)
+            if name != "a" and name != "div":
+                continue
+            classes = element.get("class") or ()
+            if name == "a":
+                if self.title is None and "title" in classes:
+                    self.title = element
+            elif self.meta is None and "resultmeta" in classes:
+                self.meta = element
+            elif self.summary is None and "summary" in classes:
+                self.summary = element
 
 
 class CanLIIScraper(BaseScraper):
@@ -95,7 +217,11 @@ class CanLIIScraper(BaseScraper):
 
         try:
             response = self._make_request(url, params=search_params)
-            soup = self._parse_html(response.text)
+            soup = self._parse_html(
+                response.content,
+                parse_only=_RESULT_STRAINER,
+                from_encoding=self._response_encoding(response),
+            )
         except Exception as e:
             raise ParsingError(f"Failed to parse search results: {str(e)}")
 
@@ -141,17 +267,69 @@ class CanLIIScraper(BaseScraper):
             url = f"{self.base_url}/en/{case_id}.html"
         else:
             # Try to find by citation
-            cases = self.search_cases(query=f'citation:"{case_id}"', limit=1)
-            if cases:
-                return cases[0]
+            cache_key = f"citation:{case_id}"
+            case = self._get_cached_case(cache_key)
+            if case is None:
+                url = self._resolve_citation_to_url(case_id)
+                case = self._cache_case(
+                    cache_key, self._fetch_case_detail(url) if url else None
+                )
+            return case
+
+        return self._fetch_case_detail(url)
+
+    def _resolve_citation_to_url(self, citation: str) -> Optional[str]:
+        """
+        Find the URL of the first case matching a citation.
+
+        Only the title link of the first search result is parsed.
+
+        Args:
+            citation: Case citation, e.g. "2023 SCC 15"
+
+        Returns:
+            Absolute case URL, or None if the search found nothing
+        """
+        search_params = {
+            "resultCount": 1,
+            "sort": "decisionDateDesc",
+            "text": f'citation:"{citation}"',
+            "language": "en",
+        }
+        try:
+            response = self._make_request(
+                f"{self.base_url}/en/search/", params=search_params
+            )
+            link = self._parse_html(
+                response.content,
+                parse_only=_TITLE_LINK_STRAINER,
+                from_encoding=self._response_encoding(response),
+            ).find("a")
+        except Exception as e:
+            self.logger.error(f"Failed to resolve citation {citation}: {str(e)}")
             return None
 
+        if link is None or not link.get("href"):
+            return None
+        case_url = link["href"]
+        if not case_url.startswith("http"):
+            case_url = f"{self.base_url}{case_url}"
+        return case_url
+
+    def _fetch_case_detail(self, url: str) -> Optional[CaseData]:
+        """Fetch and parse a case page, returning None on failure."""
+        case = self._get_cached_case(url)
+        if case is not None:
+            return case
+
         try:
             response = self._make_request(url)
-            soup = self._parse_html(response.text)
-            return self._parse_case_detail(soup, url)
+            case = self._parse_case_detail(
+                response.content, url, self._response_encoding(response)
+            )
+            return self._cache_case(url, case)
         except Exception as e:
-            self.logger.error(f"Failed to get case {case_id}: {str(e)}")
+            self.logger.error(f"Failed to get case {url}: {str(e)}")
             return None
 
     def _parse_search_result(
@@ -159,8 +337,10 @@ class CanLIIScraper(BaseScraper):
     ) -> Optional[CaseData]:
         """Parse a search result div into CaseData."""
         try:
+            result = _SearchResult(result_div)
+
             # Extract case name
-            title_link = result_div.find("a", class_="title")
+            title_link = result.title
             if not title_link:
                 return None
 
@@ -170,7 +350,7 @@ class CanLIIScraper(BaseScraper):
                 case_url = f"{self.base_url}{case_url}"
 
             # Extract court and date
-            meta_info = result_div.find("div", class_="resultmeta")
+            meta_info = result.meta
             court_name = ""
             case_date = None
             citations = []
@@ -179,7 +359,7 @@ class CanLIIScraper(BaseScraper):
                 meta_text = sanitize_text(meta_info.get_text())
 
                 # Extract court from meta text
-                court_match = re.search(r"([^,]+),\s*(\d{4}-\d{2}-\d{2})", meta_text)
+                court_match = _META_COURT_DATE_RE.search(meta_text)
                 if court_match:
                     court_name = normalize_court_name(court_match.group(1))
                     try:
@@ -188,21 +368,17 @@ class CanLIIScraper(BaseScraper):
                         pass
 
                 # Extract citations
-                citation_matches = re.findall(r"\d{4}\s+[A-Z]+\s+\d+", meta_text)
+                citation_matches = _META_CITATION_RE.findall(meta_text)
                 citations = [cite.strip() for cite in citation_matches]
 
             # Extract summary if available
             summary = ""
-            summary_div = result_div.find("div", class_="summary")
+            summary_div = result.summary
             if summary_div:
                 summary = sanitize_text(summary_div.get_text())
 
             # Extract case ID from URL
-            case_id = ""
-            if case_url:
-                case_id_match = re.search(r"/([^/]+)\.html$", case_url)
-                if case_id_match:
-                    case_id = case_id_match.group(1)
+            case_id = _case_id_from_url(case_url) if case_url else ""
 
             return CaseData(
                 case_name=case_name,
@@ -220,14 +396,19 @@ class CanLIIScraper(BaseScraper):
             self.logger.error(f"Error parsing search result: {str(e)}")
             return None
 
-    def _parse_case_detail(self, soup, url: str) -> Optional[CaseData]:
-        """Parse detailed case page into CaseData."""
+    def _parse_case_detail(
+        self, content: bytes, url: str, encoding: str = None
+    ) -> Optional[CaseData]:
+        """Parse detailed case page bytes into CaseData."""
         try:
+            parser = etree.HTMLParser(
+                target=_CasePageTarget(), encoding=encoding or "utf-8"
+            )
+            parser.feed(content)
+            page = parser.close()
+
             # Extract case name
-            case_name = ""
-            title_elem = soup.find("h1") or soup.find("title")
-            if title_elem:
-                case_name = sanitize_text(title_elem.get_text())
+            case_name = sanitize_text(page.get("h1") or page.get("title") or "")
 
             # Extract court and date from header
             court_name = ""
@@ -235,15 +416,13 @@ class CanLIIScraper(BaseScraper):
             citations = []
 
             # Look for court information
-            court_elem = soup.find("span", class_="court")
-            if court_elem:
-                court_name = normalize_court_name(sanitize_text(court_elem.get_text()))
+            if "court" in page:
+                court_name = normalize_court_name(sanitize_text(page["court"]))
 
             # Look for date
-            date_elem = soup.find("span", class_="date")
-            if date_elem:
-                date_text = sanitize_text(date_elem.get_text())
-                date_match = re.search(r"(\d{4}-\d{2}-\d{2})", date_text)
+            if "date" in page:
+                date_text = sanitize_text(page["date"])
+                date_match = _DATE_RE.search(date_text)
                 if date_match:
                     try:
                         case_date = datetime.strptime(date_match.group(1), "%Y-%m-%d")
@@ -251,36 +430,24 @@ class CanLIIScraper(BaseScraper):
                         pass
 
             # Extract citations
-            citation_elem = soup.find("span", class_="citation")
-            if citation_elem:
-                citation_text = sanitize_text(citation_elem.get_text())
+            if "citation" in page:
+                citation_text = sanitize_text(page["citation"])
                 if citation_text:
                     citations = [citation_text]
 
             # Extract full text
             full_text = ""
-            content_div = soup.find("div", class_="documentcontent") or soup.find(
-                "div", id="document"
-            )
-            if content_div:
-                # Remove navigation and other non-content elements
-                for nav in content_div.find_all(["nav", "header", "footer"]):
-                    nav.decompose()
-                full_text = sanitize_text(content_div.get_text())
+            content_text = page.get("documentcontent", page.get("document"))
+            if content_text is not None:
+                full_text = sanitize_text(content_text)
 
             # Extract judges
             judges = []
-            judge_pattern = r"(?:Justice|Judge|J\.)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
-            judge_matches = re.findall(
-                judge_pattern, full_text[:2000]
-            )  # Look in first part
+            judge_matches = _JUDGE_RE.findall(full_text[:2000])  # Look in first part
             judges = list(set(judge_matches[:5]))  # Limit and dedupe
 
             # Extract case ID from URL
-            case_id = ""
-            case_id_match = re.search(r"/([^/]+)\.html$", url)
-            if case_id_match:
-                case_id = case_id_match.group(1)
+            case_id = _case_id_from_url(url)
 
             return CaseData(
                 case_name=case_name,
@@ -301,6 +468,23 @@ class CanLIIScraper(BaseScraper):
 
 
 # Convenience functions
+_SCRAPER = threading.local()
+
+
+def _get_scraper() -> CanLIIScraper:
+    """
+    Return the calling thread's shared scraper for the convenience functions.
+
+    Reusing one instance keeps its pooled HTTP connections alive between
+    calls. Every instance is closed at interpreter exit.
+    """
+    scraper = getattr(_SCRAPER, "scraper", None)
+    if scraper is None:
+        scraper = _SCRAPER.scraper = CanLIIScraper()
+        atexit.register(scraper.close)
+    return scraper
+
+
 def get_case_by_id(case_id: str) -> Optional[CaseData]:
     """
     Get a specific case by ID from CanLII.
@@ -317,8 +501,7 @@ def get_case_by_id(case_id: str) -> Optional[CaseData]:
         >>> if case_text:
         ...     print(case_text.case_name)
     """
-    with CanLIIScraper() as scraper:
-        return scraper.get_case_by_id(case_id)
+    return _get_scraper().get_case_by_id(case_id)
 
 
 def search_cases(
@@ -345,11 +528,10 @@ def search_cases(
         >>> from the_junior_associate.canlii import search_cases
         >>> cases = search_cases("charter rights", court="scc-csc")
     """
-    with CanLIIScraper() as scraper:
-        return scraper.search_cases(
-            query=query,
-            start_date=start_date,
-            end_date=end_date,
-            court=court,
-            limit=limit,
-        )
+    return _get_scraper().search_cases(
+        query=query,
+        start_date=start_date,
+        end_date=end_date,
+        court=court,
+        limit=limit,
+    )
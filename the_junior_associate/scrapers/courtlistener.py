@@ -5,15 +5,39 @@ CourtListener is a free law project providing access to US federal and state
 case law, with comprehensive coverage and search capabilities.
 """
 
-import json
+import atexit
+import threading
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from itertools import chain, islice
+from typing import Iterator, List, Optional, Dict, Any, Union
 from urllib.parse import urlencode
 
 from ..utils.base import BaseScraper
 from ..utils.data_models import CaseData
-from ..utils.exceptions import ParsingError, DataNotFoundError
-from ..utils.helpers import sanitize_text, validate_date
+from ..utils.exceptions import DataNotFoundError
+from ..utils.helpers import sanitize_text, sanitize_texts, validate_date
+
+# Text fields of a search result, by API key, and the CaseData field each fills
+_SEARCH_TEXT_FIELDS = {
+    "caseName": "case_name",
+    "court": "court",
+    "snippet": "summary",
+    "status": "case_type",
+    "judge": "judges",
+}
+
+
+def _judge_names(judges) -> List[str]:
+    """Return the raw names from a cluster's judges field."""
+    names = []
+    for judge in judges or ():
+        if isinstance(judge, dict):
+            judge_name = judge.get("name_full", "")
+        else:
+            judge_name = str(judge)
+        if judge_name:
+            names.append(judge_name)
+    return names
 
 
 class CourtListenerScraper(BaseScraper):
@@ -64,6 +88,37 @@ class CourtListenerScraper(BaseScraper):
             ...     limit=10
             ... )
         """
+        return list(
+            self.iter_search_cases(
+                query=query,
+                start_date=start_date,
+                end_date=end_date,
+                court=court,
+                limit=limit,
+                **kwargs,
+            )
+        )
+
+    def iter_search_cases(
+        self,
+        query: Optional[str] = None,
+        start_date: Optional[Union[str, datetime]] = None,
+        end_date: Optional[Union[str, datetime]] = None,
+        court: Optional[str] = None,
+        limit: int = 100,
+        **kwargs,
+    ) -> Iterator[CaseData]:
+        """
+        Search for cases on CourtListener, yielding each page's cases as it
+        arrives.
+
+        Takes the same arguments as search_cases. Cases from the first page
+        are yielded before later pages have finished downloading, and
+        stopping early cancels page requests that have not started yet.
+
+        Yields:
+            CaseData objects
+        """
         # Validate parameters
         params = self.validate_search_params(start_date, end_date, limit)
 
@@ -96,27 +151,52 @@ class CourtListenerScraper(BaseScraper):
         # Make API request
         url = f"{self.base_url}/api/rest/v3/search/"
 
-        try:
-            response = self._make_request(url, params=search_params)
-            data = response.json()
-        except json.JSONDecodeError as e:
-            raise ParsingError(f"Failed to parse JSON response: {str(e)}")
+        response = self._make_request(url, params=search_params)
+        data = self._parse_json(response)
 
-        # Parse results
-        cases = []
+        # The API pages its results; fetch the remaining pages concurrently
         results = data.get("results", [])
+        limit = params.get("limit", 100)
+        pages = [results]
+        wanted = min(limit, data.get("count") or 0)
+        if results and data.get("next") and len(results) < wanted:
+            last_page = -(-wanted // len(results))
+            pages = chain(
+                pages,
+                self._imap_concurrent(
+                    lambda page: self._fetch_search_page(
+                        url, {**search_params, "page": page}
+                    ),
+                    range(2, last_page + 1),
+                ),
+            )
 
-        for item in results:
+        # Parse results page by page, stopping once the limit is reached
+        found = 0
+        for item in islice(chain.from_iterable(pages), limit):
             try:
                 case_data = self._parse_search_result(item)
                 if case_data:
-                    cases.append(case_data)
+                    found += 1
+                    yield case_data
             except Exception as e:
                 self.logger.warning(f"Failed to parse search result: {str(e)}")
                 continue
 
-        self.logger.info(f"Found {len(cases)} cases from CourtListener")
-        return cases
+        self.logger.info(f"Found {found} cases from CourtListener")
+
+    def _fetch_search_page(
+        self, url: str, search_params: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Fetch one further page of search results, or [] on failure."""
+        try:
+            response = self._make_request(url, params=search_params)
+            return self._parse_json(response).get("results", [])
+        except Exception as e:
+            self.logger.warning(
+                f"Failed to fetch search page {search_params.get('page')}: {str(e)}"
+            )
+            return []
 
     def get_case_by_id(self, case_id: str) -> Optional[CaseData]:
         """
@@ -135,13 +215,17 @@ class CourtListenerScraper(BaseScraper):
         if not case_id:
             raise ValueError("Case ID is required")
 
+        case = self._get_cached_case(case_id)
+        if case is not None:
+            return case
+
         # Try opinion endpoint first
         url = f"{self.base_url}/api/rest/v3/opinions/{case_id}/"
 
         try:
             response = self._make_request(url, params={"format": "json"})
-            data = response.json()
-            return self._parse_opinion_detail(data)
+            data = self._parse_json(response)
+            return self._cache_case(case_id, self._parse_opinion_detail(data))
         except Exception as e:
             self.logger.debug(f"Failed to get opinion {case_id}: {str(e)}")
 
@@ -150,8 +234,8 @@ class CourtListenerScraper(BaseScraper):
 
         try:
             response = self._make_request(url, params={"format": "json"})
-            data = response.json()
-            return self._parse_cluster_detail(data)
+            data = self._parse_json(response)
+            return self._cache_case(case_id, self._parse_cluster_detail(data))
         except Exception as e:
             self.logger.error(f"Failed to get case {case_id}: {str(e)}")
             return None
@@ -186,22 +270,24 @@ class CourtListenerScraper(BaseScraper):
     def _parse_search_result(self, item: Dict[str, Any]) -> Optional[CaseData]:
         """Parse a search result item into CaseData."""
         try:
-            # Extract basic information
-            case_name = sanitize_text(item.get("caseName", ""))
-            if not case_name:
+            # Sanitize the text fields in one batch
+            fields = dict(
+                zip(
+                    _SEARCH_TEXT_FIELDS.values(),
+                    sanitize_texts(map(item.get, _SEARCH_TEXT_FIELDS)),
+                )
+            )
+            if not fields["case_name"]:
                 return None
 
             # Parse date
             date_filed = None
             if item.get("dateFiled"):
                 try:
-                    date_filed = datetime.strptime(item["dateFiled"], "%Y-%m-%d")
+                    date_filed = datetime.fromisoformat(item["dateFiled"])
                 except ValueError:
                     pass
 
-            # Extract court information
-            court_name = sanitize_text(item.get("court", ""))
-
             # Build case URL
             case_url = None
             if item.get("absolute_url"):
@@ -213,23 +299,17 @@ class CourtListenerScraper(BaseScraper):
                 citations = [item["citation"]]
 
             # Extract judges
-            judges = []
-            if item.get("judge"):
-                judges = [sanitize_text(item["judge"])]
+            fields["judges"] = [fields["judges"]] if item.get("judge") else []
 
             # Create CaseData object
             return CaseData(
-                case_name=case_name,
+                **fields,
                 case_id=str(item.get("id", "")),
-                court=court_name,
                 date=date_filed,
                 url=case_url,
-                summary=sanitize_text(item.get("snippet", "")),
-                judges=judges,
                 citations=citations,
                 jurisdiction=self.jurisdiction,
-                case_type=sanitize_text(item.get("status", "")),
-                metadata={"source": "CourtListener", "api_data": item},
+                metadata={"source": "CourtListener"},
             )
 
         except Exception as e:
@@ -244,23 +324,25 @@ class CourtListenerScraper(BaseScraper):
             if cluster_url:
                 # Fetch cluster details
                 response = self._make_request(cluster_url, params={"format": "json"})
-                cluster_data = response.json()
-
-                case_name = sanitize_text(cluster_data.get("case_name", ""))
+                cluster_data = self._parse_json(response)
+
+                # Sanitize the short text fields in one batch
+                case_name, court_name, *judges = sanitize_texts(
+                    [
+                        cluster_data.get("case_name"),
+                        cluster_data.get("court"),
+                        *_judge_names(cluster_data.get("judges")),
+                    ]
+                )
 
                 # Parse date
                 date_filed = None
                 if cluster_data.get("date_filed"):
                     try:
-                        date_filed = datetime.strptime(
-                            cluster_data["date_filed"], "%Y-%m-%d"
-                        )
+                        date_filed = datetime.fromisoformat(cluster_data["date_filed"])
                     except ValueError:
                         pass
 
-                # Extract court
-                court_name = sanitize_text(cluster_data.get("court", ""))
-
                 # Extract citations
                 citations = []
                 for citation in cluster_data.get("citations", []):
@@ -271,17 +353,6 @@ class CourtListenerScraper(BaseScraper):
                     if cite_text:
                         citations.append(cite_text)
 
-                # Extract judges
-                judges = []
-                if cluster_data.get("judges"):
-                    for judge in cluster_data["judges"]:
-                        if isinstance(judge, dict):
-                            judge_name = judge.get("name_full", "")
-                        else:
-                            judge_name = str(judge)
-                        if judge_name:
-                            judges.append(sanitize_text(judge_name))
-
                 # Get opinion text
                 full_text = sanitize_text(
                     data.get("plain_text", "") or data.get("html", "")
@@ -301,7 +372,6 @@ class CourtListenerScraper(BaseScraper):
                         "source": "CourtListener",
                         "cluster_id": cluster_data.get("id"),
                         "opinion_type": data.get("type"),
-                        "api_data": data,
                     },
                 )
 
@@ -312,7 +382,15 @@ class CourtListenerScraper(BaseScraper):
     def _parse_cluster_detail(self, data: Dict[str, Any]) -> Optional[CaseData]:
         """Parse cluster detail data into CaseData."""
         try:
-            case_name = sanitize_text(data.get("case_name", ""))
+            # Sanitize the short text fields in one batch
+            case_name, court_name, summary, *judges = sanitize_texts(
+                [
+                    data.get("case_name"),
+                    data.get("court"),
+                    data.get("headnotes"),
+                    *_judge_names(data.get("judges")),
+                ]
+            )
             if not case_name:
                 return None
 
@@ -320,13 +398,10 @@ class CourtListenerScraper(BaseScraper):
             date_filed = None
             if data.get("date_filed"):
                 try:
-                    date_filed = datetime.strptime(data["date_filed"], "%Y-%m-%d")
+                    date_filed = datetime.fromisoformat(data["date_filed"])
                 except ValueError:
                     pass
 
-            # Extract court
-            court_name = sanitize_text(data.get("court", ""))
-
             # Extract citations
             citations = []
             for citation in data.get("citations", []):
@@ -337,31 +412,19 @@ class CourtListenerScraper(BaseScraper):
                 if cite_text:
                     citations.append(cite_text)
 
-            # Extract judges
-            judges = []
-            if data.get("judges"):
-                for judge in data["judges"]:
-                    if isinstance(judge, dict):
-                        judge_name = judge.get("name_full", "")
-                    else:
-                        judge_name = str(judge)
-                    if judge_name:
-                        judges.append(sanitize_text(judge_name))
-
             return CaseData(
                 case_name=case_name,
                 case_id=str(data.get("id", "")),
                 court=court_name,
                 date=date_filed,
                 url=f"{self.base_url}{data.get('absolute_url', '')}",
-                summary=sanitize_text(data.get("headnotes", "")),
+                summary=summary,
                 judges=judges,
                 citations=citations,
                 jurisdiction=self.jurisdiction,
                 metadata={
                     "source": "CourtListener",
                     "cluster_id": data.get("id"),
-                    "api_data": data,
                 },
             )
 
@@ -370,6 +433,23 @@ class CourtListenerScraper(BaseScraper):
             return None
 
 
+_SCRAPER = threading.local()
+
+
+def _get_scraper() -> CourtListenerScraper:
+    """
+    Return the calling thread's shared scraper for the convenience functions.
+
+    Reusing one instance keeps its pooled HTTP connections alive between
+    calls. Every instance is closed at interpreter exit.
+    """
+    scraper = getattr(_SCRAPER, "scraper", None)
+    if scraper is None:
+        scraper = _SCRAPER.scraper = CourtListenerScraper()
+        atexit.register(scraper.close)
+    return scraper
+
+
 # Convenience functions for backward compatibility and ease of use
 def fetch_recent_cases(
     start_date: Union[str, datetime] = None, limit: int = 100, court: str = None
@@ -391,14 +471,14 @@ def fetch_recent_cases(
         >>> for case in cases:
         ...     print(case.case_name, case.date, case.url)
     """
-    with CourtListenerScraper() as scraper:
-        if start_date:
-            end_date = datetime.now()
-            return scraper.search_cases(
-                start_date=start_date, end_date=end_date, limit=limit, court=court
-            )
-        else:
-            return scraper.get_recent_cases(days=30, limit=limit, court=court)
+    scraper = _get_scraper()
+    if start_date:
+        end_date = datetime.now()
+        return scraper.search_cases(
+            start_date=start_date, end_date=end_date, limit=limit, court=court
+        )
+    else:
+        return scraper.get_recent_cases(days=30, limit=limit, court=court)
 
 
 def search_cases(
@@ -423,10 +503,9 @@ def search_cases(
         >>> from the_junior_associate.courtlistener import search_cases
         >>> cases = search_cases("privacy rights", limit=50)
     """
-    with CourtListenerScraper() as scraper:
-        return scraper.search_cases(
-            query=query, start_date=start_date, end_date=end_date, limit=limit
-        )
+    return _get_scraper().search_cases(
+        query=query, start_date=start_date, end_date=end_date, limit=limit
+    )
 
 
 def get_case_by_id(case_id: str) -> Optional[CaseData]:
@@ -445,5 +524,4 @@ def get_case_by_id(case_id: str) -> Optional[CaseData]:
         >>> if case:
         ...     print(case.case_name)
     """
-    with CourtListenerScraper() as scraper:
-        return scraper.get_case_by_id(case_id)
+    return _get_scraper().get_case_by_id(case_id)
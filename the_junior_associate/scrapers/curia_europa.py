@@ -4,15 +4,114 @@ Curia Europa scraper for The Junior Associate library.
 Curia provides access to European Court of Justice and General Court decisions.
 """
 
-import re
+import atexit
+import threading
 from datetime import datetime
+from itertools import islice
 from typing import List, Optional, Dict, Any, Union
 from urllib.parse import urlencode, quote
 
+from lxml import etree
+
 from ..utils.base import BaseScraper
 from ..utils.data_models import CaseData
 from ..utils.exceptions import ParsingError, DataNotFoundError
-from ..utils.helpers import sanitize_text, validate_date, normalize_court_name
+from ..utils.helpers import (
+    sanitize_text,
+    validate_date,
+    normalize_court_name,
+    compile_pattern,
+)
+
+_CASE_NUMBER_RE = compile_pattern(r"([CT]-\d+/\d+)")
+# Curia court codes by lowercased court name or abbreviation
+_COURT_CODES = {
+    "cjeu": "CJ",
+    "cj": "CJ",
+    "court of justice": "CJ",
+    "gc": "GC",
+    "general court": "GC",
+    "cst": "CST",
+    "civil service tribunal": "CST",
+}
+# Path segment shared by links to individual case documents
+_CASE_LINK_PATH = "/juris/document/"
+# Candidate judgment containers: div#main or a div with one of these classes,
+# most specific first
+_CONTENT_RANK = {"document-content": 0, "judgment-content": 1, "content": 2}
+_CONTENT_XPATH = etree.XPath(
+    " | ".join(
+        ['//div[@id="main"]']
+        + [
+            f'//div[contains(concat(" ", normalize-space(@class), " "), " {name} ")]'
+            for name in _CONTENT_RANK
+        ]
+    )
+)
+_MONTHS = {
+    "January": 1,
+    "February": 2,
+    "March": 3,
+    "April": 4,
+    "May": 5,
+    "June": 6,
+    "July": 7,
+    "August": 8,
+    "September": 9,
+    "October": 10,
+    "November": 11,
+    "December": 12,
+}
+# Court names, dates and citations in one alternation, so the page text is
+# scanned once; match.lastgroup names the kind of each match
+_PAGE_FACTS_RE = compile_pattern(
+    r"(?P<court>(?i:Court of Justice|General Court|Civil Service Tribunal))"
+    r"|(?P<court_code>(?i:CJEU|CJ|GC|CST))"
+    r"|(?P<long_date>(?P<long_day>\d{1,2})\s+(?P<long_month>"
+    + "|".join(_MONTHS)
+    + r")\s+(?P<long_year>\d{4}))"
+    r"|(?P<dmy_date>(?P<dmy_day>\d{1,2})/(?P<dmy_month>\d{1,2})/"
+    r"(?P<dmy_year>\d{4}))"
+    r"|(?P<iso_date>(?P<iso_year>\d{4})-(?P<iso_month>\d{2})-(?P<iso_day>\d{2}))"
+    r"|Case\s+(?P<case>[CT]-\d+/\d+)"
+    r"|Joined\s+Cases\s+(?P<joined>(?P<joined_first>[CT]-\d+/\d+)\s+(?:and|to)\s+"
+    r"(?P<joined_last>[CT]-\d+/\d+))"
+    r"|(?P<number>[CT]-\d+/\d+)"
+    r"|(?P<ecli>ECLI:EU:[CT]:\d{4}:\d+)"
+)
+# Date groups of _PAGE_FACTS_RE, in order of preference
+_DATE_KINDS = ("long_date", "dmy_date", "iso_date")
+# Judges, Presidents, Advocates General and Rapporteurs in one pass
+_JUDGE_RE = compile_pattern(
+    r"(?:Judge|President|Advocate\s+General|Rapporteur:)\s+"
+    r"([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
+)
+# "A v B" or "A v. B", with an optional company suffix on either party
+_PARTIES_RE = compile_pattern(
+    r"([A-Z][a-z\s]+(?:Ltd|SA|GmbH|SpA)?)\s+v\.?\s+([A-Z][a-z\s]+(?:Ltd|SA|GmbH|SpA)?)"
+)
+_SUBJECT_RE = compile_pattern(r"Subject-matter:\s*([^.]+)")
+
+
+def _match_to_date(match) -> datetime:
+    """Build a datetime from a _PAGE_FACTS_RE date match without strptime."""
+    prefix = match.lastgroup[: -len("_date")]
+    day, month, year = (
+        match.group(f"{prefix}_{part}") for part in ("day", "month", "year")
+    )
+    if prefix == "long":
+        month = _MONTHS[month]
+    return datetime(int(year), int(month), int(day))
+
+
+def _find_content_root(root):
+    """Return the most specific judgment container under root, if any."""
+
+    def rank(elem):
+        classes = (elem.get("class") or "").split()
+        return min((_CONTENT_RANK.get(name, 3) for name in classes), default=3)
+
+    return min(_CONTENT_XPATH(root), key=rank, default=None)
 
 
 class CuriaEuropaScraper(BaseScraper):
@@ -83,14 +182,7 @@ class CuriaEuropaScraper(BaseScraper):
 
         if court:
             # Map court names to Curia codes
-            court_mapping = {
-                "CJEU": "CJ",
-                "Court of Justice": "CJ",
-                "GC": "GC",
-                "General Court": "GC",
-                "CST": "CST",
-            }
-            search_params["court"] = court_mapping.get(court, court)
+            search_params["court"] = _COURT_CODES.get(court.lower(), court)
 
         # Language preference
         language = kwargs.get("language", "en")
@@ -106,17 +198,21 @@ class CuriaEuropaScraper(BaseScraper):
 
         try:
             response = self._make_request(url, params=search_params)
-            soup = self._parse_html(response.text)
+            tree = self._parse_tree(response.content, self._response_encoding(response))
         except Exception as e:
             raise ParsingError(f"Failed to parse search results: {str(e)}")
 
         # Parse search results
         cases = []
 
-        # Look for case links in search results
-        case_links = soup.find_all("a", href=re.compile(r"/juris/document/"))
+        # Walk the links lazily, so the page is only scanned up to the limit
+        case_links = (
+            link
+            for link in tree.iter("a")
+            if _CASE_LINK_PATH in (link.get("href") or "")
+        )
 
-        for link in case_links[: params.get("limit", 100)]:
+        for link in islice(case_links, params.get("limit", 100)):
             try:
                 case_data = self._parse_search_result_link(link)
                 if case_data:
@@ -145,26 +241,26 @@ class CuriaEuropaScraper(BaseScraper):
         if not case_id:
             raise ValueError("Case ID is required")
 
+        case = self._get_cached_case(case_id)
+        if case is not None:
+            return case
+
         # Determine URL format
         if case_id.startswith("http"):
             url = case_id
-        elif re.match(r"[CT]-\d+/\d+", case_id):
+        elif _CASE_NUMBER_RE.match(case_id):
             # EU case number format
             cases = self.search_cases(query=case_id, limit=1)
-            if cases:
-                return cases[0]
-            return None
+            return self._cache_case(case_id, cases[0] if cases else None)
         else:
             # Try searching for the case
             cases = self.search_cases(query=case_id, limit=1)
-            if cases:
-                return cases[0]
-            return None
+            return self._cache_case(case_id, cases[0] if cases else None)
 
         try:
             response = self._make_request(url)
-            soup = self._parse_html(response.text)
-            return self._parse_case_detail(soup, url)
+            tree = self._parse_tree(response.content, self._response_encoding(response))
+            return self._cache_case(url, self._parse_case_detail(tree, url))
         except Exception as e:
             self.logger.error(f"Failed to get case {case_id}: {str(e)}")
             return None
@@ -172,7 +268,7 @@ class CuriaEuropaScraper(BaseScraper):
     def _parse_search_result_link(self, link) -> Optional[CaseData]:
         """Parse a search result link into CaseData."""
         try:
-            case_name = sanitize_text(link.get_text())
+            case_name = sanitize_text(link.text_content())
             case_url = link.get("href")
 
             if case_url and not case_url.startswith("http"):
@@ -180,7 +276,7 @@ class CuriaEuropaScraper(BaseScraper):
 
             # Extract case ID from case name or URL
             case_id = ""
-            case_number_match = re.search(r"([CT]-\d+/\d+)", case_name)
+            case_number_match = _CASE_NUMBER_RE.search(case_name)
             if case_number_match:
                 case_id = case_number_match.group(1)
 
@@ -197,142 +293,98 @@ class CuriaEuropaScraper(BaseScraper):
             self.logger.error(f"Error parsing search result link: {str(e)}")
             return None
 
-    def _parse_case_detail(self, soup, url: str) -> Optional[CaseData]:
+    def _parse_case_detail(self, tree, url: str) -> Optional[CaseData]:
         """Parse detailed case page into CaseData."""
         try:
             # Extract case name from title or heading
-            case_name = ""
-            title_elem = soup.find("title")
-            if title_elem:
-                case_name = sanitize_text(title_elem.get_text())
+            case_name = sanitize_text(tree.findtext(".//title") or "")
 
             # Try h1 if title doesn't work
             if not case_name:
-                h1_elem = soup.find("h1")
-                if h1_elem:
-                    case_name = sanitize_text(h1_elem.get_text())
+                h1_elem = tree.find(".//h1")
+                if h1_elem is not None:
+                    case_name = sanitize_text(h1_elem.text_content())
 
             # Extract court and date information
             court_name = ""
             case_date = None
-            citations = []
-
-            # Look for court information
-            court_patterns = [
-                r"(Court of Justice|General Court|Civil Service Tribunal)",
-                r"(CJEU|CJ|GC|CST)",
-            ]
-
-            page_text = soup.get_text()
-            for pattern in court_patterns:
-                court_matches = re.findall(pattern, page_text, re.IGNORECASE)
-                if court_matches:
-                    court_name = normalize_court_name(court_matches[0])
-                    break
+
+            # Scan only the judgment container, falling back to the whole body
+            content = _find_content_root(tree)
+            if content is None:
+                content = tree.find(".//body")
+            page_text = self._content_text(tree if content is None else content)
+
+            # Collect court names, dates and citations in a single scan
+            first_match = {}
+            case_refs, joined_cases, case_numbers, eclis = [], [], [], []
+            for match in _PAGE_FACTS_RE.finditer(page_text):
+                kind = match.lastgroup
+                if kind == "case":
+                    case_refs.append(match.group("case"))
+                    case_numbers.append(match.group("case"))
+                elif kind == "joined":
+                    joined_cases.append(match.group("joined"))
+                    case_numbers.append(match.group("joined_first"))
+                    case_numbers.append(match.group("joined_last"))
+                elif kind == "number":
+                    case_numbers.append(match.group("number"))
+                elif kind == "ecli":
+                    eclis.append(match.group("ecli"))
+                elif kind not in first_match:
+                    first_match[kind] = match
+
+            # Look for court information; full names win over abbreviations
+            court_match = first_match.get("court") or first_match.get("court_code")
+            if court_match:
+                court_name = normalize_court_name(court_match.group())
 
             # Look for date patterns
-            date_patterns = [
-                r"(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})",
-                r"(\d{1,2}/\d{1,2}/\d{4})",
-                r"(\d{4}-\d{2}-\d{2})",
-            ]
-
-            for pattern in date_patterns:
-                date_matches = re.findall(pattern, page_text)
-                if date_matches:
+            for kind in _DATE_KINDS:
+                if kind in first_match:
                     try:
-                        # Try different date formats
-                        date_str = date_matches[0]
-                        if "-" in date_str:
-                            case_date = datetime.strptime(date_str, "%Y-%m-%d")
-                        elif "/" in date_str:
-                            case_date = datetime.strptime(date_str, "%d/%m/%Y")
-                        else:
-                            case_date = datetime.strptime(date_str, "%d %B %Y")
+                        case_date = _match_to_date(first_match[kind])
                         break
                     except ValueError:
                         continue
 
-            # Extract case numbers and citations
-            citation_patterns = [
-                r"Case\s+([CT]-\d+/\d+)",
-                r"Joined\s+Cases\s+([CT]-\d+/\d+\s+(?:and|to)\s+[CT]-\d+/\d+)",
-                r"([CT]-\d+/\d+)",
-                r"ECLI:EU:[CT]:\d{4}:\d+",
-            ]
-
-            for pattern in citation_patterns:
-                citation_matches = re.findall(pattern, page_text)
-                if citation_matches:
-                    citations.extend(citation_matches)
-
-            # Extract full text content
-            full_text = ""
-            # Look for main content area
-            content_selectors = [
-                "div.document-content",
-                "div.judgment-content",
-                "div.content",
-                "div#main",
-                "body",
-            ]
-
-            for selector in content_selectors:
-                content_div = soup.select_one(selector)
-                if content_div:
-                    # Remove navigation and other non-content elements
-                    for unwanted in content_div.find_all(
-                        ["nav", "header", "footer", "script", "style"]
-                    ):
-                        unwanted.decompose()
-                    full_text = sanitize_text(content_div.get_text())
-                    break
+            # Extract case numbers and citations; a "Case C-1/23" reference
+            # also yields the bare number, so keep only the first occurrence
+            citations = list(
+                dict.fromkeys(case_refs + joined_cases + case_numbers + eclis)
+            )
+
+            # Extract full text content from the main content area
+            full_text = sanitize_text(page_text)
 
             # Extract judges and advocates general
-            judges = []
-            judge_patterns = [
-                r"Judge\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                r"President\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                r"Advocate\s+General\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                r"Rapporteur:\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-            ]
-
-            for pattern in judge_patterns:
-                judge_matches = re.findall(
-                    pattern, full_text[:3000]
-                )  # Look in first part
-                judges.extend(judge_matches)
-
-            judges = list(set(judges[:5]))  # Limit and dedupe
+            judges = {}
+
+            for match in _JUDGE_RE.finditer(full_text, 0, 3000):  # Look in first part
+                judges[match.group(1)] = None
+                if len(judges) >= 5:
+                    break
+
+            judges = list(judges)
 
             # Extract case ID from citations or case name
             case_id = ""
             if citations:
                 case_id = citations[0]
             else:
-                case_number_match = re.search(r"([CT]-\d+/\d+)", case_name)
+                case_number_match = _CASE_NUMBER_RE.search(case_name)
                 if case_number_match:
                     case_id = case_number_match.group(1)
 
             # Extract parties
             parties = []
-            party_patterns = [
-                r"([A-Z][a-z\s]+(?:Ltd|SA|GmbH|SpA)?)\s+v\s+([A-Z][a-z\s]+(?:Ltd|SA|GmbH|SpA)?)",
-                r"([A-Z][a-z\s]+)\s+v\.\s+([A-Z][a-z\s]+)",
-            ]
-
-            for pattern in party_patterns:
-                party_matches = re.findall(pattern, case_name)
-                if party_matches:
-                    for match in party_matches[0]:
-                        if match.strip():
-                            parties.append(match.strip())
-                    break
+            parties_match = _PARTIES_RE.search(case_name)
+            if parties_match:
+                parties = [party.strip() for party in parties_match.groups()]
 
             # Extract legal issues/subject matter
             legal_issues = []
-            subject_pattern = r"Subject-matter:\s*([^.]+)"
-            subject_matches = re.findall(subject_pattern, page_text)
+            subject_matches = _SUBJECT_RE.findall(page_text)
             if subject_matches:
                 legal_issues = [issue.strip() for issue in subject_matches[:3]]
 
@@ -356,6 +408,23 @@ class CuriaEuropaScraper(BaseScraper):
             return None
 
 
+_SCRAPER = threading.local()
+
+
+def _get_scraper() -> CuriaEuropaScraper:
+    """
+    Return the calling thread's shared scraper for the convenience functions.
+
+    Reusing one instance keeps its pooled HTTP connections alive between
+    calls. Every instance is closed at interpreter exit.
+    """
+    scraper = getattr(_SCRAPER, "scraper", None)
+    if scraper is None:
+        scraper = _SCRAPER.scraper = CuriaEuropaScraper()
+        atexit.register(scraper.close)
+    return scraper
+
+
 # Convenience functions
 def get_case_by_id(case_id: str) -> Optional[CaseData]:
     """
@@ -373,8 +442,7 @@ def get_case_by_id(case_id: str) -> Optional[CaseData]:
         >>> if case:
         ...     print(case.case_name)
     """
-    with CuriaEuropaScraper() as scraper:
-        return scraper.get_case_by_id(case_id)
+    return _get_scraper().get_case_by_id(case_id)
 
 
 def search_cases(
@@ -401,11 +469,10 @@ def search_cases(
         >>> from the_junior_associate.curia_europa import search_cases
         >>> cases = search_cases("fundamental rights", court="CJEU")
     """
-    with CuriaEuropaScraper() as scraper:
-        return scraper.search_cases(
-            query=query,
-            start_date=start_date,
-            end_date=end_date,
-            court=court,
-            limit=limit,
-        )
+    return _get_scraper().search_cases(
+        query=query,
+        start_date=start_date,
+        end_date=end_date,
+        court=court,
+        limit=limit,
+    )
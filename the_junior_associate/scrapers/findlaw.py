@@ -4,14 +4,28 @@ FindLaw scraper for The Junior Associate library.
 FindLaw provides access to US Supreme Court and state case law collection.
 """
 
-import re
 from datetime import datetime
+from itertools import islice
 from typing import List, Optional, Dict, Any, Union
 
+from lxml import etree
+
 from ..utils.base import BaseScraper
 from ..utils.data_models import CaseData
 from ..utils.exceptions import ParsingError
-from ..utils.helpers import sanitize_text, validate_date, normalize_court_name
+from ..utils.helpers import (
+    sanitize_text,
+    validate_date,
+    normalize_court_name,
+    compile_pattern,
+)
+
+# Path segment shared by links to individual cases
+_CASE_LINK_PATH = "/case/"
+_CONTENT_DIV_XPATH = etree.XPath(
+    '//div[contains(concat(" ", normalize-space(@class), " "), " content ")]'
+)
+_CASE_ID_RE = compile_pattern(r"/case/([^/]+)")
 
 
 class FindLawScraper(BaseScraper):
@@ -49,27 +63,31 @@ class FindLawScraper(BaseScraper):
 
         try:
             response = self._make_request(url, params=search_params)
-            soup = self._parse_html(response.text)
+            tree = self._parse_tree(response.content, self._response_encoding(response))
         except Exception as e:
             raise ParsingError(f"Failed to parse search results: {str(e)}")
 
-        cases = []
-        case_links = soup.find_all("a", href=re.compile(r"/case/"))
+        case_urls = []
+        # Walk the links lazily, so the page is only scanned up to the limit
+        case_links = (
+            link
+            for link in tree.iter("a")
+            if _CASE_LINK_PATH in (link.get("href") or "")
+        )
 
-        for link in case_links[: params.get("limit", 100)]:
+        for link in islice(case_links, params.get("limit", 100)):
             try:
                 case_url = link.get("href")
                 if not case_url.startswith("http"):
                     case_url = f"{self.base_url}{case_url}"
-
-                case_data = self._scrape_case_from_url(case_url)
-                if case_data:
-                    cases.append(case_data)
+                case_urls.append(case_url)
             except Exception as e:
                 self.logger.warning(f"Failed to parse case: {str(e)}")
                 continue
 
-        return cases
+        # Each case page is a separate request; fetch them concurrently
+        cases = self._map_concurrent(self._scrape_case_from_url, case_urls)
+        return [case_data for case_data in cases if case_data]
 
     def get_case_by_id(self, case_id: str) -> Optional[CaseData]:
         """Retrieve a specific case by its FindLaw ID."""
@@ -81,15 +99,21 @@ class FindLawScraper(BaseScraper):
 
     def _scrape_case_from_url(self, url: str) -> Optional[CaseData]:
         """Scrape case data from a FindLaw case URL."""
+        case = self._get_cached_case(url)
+        if case is not None:
+            return case
+
         try:
             response = self._make_request(url)
-            soup = self._parse_html(response.text)
+            tree = self._parse_tree(response.content, self._response_encoding(response))
 
             # Extract case name
             case_name = ""
-            title_elem = soup.find("h1") or soup.find("title")
-            if title_elem:
-                case_name = sanitize_text(title_elem.get_text())
+            title_elem = tree.find(".//h1")
+            if title_elem is None:
+                title_elem = tree.find(".//title")
+            if title_elem is not None:
+                case_name = sanitize_text(title_elem.text_content())
 
             # Extract case details
             court_name = "FindLaw"
@@ -97,15 +121,16 @@ class FindLawScraper(BaseScraper):
             full_text = ""
 
             # Try to extract content
-            content_div = soup.find("div", class_="content") or soup.find("main")
-            if content_div:
-                full_text = sanitize_text(content_div.get_text())
+            content_divs = _CONTENT_DIV_XPATH(tree)
+            content_div = content_divs[0] if content_divs else tree.find(".//main")
+            if content_div is not None:
+                full_text = sanitize_text(content_div.text_content())
 
             # Extract case ID from URL
-            case_id = re.search(r"/case/([^/]+)", url)
+            case_id = _CASE_ID_RE.search(url)
             case_id = case_id.group(1) if case_id else ""
 
-            return CaseData(
+            case = CaseData(
                 case_name=case_name,
                 case_id=case_id,
                 court=court_name,
@@ -115,6 +140,7 @@ class FindLawScraper(BaseScraper):
                 jurisdiction=self.jurisdiction,
                 metadata={"source": "FindLaw"},
             )
+            return self._cache_case(url, case)
 
         except Exception as e:
             self.logger.error(f"Error scraping case from {url}: {str(e)}")
@@ -5,15 +5,150 @@ HKLII (Hong Kong Legal Information Institute) provides free access
 to Hong Kong case law and legislation.
 """
 
-import re
+import atexit
+import threading
 from datetime import datetime
-from typing import List, Optional, Dict, Any, Union
+from itertools import islice
+from string import digits
+from typing import List, Optional, Dict, Any, Tuple, Union
 from urllib.parse import urlencode, quote
 
+from lxml import etree
+
 from ..utils.base import BaseScraper
 from ..utils.data_models import CaseData
 from ..utils.exceptions import ParsingError, DataNotFoundError
-from ..utils.helpers import sanitize_text, validate_date, normalize_court_name
+from ..utils.helpers import (
+    sanitize_text,
+    validate_date,
+    normalize_court_name,
+    compile_pattern,
+)
+
+# Path segment shared by links to individual cases
+_CASE_LINK_PATH = "/hk/cases/"
+# Candidate judgment containers, ranked by _CONTENT_RANK
+_CONTENT_XPATH = etree.XPath(
+    '//div[@id="main"]'
+    ' | //div[contains(concat(" ", normalize-space(@class), " "), " judgment ")]'
+    ' | //div[contains(concat(" ", normalize-space(@class), " "), " content ")]'
+)
+_CONTENT_RANK = {"judgment": 0, "content": 1}
+# Court names, dates and citations in one alternation, so the page text is
+# scanned once; match.lastgroup names the kind of each match
+_PAGE_FACTS_RE = compile_pattern(
+    r"(?P<court>(?i:Court of Final Appeal|Court of Appeal|Court of First Instance))"
+    r"|(?P<court_code>(?i:CFA|CA|CFI|DC|MC))"
+    r"|(?P<court_other>(?i:High Court|District Court|Magistrates|Tribunal))"
+    r"|(?P<long_date>\d{1,2}\s+(?:January|February|March|April|May|June|July"
+    r"|August|September|October|November|December)\s+\d{4})"
+    r"|(?P<iso_date>\d{4}-\d{2}-\d{2})"
+    r"|(?P<dmy_date>\d{1,2}/\d{1,2}/\d{4})"
+    r"|(?P<neutral>\[(?P<neutral_year>\d{4})\]\s+"
+    r"(?P<neutral_court>HKCFA|HKCA|HKCFI)\s+(?P<neutral_number>\d+))"
+    r"|(?P<unbracketed>(?P<unbracketed_year>\d{4})\s+"
+    r"(?P<unbracketed_court>HKCFA|HKCA|HKCFI)\s+(?P<unbracketed_number>\d+))"
+    r"|(?P<report>\[(?P<report_year>\d{4})\]\s+(?P<report_volume>\d+)\s+"
+    r"(?P<report_series>HKC|HKLRD))"
+)
+# Court, date and citations normally appear in a judgment's opening text;
+# it is scanned on its own before falling back to the whole judgment
+_HEADER_CHARS = 8192
+# Court groups of _PAGE_FACTS_RE, in order of preference
+_COURT_KINDS = ("court", "court_code", "court_other")
+# strptime format for each date group of _PAGE_FACTS_RE, in order of preference
+_DATE_FORMATS = {
+    "long_date": "%d %B %Y",
+    "iso_date": "%Y-%m-%d",
+    "dmy_date": "%d/%m/%Y",
+}
+# Citation groups of _PAGE_FACTS_RE and the parts each is formatted from
+_CITATION_PARTS = {
+    "neutral": ("neutral_year", "neutral_court", "neutral_number"),
+    "unbracketed": ("unbracketed_year", "unbracketed_court", "unbracketed_number"),
+    "report": ("report_year", "report_volume", "report_series"),
+}
+# Judges named with a title, or by surname and judicial suffix
+_JUDGE_RE = compile_pattern(
+    r"(?:Mr|Mrs|Ms)\s+Justice\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
+    r"|(?:Chief Justice|CJ)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)"
+    r"|([A-Z][a-z]+\s+(?:PJ|JA|J\.?))"
+)
+# Judicial title suffixes such as "Fok PJ", "Lam JA" or "Lee J."
+_JUDGE_SUFFIX_RE = compile_pattern(r"\s+(?:PJ|JA|J\.?)$")
+_PARTY_RE = compile_pattern(
+    r"([A-Z][a-z\s]+(?:Limited|Ltd)?)\s+v\.\s+([A-Z][a-z\s]+(?:Limited|Ltd)?)"
+)
+
+
+def _find_content_root(root):
+    """Return the most specific judgment container under root, if any."""
+
+    def rank(elem):
+        classes = (elem.get("class") or "").split()
+        return min((_CONTENT_RANK.get(name, 2) for name in classes), default=2)
+
+    return min(_CONTENT_XPATH(root), key=rank, default=None)
+
+
+def _case_id_from_url(url: str) -> str:
+    """
+    Extract the HKLII case ID (e.g. hk/cases/hkcfa/2023/15) from a URL.
+
+    Case URLs have a fixed court/year/number shape, so plain string splitting
+    is enough; anything after the number (such as ".html") is dropped.
+    """
+    _, found, rest = url.partition(_CASE_LINK_PATH)
+    court, _, rest = rest.partition("/")
+    year, _, number = rest.partition("/")
+    number = number[: len(number) - len(number.lstrip(digits))]
+    if not (found and court and year.isdigit() and number):
+        return ""
+    return f"hk/cases/{court}/{year}/{number}"
+
+
+def _scan_page_facts(text: str, end: int) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Scan text[:end] once with _PAGE_FACTS_RE.
+
+    Returns the first court and date match of each kind, and all citations
+    grouped by citation kind.
+    """
+    first_match = {}
+    citations_by_kind = {kind: [] for kind in _CITATION_PARTS}
+    for match in _PAGE_FACTS_RE.finditer(text, 0, end):
+        kind = match.lastgroup
+        if kind in citations_by_kind:
+            year, middle, last = match.group(*_CITATION_PARTS[kind])
+            citations_by_kind[kind].append(f"[{year}] {middle} {last}")
+        elif kind not in first_match:
+            first_match[kind] = match.group(kind)
+
+    citations = [
+        citation
+        for kind_citations in citations_by_kind.values()
+        for citation in kind_citations
+    ]
+    return first_match, citations
+
+
+def _court_from_facts(first_match: Dict[str, str]) -> str:
+    """Return the preferred court name; full names win over abbreviations."""
+    for kind in _COURT_KINDS:
+        if kind in first_match:
+            return normalize_court_name(first_match[kind])
+    return ""
+
+
+def _date_from_facts(first_match: Dict[str, str]) -> Optional[datetime]:
+    """Return the first date that parses, in order of format preference."""
+    for kind, date_format in _DATE_FORMATS.items():
+        if kind in first_match:
+            try:
+                return datetime.strptime(first_match[kind], date_format)
+            except ValueError:
+                continue
+    return None
 
 
 class HKLIIScraper(BaseScraper):
@@ -95,17 +230,21 @@ class HKLIIScraper(BaseScraper):
 
         try:
             response = self._make_request(url, params=search_params)
-            soup = self._parse_html(response.text)
+            tree = self._parse_tree(response.content, self._response_encoding(response))
         except Exception as e:
             raise ParsingError(f"Failed to parse search results: {str(e)}")
 
         # Parse search results
         cases = []
 
-        # Look for case links in search results
-        case_links = soup.find_all("a", href=re.compile(r"/hk/cases/"))
+        # Walk the links lazily, so the page is only scanned up to the limit
+        case_links = (
+            link
+            for link in tree.iter("a")
+            if _CASE_LINK_PATH in (link.get("href") or "")
+        )
 
-        for link in case_links[: params.get("limit", 100)]:
+        for link in islice(case_links, params.get("limit", 100)):
             try:
                 case_data = self._parse_search_result_link(link)
                 if case_data:
@@ -134,6 +273,10 @@ class HKLIIScraper(BaseScraper):
         if not case_id:
             raise ValueError("Case ID is required")
 
+        case = self._get_cached_case(case_id)
+        if case is not None:
+            return case
+
         # Determine URL format
         if case_id.startswith("http"):
             url = case_id
@@ -142,14 +285,12 @@ class HKLIIScraper(BaseScraper):
         else:
             # Try searching for the citation
             cases = self.search_cases(query=case_id, limit=1)
-            if cases:
-                return cases[0]
-            return None
+            return self._cache_case(case_id, cases[0] if cases else None)
 
         try:
             response = self._make_request(url)
-            soup = self._parse_html(response.text)
-            return self._parse_case_detail(soup, url)
+            tree = self._parse_tree(response.content, self._response_encoding(response))
+            return self._cache_case(case_id, self._parse_case_detail(tree, url))
         except Exception as e:
             self.logger.error(f"Failed to get case {case_id}: {str(e)}")
             return None
@@ -157,18 +298,14 @@ class HKLIIScraper(BaseScraper):
     def _parse_search_result_link(self, link) -> Optional[CaseData]:
         """Parse a search result link into CaseData."""
         try:
-            case_name = sanitize_text(link.get_text())
+            case_name = sanitize_text(link.text_content())
             case_url = link.get("href")
 
             if case_url and not case_url.startswith("http"):
                 case_url = f"{self.base_url}{case_url}"
 
             # Extract case ID from URL
-            case_id = ""
-            if case_url:
-                case_id_match = re.search(r"/hk/cases/([^/]+/\d+/\d+)", case_url)
-                if case_id_match:
-                    case_id = f"hk/cases/{case_id_match.group(1)}"
+            case_id = _case_id_from_url(case_url) if case_url else ""
 
             # Basic case data from search result
             return CaseData(
@@ -183,127 +320,63 @@ class HKLIIScraper(BaseScraper):
             self.logger.error(f"Error parsing search result link: {str(e)}")
             return None
 
-    def _parse_case_detail(self, soup, url: str) -> Optional[CaseData]:
+    def _parse_case_detail(self, tree, url: str) -> Optional[CaseData]:
         """Parse detailed case page into CaseData."""
         try:
             # Extract case name from title or heading
-            case_name = ""
-            title_elem = soup.find("title")
-            if title_elem:
-                case_name = sanitize_text(title_elem.get_text())
+            case_name = sanitize_text(tree.findtext(".//title") or "")
 
             # Try h1 if title doesn't work
             if not case_name:
-                h1_elem = soup.find("h1")
-                if h1_elem:
-                    case_name = sanitize_text(h1_elem.get_text())
-
-            # Extract court and date information
-            court_name = ""
-            case_date = None
-            citations = []
-
-            # Look for court information
-            court_patterns = [
-                r"(Court of Final Appeal|Court of Appeal|Court of First Instance)",
-                r"(CFA|CA|CFI|DC|MC)",
-                r"(High Court|District Court|Magistrates|Tribunal)",
-            ]
-
-            page_text = soup.get_text()
-            for pattern in court_patterns:
-                court_matches = re.findall(pattern, page_text, re.IGNORECASE)
-                if court_matches:
-                    court_name = normalize_court_name(court_matches[0])
-                    break
-
-            # Look for date patterns
-            date_patterns = [
-                r"(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})",
-                r"(\d{4}-\d{2}-\d{2})",
-                r"(\d{1,2}/\d{1,2}/\d{4})",
-            ]
-
-            for pattern in date_patterns:
-                date_matches = re.findall(pattern, page_text)
-                if date_matches:
-                    try:
-                        # Try different date formats
-                        date_str = date_matches[0]
-                        if "-" in date_str:
-                            case_date = datetime.strptime(date_str, "%Y-%m-%d")
-                        elif "/" in date_str:
-                            case_date = datetime.strptime(date_str, "%d/%m/%Y")
-                        else:
-                            case_date = datetime.strptime(date_str, "%d %B %Y")
-                        break
-                    except ValueError:
-                        continue
-
-            # Extract citations
-            citation_patterns = [
-                r"\[(\d{4})\]\s+(HKCFA|HKCA|HKCFI)\s+(\d+)",
-                r"(\d{4})\s+(HKCFA|HKCA|HKCFI)\s+(\d+)",
-                r"\[(\d{4})\]\s+(\d+)\s+(HKC|HKLRD)",
-            ]
-
-            for pattern in citation_patterns:
-                citation_matches = re.findall(pattern, page_text)
-                if citation_matches:
-                    for match in citation_matches:
-                        if len(match) == 3:
-                            citations.append(f"[{match[0]}] {match[1]} {match[2]}")
-
-            # Extract full text content
+                h1_elem = tree.find(".//h1")
+                if h1_elem is not None:
+                    case_name = sanitize_text(h1_elem.text_content())
+
+            # Whole-document text, read once and shared by every fact scan;
+            # taken before _content_text strips navigation from the tree
+            page_text = tree.text_content()
+
+            # Look for main content area for the judgment text and judges.
+            # Without a judgment container this walks <body> a second time:
+            # page_text keeps the head, header and navigation text that the
+            # fact scans need and full_text must leave out
             full_text = ""
-            # Look for main content area
-            content_selectors = ["div.judgment", "div.content", "div#main", "body"]
-
-            for selector in content_selectors:
-                content_div = soup.select_one(selector)
-                if content_div:
-                    # Remove navigation and other non-content elements
-                    for unwanted in content_div.find_all(
-                        ["nav", "header", "footer", "script", "style"]
-                    ):
-                        unwanted.decompose()
-                    full_text = sanitize_text(content_div.get_text())
-                    break
+            content = _find_content_root(tree)
+            if content is None:
+                content = tree.find(".//body")
+            if content is not None:
+                full_text = sanitize_text(self._content_text(content))
+
+            # Collect court, date and citations from the opening text first,
+            # and rescan the whole page only for whatever it lacks
+            first_match, citations = _scan_page_facts(page_text, _HEADER_CHARS)
+            court_name = _court_from_facts(first_match)
+            case_date = _date_from_facts(first_match)
+            if len(page_text) > _HEADER_CHARS and not (
+                court_name and case_date and citations
+            ):
+                first_match, all_citations = _scan_page_facts(page_text, len(page_text))
+                court_name = court_name or _court_from_facts(first_match)
+                case_date = case_date or _date_from_facts(first_match)
+                citations = citations or all_citations
 
             # Extract judges
-            judges = []
-            judge_patterns = [
-                r"(?:Mr|Mrs|Ms)\s+Justice\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                r"(?:Chief Justice|CJ)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)",
-                r"([A-Z][a-z]+\s+(?:PJ|JA|J\.?))",
-            ]
-
-            for pattern in judge_patterns:
-                judge_matches = re.findall(
-                    pattern, full_text[:3000]
-                )  # Look in first part
-                judges.extend(
-                    [
-                        match.replace(" PJ", "")
-                        .replace(" JA", "")
-                        .replace(" J.", "")
-                        .replace(" J", "")
-                        for match in judge_matches
-                    ]
-                )
-
-            judges = list(set(judges[:5]))  # Limit and dedupe
+            judges = {}
+
+            for match in _JUDGE_RE.finditer(full_text, 0, 3000):  # Look in first part
+                judge = _JUDGE_SUFFIX_RE.sub("", match.group(match.lastindex))
+                judges[judge] = None
+                if len(judges) >= 5:
+                    break
+
+            judges = list(judges)
 
             # Extract case ID from URL
-            case_id = ""
-            case_id_match = re.search(r"/hk/cases/([^/]+/\d+/\d+)", url)
-            if case_id_match:
-                case_id = f"hk/cases/{case_id_match.group(1)}"
+            case_id = _case_id_from_url(url)
 
             # Extract parties
             parties = []
-            party_pattern = r"([A-Z][a-z\s]+(?:Limited|Ltd)?)\s+v\.\s+([A-Z][a-z\s]+(?:Limited|Ltd)?)"
-            party_matches = re.findall(party_pattern, case_name)
+            party_matches = _PARTY_RE.findall(case_name)
             if party_matches:
                 for match in party_matches[0]:
                     if match.strip():
@@ -328,6 +401,23 @@ class HKLIIScraper(BaseScraper):
             return None
 
 
+_SCRAPER = threading.local()
+
+
+def _get_scraper() -> HKLIIScraper:
+    """
+    Return the calling thread's shared scraper for the convenience functions.
+
+    Reusing one instance keeps its pooled HTTP connections alive between
+    calls. Every instance is closed at interpreter exit.
+    """
+    scraper = getattr(_SCRAPER, "scraper", None)
+    if scraper is None:
+        scraper = _SCRAPER.scraper = HKLIIScraper()
+        atexit.register(scraper.close)
+    return scraper
+
+
 # Convenience functions
 def get_case_by_id(case_id: str) -> Optional[CaseData]:
     """
@@ -345,8 +435,7 @@ def get_case_by_id(case_id: str) -> Optional[CaseData]:
         >>> if case:
         ...     print(case.case_name)
     """
-    with HKLIIScraper() as scraper:
-        return scraper.get_case_by_id(case_id)
+    return _get_scraper().get_case_by_id(case_id)
 
 
 def search_cases(
@@ -373,11 +462,10 @@ def search_cases(
         >>> from the_junior_associate.hklii import search_cases
         >>> cases = search_cases("basic law", court="CFA")
     """
-    with HKLIIScraper() as scraper:
-        return scraper.search_cases(
-            query=query,
-            start_date=start_date,
-            end_date=end_date,
-            court=court,
-            limit=limit,
-        )
+    return _get_scraper().search_cases(
+        query=query,
+        start_date=start_date,
+        end_date=end_date,
+        court=court,
+        limit=limit,
+    )
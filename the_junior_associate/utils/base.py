@@ -2,12 +2,36 @@
 Base scraper class for The Junior Associate library.
 """
 
+import copy
+import hashlib
+import json
+import os
 import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any, Union
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Dict,
+    Any,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
 from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.dammit import EncodingDetector
+import lxml.html
+from lxml import etree
 
 from .exceptions import (
     ScrapingError,
@@ -19,6 +43,22 @@ from .exceptions import (
 from .data_models import CaseData
 from .helpers import setup_logger, validate_date, sanitize_text
 
+try:
+    from requests_cache import CachedSession
+except ImportError:  # requests-cache is an optional dependency
+    CachedSession = None
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional dependency
+    orjson = None
+
+# Directory for on-disk caches shared by all scrapers
+CACHE_DIR = os.path.expanduser("~/.the_junior_associate")
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class BaseScraper(ABC):
     """
@@ -32,6 +72,31 @@ class BaseScraper(ABC):
     - Logging
     """
 
+    # Host pools cached by the session's adapter, and keep-alive
+    # connections held per host pool
+    POOL_CONNECTIONS = 16
+    POOL_MAXSIZE = 32
+    # BeautifulSoup tree builder used by _parse_html; html.parser is the
+    # fallback when it is unavailable
+    PARSER = "lxml"
+    # Elements whose text never belongs to a judgment body
+    NON_CONTENT_TAGS = frozenset({"nav", "header", "footer", "script", "style"})
+    # Worker threads used by _map_concurrent
+    MAX_WORKERS = 8
+    # Parsed case pages memoized process-wide by _parse_cached
+    PARSE_CACHE_SIZE = 1024
+    _parse_cache: "OrderedDict[tuple, CaseData]" = OrderedDict()
+    _parse_cache_lock = threading.Lock()
+    # Cases returned by get_case_by_id, memoized process-wide per scraper
+    # class and lookup key for cache_expire_after seconds
+    CASE_CACHE_SIZE = 1024
+    _case_cache: "OrderedDict[tuple, Tuple[CaseData, float]]" = OrderedDict()
+    _case_cache_lock = threading.Lock()
+    # robots.txt rules cached process-wide per origin, valid for ROBOTS_TTL
+    ROBOTS_TTL = 3600
+    _robots_cache: Dict[str, Tuple[RobotFileParser, float]] = {}
+    _robots_lock = threading.Lock()
+
     def __init__(
         self,
         rate_limit: float = 1.0,
@@ -39,6 +104,9 @@ class BaseScraper(ABC):
         max_retries: int = 3,
         retry_delay: float = 1.0,
         user_agent: str = None,
+        cache_disabled: bool = False,
+        cache_expire_after: int = 86400,
+        respect_robots: bool = False,
     ):
         """
         Initialize the base scraper.
@@ -49,25 +117,41 @@ class BaseScraper(ABC):
             max_retries: Maximum number of retry attempts
             retry_delay: Base delay between retries in seconds
             user_agent: Custom user agent string
+            cache_disabled: Skip the on-disk HTTP cache even if requests-cache
+                is installed, and the in-process case cache
+            cache_expire_after: Seconds before a cached response goes stale
+            respect_robots: Refuse to fetch URLs disallowed by the site's
+                robots.txt
         """
         self.rate_limit = rate_limit
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.respect_robots = respect_robots
+        self._case_cache_ttl = None if cache_disabled else cache_expire_after
         self._last_request_time = 0.0
+        self._rate_lock = threading.Lock()
 
         # Set up session
-        self.session = requests.Session()
+        self.session = self._create_session(cache_disabled, cache_expire_after)
         self.session.headers.update(
             {
                 "User-Agent": user_agent or self._default_user_agent(),
                 "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
                 "Accept-Language": "en-US,en;q=0.5",
-                "Accept-Encoding": "gzip, deflate",
+                # gzip and deflate, plus br when a Brotli decoder is installed
+                "Accept-Encoding": requests.utils.DEFAULT_ACCEPT_ENCODING,
                 "Connection": "keep-alive",
                 "Upgrade-Insecure-Requests": "1",
             }
         )
+        # Retries stay in _make_request so backoff and error mapping live in
+        # one place; the adapter only provides keep-alive pooling.
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS, pool_maxsize=self.POOL_MAXSIZE
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         # Set up logging
         self.logger = setup_logger(f"{self.__class__.__name__}")
@@ -84,6 +168,24 @@ class BaseScraper(ABC):
         """Jurisdiction covered by this scraper."""
         pass
 
+    def _create_session(
+        self, cache_disabled: bool, cache_expire_after: int
+    ) -> requests.Session:
+        """
+        Create the HTTP session, backed by an SQLite response cache when
+        requests-cache is installed and caching is not disabled.
+        """
+        if cache_disabled or CachedSession is None:
+            return requests.Session()
+
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        return CachedSession(
+            cache_name=os.path.join(CACHE_DIR, "http_cache"),
+            backend="sqlite",
+            expire_after=cache_expire_after,
+            allowable_methods=("GET",),
+        )
+
     def _default_user_agent(self) -> str:
         """Default user agent string."""
         return (
@@ -92,14 +194,213 @@ class BaseScraper(ABC):
         )
 
     def _respect_rate_limit(self):
-        """Enforce rate limiting between requests."""
+        """
+        Enforce rate limiting between requests.
+
+        Each caller reserves the next request slot under a lock, so concurrent
+        requests issued through _map_concurrent stay spaced by rate_limit.
+        """
         if self.rate_limit > 0:
-            elapsed = time.time() - self._last_request_time
-            if elapsed < self.rate_limit:
-                sleep_time = self.rate_limit - elapsed
+            with self._rate_lock:
+                now = time.time()
+                sleep_time = max(0.0, self._last_request_time + self.rate_limit - now)
+                self._last_request_time = now + sleep_time
+            if sleep_time > 0:
                 self.logger.debug(f"Rate limiting: sleeping for {sleep_time:.2f}s")
                 time.sleep(sleep_time)
 
+    def _robots_allows(self, url: str) -> bool:
+        """
+        Check a URL against its site's robots.txt.
+
+        Rules are fetched at most once per origin every ROBOTS_TTL seconds
+        and shared by all scrapers in the process.
+
+        Args:
+            url: URL about to be requested
+
+        Returns:
+            True if this scraper's user agent may fetch the URL
+        """
+        parts = urlsplit(url)
+        origin = f"{parts.scheme}://{parts.netloc}"
+
+        with self._robots_lock:
+            entry = self._robots_cache.get(origin)
+        if entry is None or entry[1] <= time.time():
+            parser = self._fetch_robots(origin)
+            with self._robots_lock:
+                self._robots_cache[origin] = (parser, time.time() + self.ROBOTS_TTL)
+        else:
+            parser = entry[0]
+
+        return parser.can_fetch(self.session.headers["User-Agent"], url)
+
+    def _fetch_robots(self, origin: str) -> RobotFileParser:
+        """Fetch and parse robots.txt for an origin, allowing all if absent."""
+        parser = RobotFileParser(f"{origin}/robots.txt")
+        self._respect_rate_limit()
+        try:
+            response = self.session.get(parser.url, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            self.logger.warning(f"Could not fetch {parser.url}: {str(e)}")
+            parser.allow_all = True
+            return parser
+
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(response.text.splitlines())
+        return parser
+
+    def _parse_cached(
+        self,
+        url: str,
+        content: bytes,
+        parse: Callable[[bytes], Optional[CaseData]],
+    ) -> Optional[CaseData]:
+        """
+        Parse a case page through a process-wide LRU cache.
+
+        Entries are keyed on the scraper class, URL and a digest of the page,
+        so an unchanged page (e.g. one served from the HTTP cache) skips HTML
+        parsing and regex extraction. Callers always receive their own copy.
+
+        Args:
+            url: URL the page was fetched from
+            content: Raw page bytes
+            parse: Function turning the page bytes into CaseData
+
+        Returns:
+            CaseData object or None if parsing failed
+        """
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        key = (type(self).__name__, url, digest)
+
+        with self._parse_cache_lock:
+            case = self._parse_cache.get(key)
+            if case is not None:
+                self._parse_cache.move_to_end(key)
+                return copy.deepcopy(case)
+
+        case = parse(content)
+        if case is None:
+            return None
+
+        with self._parse_cache_lock:
+            self._parse_cache[key] = case
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return copy.deepcopy(case)
+
+    def _get_cached_case(self, key: str) -> Optional[CaseData]:
+        """
+        Look up a case previously stored with _cache_case.
+
+        Args:
+            key: Lookup key, typically the normalized case URL or a citation
+
+        Returns:
+            A copy of the cached CaseData, or None if absent or expired
+        """
+        if self._case_cache_ttl is None:
+            return None
+
+        cache_key = (type(self).__name__, key)
+        with self._case_cache_lock:
+            entry = self._case_cache.get(cache_key)
+            if entry is None:
+                return None
+            case, stored_at = entry
+            if time.time() - stored_at > self._case_cache_ttl:
+                del self._case_cache[cache_key]
+                return None
+            self._case_cache.move_to_end(cache_key)
+        return copy.deepcopy(case)
+
+    def _cache_case(self, key: str, case: Optional[CaseData]) -> Optional[CaseData]:
+        """
+        Store a case for later _get_cached_case lookups.
+
+        Args:
+            key: Lookup key, typically the normalized case URL or a citation
+            case: Case to store; None is passed through without caching
+
+        Returns:
+            The case that was passed in
+        """
+        if case is None or self._case_cache_ttl is None:
+            return case
+
+        with self._case_cache_lock:
+            self._case_cache[(type(self).__name__, key)] = (
+                copy.deepcopy(case),
+                time.time(),
+            )
+            if len(self._case_cache) > self.CASE_CACHE_SIZE:
+                self._case_cache.popitem(last=False)
+        return case
+
+    def _wait_with_backoff(self, attempt: int):
+        """Sleep for an exponentially increasing delay before a retry."""
+        time.sleep(self.retry_delay * (2**attempt))
+
+    def _map_concurrent(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        max_workers: int = None,
+    ) -> List[R]:
+        """
+        Apply a function to items on a thread pool, preserving order.
+
+        Intended for I/O-bound work such as fetching detail pages: calls share
+        the pooled HTTP session and are spaced by the rate limiter, so their
+        network round-trips overlap instead of running back to back.
+
+        Args:
+            func: Function to apply to each item
+            items: Items to process
+            max_workers: Thread count (defaults to MAX_WORKERS)
+
+        Returns:
+            List of results in the same order as items
+        """
+        return list(self._imap_concurrent(func, items, max_workers))
+
+    def _imap_concurrent(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        max_workers: int = None,
+    ) -> Iterator[R]:
+        """
+        Lazily yield the results of _map_concurrent as they become ready.
+
+        Closing the iterator early cancels work that has not started yet.
+
+        Args:
+            func: Function to apply to each item
+            items: Items to process
+            max_workers: Thread count (defaults to MAX_WORKERS)
+
+        Yields:
+            Results in the same order as items
+        """
+        items = list(items)
+        if len(items) <= 1:
+            yield from map(func, items)
+            return
+
+        workers = min(max_workers or self.MAX_WORKERS, len(items))
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            yield from executor.map(func, items)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
     def _make_request(
         self,
         url: str,
@@ -125,7 +426,11 @@ class BaseScraper(ABC):
             NetworkError: For network-related issues
             RateLimitError: When rate limited
             AuthenticationError: For auth issues
+            ScrapingError: When robots.txt disallows the URL
         """
+        if self.respect_robots and not self._robots_allows(url):
+            raise ScrapingError("Disallowed by robots.txt", url=url)
+
         self._respect_rate_limit()
 
         # Merge headers
@@ -148,8 +453,6 @@ class BaseScraper(ABC):
                     timeout=self.timeout,
                 )
 
-                self._last_request_time = time.time()
-
                 # Handle HTTP status codes
                 if response.status_code == 200:
                     return response
@@ -170,7 +473,7 @@ class BaseScraper(ABC):
                             f"Server error {response.status_code}, retrying in "
                             f"{self.retry_delay}s"
                         )
-                        time.sleep(self.retry_delay * (2**attempt))
+                        self._wait_with_backoff(attempt)
                         continue
                     else:
                         raise NetworkError(
@@ -190,7 +493,7 @@ class BaseScraper(ABC):
                     self.logger.warning(
                         f"Request timeout, retrying in {self.retry_delay}s"
                     )
-                    time.sleep(self.retry_delay * (2**attempt))
+                    self._wait_with_backoff(attempt)
                     continue
                 else:
                     raise NetworkError(
@@ -202,7 +505,7 @@ class BaseScraper(ABC):
                     self.logger.warning(
                         f"Connection error, retrying in {self.retry_delay}s"
                     )
-                    time.sleep(self.retry_delay * (2**attempt))
+                    self._wait_with_backoff(attempt)
                     continue
                 else:
                     raise NetworkError(f"Connection failed: {str(e)}", url=url)
@@ -213,12 +516,44 @@ class BaseScraper(ABC):
         # Should not reach here
         raise NetworkError(f"Failed after {self.max_retries} retries", url=url)
 
-    def _parse_html(self, content: str) -> BeautifulSoup:
+    @staticmethod
+    def _response_encoding(response: requests.Response) -> Optional[str]:
+        """
+        Determine the character encoding a response declares for itself.
+
+        Only a charset in the Content-Type header or in the document's own
+        meta/XML declaration counts; requests' ISO-8859-1 default for text
+        responses without a charset is ignored.
+
+        Args:
+            response: Response whose raw content will be parsed
+
+        Returns:
+            Declared encoding, or None to let the parser detect it
         """
-        Parse HTML content using BeautifulSoup.
+        content_type = response.headers.get("Content-Type", "")
+        if "charset=" in content_type.lower() and response.encoding:
+            return response.encoding
+        return EncodingDetector.find_declared_encoding(response.content, is_html=True)
+
+    def _parse_html(
+        self,
+        content: Union[str, bytes],
+        parse_only: SoupStrainer = None,
+        from_encoding: str = None,
+    ) -> BeautifulSoup:
+        """
+        Parse HTML content using BeautifulSoup with the PARSER tree builder.
+
+        Passing the raw response bytes lets the tree builder decode them
+        directly instead of requests decoding them to text first.
 
         Args:
-            content: HTML content to parse
+            content: HTML content to parse, as text or raw bytes
+            parse_only: Optional SoupStrainer; only matching elements (and
+                their contents) are built into the tree
+            from_encoding: Encoding of byte content, e.g. from
+                _response_encoding; detected when omitted
 
         Returns:
             BeautifulSoup object
@@ -226,14 +561,96 @@ class BaseScraper(ABC):
         Raises:
             ParsingError: If parsing fails
         """
+        options = {"parse_only": parse_only}
+        if from_encoding and isinstance(content, bytes):
+            options["from_encoding"] = from_encoding
         try:
-            return BeautifulSoup(content, "lxml")
+            return BeautifulSoup(content, self.PARSER, **options)
         except Exception as e:
             try:
-                return BeautifulSoup(content, "html.parser")
+                return BeautifulSoup(content, "html.parser", **options)
             except Exception as e2:
                 raise ParsingError(f"Failed to parse HTML: {str(e2)}") from e2
 
+    def _parse_tree(
+        self, content: Union[str, bytes], encoding: str = None
+    ) -> lxml.html.HtmlElement:
+        """
+        Parse HTML content into an lxml element tree.
+
+        Cheaper than BeautifulSoup for hot paths that only need XPath
+        queries over the document. Raw response bytes are preferred, since
+        lxml refuses text that still carries an XML encoding declaration.
+
+        Args:
+            content: HTML content to parse, as text or raw bytes
+            encoding: Encoding of byte content, e.g. from _response_encoding;
+                UTF-8 is assumed when omitted
+
+        Returns:
+            Root lxml HtmlElement
+
+        Raises:
+            ParsingError: If parsing fails
+        """
+        try:
+            if isinstance(content, bytes):
+                try:
+                    parser = lxml.html.HTMLParser(encoding=encoding or "utf-8")
+                except LookupError:
+                    # libxml2 does not know every codec alias Python does
+                    content = content.decode(encoding, "replace")
+                else:
+                    return lxml.html.fromstring(content, parser=parser)
+            if content.lstrip().startswith("<?xml"):
+                # Already decoded, so the declaration is redundant
+                content = content.lstrip().partition("?>")[2]
+            return lxml.html.fromstring(content)
+        except Exception as e:
+            raise ParsingError(f"Failed to parse HTML: {str(e)}") from e
+
+    def _parse_json(self, response: requests.Response) -> Any:
+        """
+        Decode a JSON response body.
+
+        Uses orjson when installed, reading the raw bytes directly rather
+        than decoding them to text first.
+
+        Args:
+            response: Response with a JSON body
+
+        Returns:
+            Decoded JSON value
+
+        Raises:
+            ParsingError: If the body is not valid JSON
+        """
+        try:
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return json.loads(response.content)
+        except ValueError as e:
+            raise ParsingError(
+                f"Failed to parse JSON response: {str(e)}", url=response.url
+            ) from e
+
+    def _content_text(self, root: lxml.html.HtmlElement) -> str:
+        """
+        Collect the text under an element, ignoring non-content markup.
+
+        Elements in NON_CONTENT_TAGS are stripped from the tree in place (in
+        C, keeping their tail text) before the text is read, so the caller's
+        tree no longer contains them afterwards.
+
+        Args:
+            root: Element to extract text from
+
+        Returns:
+            Concatenated text content
+        """
+        etree.strip_elements(root, *self.NON_CONTENT_TAGS, with_tail=False)
+        return root.text_content()
+
     @abstractmethod
     def search_cases(
         self,
@@ -273,6 +690,60 @@ class BaseScraper(ABC):
         """
         pass
 
+    def iter_search_cases(
+        self,
+        query: str = None,
+        start_date: Union[str, datetime] = None,
+        end_date: Union[str, datetime] = None,
+        court: str = None,
+        limit: int = 100,
+        **kwargs,
+    ) -> Iterator[CaseData]:
+        """
+        Search for cases, yielding each one as soon as it is available.
+
+        The default implementation wraps search_cases. Scrapers that fetch
+        results page by page override it so callers can start consuming
+        results before the whole search has finished.
+
+        Args:
+            query: Search query string
+            start_date: Start date for search
+            end_date: End date for search
+            court: Specific court to search
+            limit: Maximum number of results
+            **kwargs: Additional search parameters
+
+        Yields:
+            CaseData objects
+        """
+        yield from self.search_cases(
+            query=query,
+            start_date=start_date,
+            end_date=end_date,
+            court=court,
+            limit=limit,
+            **kwargs,
+        )
+
+    def bulk_get_cases(
+        self, case_ids: Iterable[str], max_workers: int = None
+    ) -> List[Optional[CaseData]]:
+        """
+        Retrieve several cases by ID, fetching them concurrently.
+
+        Requests share the pooled HTTP session and the scraper's rate limit.
+
+        Args:
+            case_ids: Case identifiers accepted by get_case_by_id
+            max_workers: Thread count (defaults to MAX_WORKERS)
+
+        Returns:
+            List of CaseData objects (None where a case was not found) in the
+            same order as case_ids
+        """
+        return self._map_concurrent(self.get_case_by_id, case_ids, max_workers)
+
     def get_recent_cases(
         self, days: int = 30, limit: int = 100, court: str = None
     ) -> List[CaseData]:
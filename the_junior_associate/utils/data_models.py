@@ -2,12 +2,16 @@
 Data models for The Junior Associate library.
 """
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Optional, Dict, List, Any
 
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class CaseData:
     """
     Standardized data structure for legal case information.
@@ -32,11 +36,12 @@ class CaseData:
     def to_dict(self) -> Dict[str, Any]:
         """Convert the case data to a dictionary."""
         result = {}
-        for key, value in self.__dict__.items():
+        for f in fields(self):
+            value = getattr(self, f.name)
             if isinstance(value, datetime):
-                result[key] = value.isoformat()
+                result[f.name] = value.isoformat()
             elif value is not None:
-                result[key] = value
+                result[f.name] = value
         return result
 
     def __str__(self) -> str:
@@ -2,12 +2,18 @@
 Helper functions for The Junior Associate library.
 """
 
+import functools
 import re
 import logging
 from datetime import datetime
-from typing import Optional, Union
+from typing import Iterable, List, Optional, Pattern, Union
 from dateutil import parser as date_parser
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 
 def validate_date(date_input: Union[str, datetime, None]) -> Optional[datetime]:
     """
@@ -29,6 +35,11 @@ def validate_date(date_input: Union[str, datetime, None]) -> Optional[datetime]:
         return date_input
 
     if isinstance(date_input, str):
+        # ISO dates take the C fast path; anything else goes to dateutil
+        try:
+            return datetime.fromisoformat(date_input)
+        except ValueError:
+            pass
         try:
             return date_parser.parse(date_input)
         except (ValueError, TypeError) as e:
@@ -37,6 +48,40 @@ def validate_date(date_input: Union[str, datetime, None]) -> Optional[datetime]:
     raise ValueError(f"Unsupported date type: {type(date_input)}")
 
 
+# HTML entities that might have been missed by the parser, in replacement order
+_HTML_ENTITIES = (
+    ("&nbsp;", " "),
+    ("&amp;", "&"),
+    ("&lt;", "<"),
+    ("&gt;", ">"),
+    ("&quot;", '"'),
+    ("&#39;", "'"),
+    ("&apos;", "'"),
+)
+# Typographic quotes normalized to their ASCII forms
+_QUOTES = str.maketrans(
+    {
+        "\u201c": '"',
+        "\u201d": '"',
+        "\u201e": '"',
+        "\u2018": "'",
+        "\u2019": "'",
+        "\u201a": "'",
+    }
+)
+# Any run of whitespace, including line breaks, form feeds and no-break spaces
+_WHITESPACE_RE = re.compile(r"\s+")
+# Joins the inputs of sanitize_texts; never produced by sanitization
+_BATCH_SEPARATOR = "\x00"
+
+
+def _clean(text: str) -> str:
+    """Apply the sanitize_text substitutions, without the final strip."""
+    for entity, replacement in _HTML_ENTITIES:
+        text = text.replace(entity, replacement)
+    return _WHITESPACE_RE.sub(" ", text.translate(_QUOTES))
+
+
 def sanitize_text(text: str) -> str:
     """
     Clean and sanitize text content from scraped data.
@@ -50,36 +95,28 @@ def sanitize_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove extra whitespace and normalize line breaks
-    text = re.sub(r"\s+", " ", text.strip())
-
-    # Remove HTML entities that might have been missed
-    html_entities = {
-        "&nbsp;": " ",
-        "&amp;": "&",
-        "&lt;": "<",
-        "&gt;": ">",
-        "&quot;": '"',
-        "&#39;": "'",
-        "&apos;": "'",
-    }
+    return _clean(text).strip()
 
-    for entity, replacement in html_entities.items():
-        text = text.replace(entity, replacement)
 
-    # Remove common PDF artifacts
-    text = re.sub(r"\f", " ", text)  # Form feed
-    text = re.sub(r"\x0c", " ", text)  # Form feed
-    text = re.sub(r"\u00a0", " ", text)  # Non-breaking space
+def sanitize_texts(texts: Iterable[Optional[str]]) -> List[str]:
+    """
+    Sanitize several strings at once.
 
-    # Normalize quotes
-    text = re.sub(r'["""]', '"', text)
-    text = re.sub(r"[''']", "'", text)
+    The strings are cleaned as one joined buffer, so each substitution runs
+    once per batch instead of once per string. Apart from dropping NUL
+    characters, the result matches calling sanitize_text on each item.
 
-    # Clean up multiple spaces again after replacements
-    text = re.sub(r"\s+", " ", text).strip()
+    Args:
+        texts: Raw texts to sanitize; None is treated as empty
 
-    return text
+    Returns:
+        Cleaned texts, in input order
+    """
+    texts = [(text or "").replace(_BATCH_SEPARATOR, "") for text in texts]
+    if not texts:
+        return []
+    joined = _clean(_BATCH_SEPARATOR.join(texts))
+    return [part.strip() for part in joined.split(_BATCH_SEPARATOR)]
 
 
 def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
@@ -108,13 +145,15 @@ def setup_logger(name: str, level: int = logging.INFO) -> logging.Logger:
     return logger
 
 
-def extract_case_id_from_url(url: str, pattern: str) -> Optional[str]:
+def extract_case_id_from_url(
+    url: str, pattern: Union[str, Pattern[str]]
+) -> Optional[str]:
     """
     Extract case ID from URL using regex pattern.
 
     Args:
         url: URL to extract from
-        pattern: Regex pattern to match case ID
+        pattern: Regex pattern (string or precompiled) to match case ID
 
     Returns:
         Extracted case ID or None
@@ -122,14 +161,58 @@ def extract_case_id_from_url(url: str, pattern: str) -> Optional[str]:
     if not url or not pattern:
         return None
 
-    match = re.search(pattern, url)
+    if isinstance(pattern, str):
+        match = re.search(pattern, url)
+    else:
+        match = pattern.search(url)
     return match.group(1) if match else None
 
 
+def compile_pattern(pattern: str) -> Pattern[str]:
+    """
+    Compile a regex, preferring the linear-time RE2 engine when installed.
+
+    RE2 never backtracks, so scans over large judgment pages stay linear
+    even on adversarial input. Patterns RE2 cannot handle fall back to the
+    standard library. RE2's whitespace, digit and word classes only match
+    ASCII, so scan text that sanitize_text has already normalized.
+
+    Args:
+        pattern: Regex pattern string
+
+    Returns:
+        Compiled pattern exposing the ``re.Pattern`` interface
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Common court abbreviations and their expansions, applied in order
+_COURT_NORMALIZATIONS = tuple(
+    (re.compile(pattern, re.IGNORECASE), replacement)
+    for pattern, replacement in (
+        (r"\bS\.?C\.?\b", "Supreme Court"),
+        (r"\bC\.?A\.?\b", "Court of Appeal"),
+        (r"\bH\.?C\.?\b", "High Court"),
+        (r"\bD\.?C\.?\b", "District Court"),
+        (r"\bF\.?C\.?\b", "Federal Court"),
+        (r"\bCt\.?\b", "Court"),
+        (r"\bJ\.?\b", "Justice"),
+    )
+)
+
+
+@functools.lru_cache(maxsize=256)
 def normalize_court_name(court_name: str) -> str:
     """
     Normalize court name for consistency.
 
+    Court names repeat heavily across a scrape, so results are memoized.
+
     Args:
         court_name: Raw court name
 
@@ -139,20 +222,9 @@ def normalize_court_name(court_name: str) -> str:
     if not court_name:
         return ""
 
-    # Common abbreviations and normalizations
-    normalizations = {
-        r"\bS\.?C\.?\b": "Supreme Court",
-        r"\bC\.?A\.?\b": "Court of Appeal",
-        r"\bH\.?C\.?\b": "High Court",
-        r"\bD\.?C\.?\b": "District Court",
-        r"\bF\.?C\.?\b": "Federal Court",
-        r"\bCt\.?\b": "Court",
-        r"\bJ\.?\b": "Justice",
-    }
-
     result = court_name.strip()
-    for pattern, replacement in normalizations.items():
-        result = re.sub(pattern, replacement, result, flags=re.IGNORECASE)
+    for pattern, replacement in _COURT_NORMALIZATIONS:
+        result = pattern.sub(replacement, result)
 
     return result.strip()
 